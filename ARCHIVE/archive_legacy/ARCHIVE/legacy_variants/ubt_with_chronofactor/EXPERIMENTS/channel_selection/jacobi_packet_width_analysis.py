@@ -18,10 +18,17 @@ License: See repository LICENSE.md
 
 import argparse
 import csv
+import sys
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+try:
+    from forensic_fingerprint.tools.jacobi_theta import theta3
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from forensic_fingerprint.tools.jacobi_theta import theta3
+
 try:
     import matplotlib
     matplotlib.use('Agg')
@@ -39,19 +46,15 @@ def jacobi_theta_3(z: complex, q: complex, terms: int = 50) -> complex:
     θ₃(z, q) = 1 + 2∑(n=1 to ∞) qⁿ² cos(2nz)
     
     Args:
-        z: Argument
+        z: Argument (scalar or array)
         q: Nome parameter (|q| < 1)
         terms: Number of terms in series
         
     Returns:
-        Theta function value
+        Theta function value(s)
     """
-    result = 1.0 + 0.0j
-    
-    for n in range(1, terms + 1):
-        result += 2 * (q ** (n * n)) * np.cos(2 * n * z)
-    
-    return result
+    # Shared library uses the period-1 convention cos(2πnz)
+    return theta3(np.asarray(z) / np.pi, q, n_terms=terms) + 0.0j
 
 
 def simulate_theta_dispersion(n_center: int, n_width: int = 20,
@@ -75,12 +78,7 @@ def simulate_theta_dispersion(n_center: int, n_width: int = 20,
     # Compute theta function amplitude for each mode
     # Using simplified model: amplitude ~ θ₃(πn/n_center, e^(-πτ))
     q = np.exp(-np.pi * tau)
-    amplitudes = np.zeros(len(modes))
-    
-    for i, n in enumerate(modes):
-        z = np.pi * n / n_center
-        theta_val = jacobi_theta_3(z, q, terms=30)
-        amplitudes[i] = abs(theta_val)
+    amplitudes = np.abs(jacobi_theta_3(np.pi * modes / n_center, q, terms=30))
     
     return modes, amplitudes
 
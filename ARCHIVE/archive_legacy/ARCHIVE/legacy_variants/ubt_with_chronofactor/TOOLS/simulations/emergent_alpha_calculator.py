@@ -17,9 +17,27 @@ License: CC BY 4.0
 """
 
 from typing import List, Tuple
+from pathlib import Path
+import importlib.util
 import sys
 import math
 
+# Try to load the shared switching-threshold table (repo-root tools/prime_switching.py).
+# Loaded by file path so the archived tools/ package is not shadowed.
+try:
+    _switching_path = next(
+        d / "tools" / "prime_switching.py"
+        for d in Path(__file__).resolve().parents
+        if (d / "pytest.ini").exists()
+    )
+    _spec = importlib.util.spec_from_file_location("ubt_prime_switching", _switching_path)
+    _switching = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_switching)
+    _switching_optimal_prime = _switching.optimal_prime
+    SWITCHING_TABLE_AVAILABLE = True
+except (StopIteration, ImportError, OSError):
+    SWITCHING_TABLE_AVAILABLE = False
+
 # Try to import numpy for advanced features
 try:
     import numpy as np
@@ -114,6 +132,12 @@ def find_optimal_winding_number(
     Tuple[int, float]
         Optimal prime and its potential value
     """
+    if SWITCHING_TABLE_AVAILABLE and max_n <= 1_000_000:
+        # Binary search in the precomputed B/A switching thresholds;
+        # raises ValueError when the range contains no prime.
+        optimal_prime = _switching_optimal_prime(A, B, min_n, max_n)
+        return optimal_prime, V_eff(optimal_prime, A, B)
+    
     primes = prime_sieve(max_n)
     primes_in_range = [p for p in primes if min_n <= p <= max_n]
     
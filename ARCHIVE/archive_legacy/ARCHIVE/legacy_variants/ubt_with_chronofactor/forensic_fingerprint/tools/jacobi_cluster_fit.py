@@ -33,6 +33,13 @@ Usage:
         --output results/jacobi_fit_report.txt \\
         --plot results/jacobi_fit.png \\
         --k-min 134 --k-max 143
+
+    # Batch: every (dump, channel, window) into one results table
+    python -m forensic_fingerprint.tools.jacobi_cluster_fit \\
+        --input scans/radial_*.csv \\
+        --channels TT,EE \\
+        --windows 134:143,130:150 \\
+        --results-csv results/jacobi_batch.csv
 """
 
 from __future__ import annotations
@@ -42,10 +49,12 @@ import csv
 import os
 import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+from .jacobi_theta import theta3
+
 
 def _ensure_dir_for(path: Optional[str]) -> None:
     """Create directory for file path if needed."""
@@ -56,31 +65,29 @@ def _ensure_dir_for(path: Optional[str]) -> None:
         os.makedirs(d, exist_ok=True)
 
 
-def jacobi_theta3(z: np.ndarray, q: float, n_terms: int = 100) -> np.ndarray:
+def jacobi_theta3(z: np.ndarray, q: float, n_terms: Optional[int] = 100) -> np.ndarray:
     """
     Compute Jacobi theta function θ₃(z, q).
     
     θ₃(z, q) = Σ_{n=-n_terms}^{n_terms} q^{n²} exp(2πinz)
     
+    Evaluated by the shared jacobi_theta library (vectorised over z and q).
+    
     Args:
         z: Complex or real input values
-        q: Nome parameter (|q| < 1 for convergence)
-        n_terms: Number of terms in the sum (default: 100)
+        q: Nome parameter (|q| < 1 for convergence); scalar or array
+            broadcasting with z
+        n_terms: Number of terms in the sum (default: 100); None selects the
+            truncation adaptively and uses the modular transformation near q → 1
     
     Returns:
-        Complex or real values of θ₃(z, q)
+        Complex values of θ₃(z, q)
     """
-    z = np.asarray(z, dtype=complex)
-    result = np.zeros_like(z, dtype=complex)
-    
-    for n in range(-n_terms, n_terms + 1):
-        result += (q ** (n * n)) * np.exp(2j * np.pi * n * z)
-    
-    return result
+    return np.asarray(theta3(z, q, n_terms=n_terms), dtype=complex)
 
 
 def jacobi_theta3_power_spectrum(k: np.ndarray, k0: float, D: float, tau: float, 
-                                   n_terms: int = 100) -> np.ndarray:
+                                   n_terms: Optional[int] = 100) -> np.ndarray:
     """
     Power spectrum model based on Jacobi theta function.
     
@@ -102,6 +109,59 @@ def jacobi_theta3_power_spectrum(k: np.ndarray, k0: float, D: float, tau: float,
     return np.abs(theta) ** 2
 
 
+# Grid-search axes shared by single and batch fits
+K0_GRID = np.linspace(135, 140, 11)
+D_GRID = np.logspace(-3, -1, 11)  # 0.001 to 0.1
+TAU_GRID = np.linspace(0.1, 2.0, 11)
+
+
+def theta_grid_table(k: np.ndarray, n_terms: Optional[int] = 50) -> np.ndarray:
+    """
+    Precompute |θ₃(k/k₀, exp(-D·τ))|² over the (k₀, D, τ) search grid.
+    
+    The table depends only on the k-window, so every spectrum fitted on the
+    same window shares it.
+    
+    Args:
+        k: Wavenumbers of the fit window
+        n_terms: Number of terms in theta function (None: adaptive)
+    
+    Returns:
+        Array of shape (len(K0_GRID), len(D_GRID), len(TAU_GRID), len(k))
+    """
+    z = np.asarray(k) / K0_GRID[:, None, None, None]
+    q = np.exp(-D_GRID[None, :, None, None] * TAU_GRID[None, None, :, None])
+    return np.abs(jacobi_theta3(z, q, n_terms)) ** 2
+
+
+def _grid_search(psd_norm: np.ndarray, weights: np.ndarray,
+                 models: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Best grid model and its least-squares amplitude for each spectrum.
+    
+    Args:
+        psd_norm: Normalised spectra, shape (n_spectra, n_k)
+        weights: 1 for valid points, 0 for missing ones, shape (n_spectra, n_k)
+        models: Grid models flattened to shape (n_grid, n_k)
+    
+    Returns:
+        (flat grid index or -1 if no finite χ², amplitude) per spectrum
+    """
+    psd_norm = psd_norm[:, None, :]
+    weights = weights[:, None, :]
+    norm2 = np.sum(weights * models * models, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        amps = np.where(norm2 > 0, np.sum(weights * psd_norm * models, axis=-1) / norm2, 1.0)
+    chi2_grid = np.sum(weights * (psd_norm - amps[..., None] * models) ** 2, axis=-1)
+    chi2_grid = np.where(np.isnan(chi2_grid), np.inf, chi2_grid)
+    
+    # First minimum in (k0, D, τ) order, as in a nested loop
+    best = np.argmin(chi2_grid, axis=-1)
+    rows = np.arange(len(best))
+    best = np.where(np.isfinite(chi2_grid[rows, best]), best, -1)
+    return best, amps[rows, best]
+
+
 @dataclass
 class JacobiFitResult:
     """Results from Jacobi theta function fit."""
@@ -123,7 +183,7 @@ def fit_jacobi_cluster(k_data: np.ndarray, psd_data: np.ndarray,
                        initial_k0: float = 137.0,
                        initial_D: float = 0.01,
                        initial_tau: float = 1.0,
-                       n_terms: int = 50) -> JacobiFitResult:
+                       n_terms: Optional[int] = 50) -> JacobiFitResult:
     """
     Fit Jacobi theta function to k-cluster data.
     
@@ -137,7 +197,7 @@ def fit_jacobi_cluster(k_data: np.ndarray, psd_data: np.ndarray,
         initial_k0: Initial guess for k0
         initial_D: Initial guess for D
         initial_tau: Initial guess for τ
-        n_terms: Number of terms in theta function
+        n_terms: Number of terms in theta function (None: adaptive)
     
     Returns:
         JacobiFitResult with fitted parameters
@@ -155,32 +215,18 @@ def fit_jacobi_cluster(k_data: np.ndarray, psd_data: np.ndarray,
     psd_norm = psd_cluster / psd_max
     
     # Simple grid search for initial parameters
-    best_chi2 = float('inf')
     best_params = (initial_k0, initial_D, initial_tau, 1.0)
     
-    # Grid search ranges
-    k0_range = np.linspace(135, 140, 11)
-    D_range = np.logspace(-3, -1, 11)  # 0.001 to 0.1
-    tau_range = np.linspace(0.1, 2.0, 11)
-    
-    print(f"[jacobi_cluster_fit] Grid search over {len(k0_range)}×{len(D_range)}×{len(tau_range)} parameter combinations...")
-    
-    for k0 in k0_range:
-        for D in D_range:
-            for tau in tau_range:
-                model = jacobi_theta3_power_spectrum(k_cluster, k0, D, tau, n_terms)
-                
-                # Fit amplitude
-                amp = np.sum(psd_norm * model) / np.sum(model * model) if np.sum(model * model) > 0 else 1.0
-                model_scaled = amp * model
-                
-                # Compute chi-squared
-                residuals = psd_norm - model_scaled
-                chi2 = np.sum(residuals ** 2)
-                
-                if chi2 < best_chi2:
-                    best_chi2 = chi2
-                    best_params = (k0, D, tau, amp * psd_max)
+    print(f"[jacobi_cluster_fit] Grid search over {len(K0_GRID)}×{len(D_GRID)}×{len(TAU_GRID)} parameter combinations...")
+    
+    # All (k0, D, τ) models in one theta evaluation
+    models = theta_grid_table(k_cluster, n_terms)
+    best, amps = _grid_search(psd_norm[None, :], np.ones((1, len(k_cluster))),
+                              models.reshape(-1, len(k_cluster)))
+    
+    if best[0] >= 0:
+        i, j, l = np.unravel_index(best[0], models.shape[:-1])
+        best_params = (K0_GRID[i], D_GRID[j], TAU_GRID[l], amps[0] * psd_max)
     
     k0_fit, D_fit, tau_fit, amp_fit = best_params
     
@@ -240,6 +286,194 @@ def load_radial_csv(path: str, channel: str = "TT") -> Tuple[np.ndarray, np.ndar
     return np.array(k_list), np.array(psd_list)
 
 
+@dataclass
+class RadialDumps:
+    """Radial spectra of many dump CSVs on a common k grid."""
+    paths: List[str]
+    channels: List[str]
+    k: np.ndarray          # (n_k,) = 0..k_max
+    psd: np.ndarray        # (n_files, n_channels, n_k), NaN where missing
+    present: np.ndarray    # (n_files, n_channels) channel occurs in file
+
+
+def load_radial_dumps(paths: Sequence[str],
+                      channels: Optional[Sequence[str]] = None) -> RadialDumps:
+    """
+    Load many cmb_fft2d_scan.py dump CSVs into one array.
+    
+    Args:
+        paths: CSV files
+        channels: Channels to keep (default: all, in order of appearance)
+    
+    Returns:
+        RadialDumps with obs_psd indexed by (file, channel, k)
+    """
+    per_file: List[Dict[str, Dict[int, float]]] = []
+    seen: List[str] = []
+    for path in paths:
+        spectra: Dict[str, Dict[int, float]] = {}
+        with open(path, 'r') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                ch = row['channel']
+                if channels is not None and ch not in channels:
+                    continue
+                if ch not in seen:
+                    seen.append(ch)
+                spectra.setdefault(ch, {})[int(row['k'])] = float(row['obs_psd'])
+        per_file.append(spectra)
+    
+    channel_list = list(channels) if channels is not None else seen
+    k_max = max((max(spec) for spectra in per_file for spec in spectra.values()), default=-1)
+    if k_max < 0:
+        raise ValueError(f"No radial data found in {len(paths)} file(s)")
+    
+    k = np.arange(k_max + 1)
+    psd = np.full((len(paths), len(channel_list), len(k)), np.nan)
+    present = np.zeros((len(paths), len(channel_list)), dtype=bool)
+    for i, spectra in enumerate(per_file):
+        for j, ch in enumerate(channel_list):
+            spec = spectra.get(ch)
+            if spec:
+                present[i, j] = True
+                psd[i, j, list(spec.keys())] = list(spec.values())
+    
+    return RadialDumps(paths=list(paths), channels=channel_list, k=k, psd=psd, present=present)
+
+
+BATCH_FIELDS = [
+    "file", "channel", "k_min", "k_max", "n_points",
+    "k0_fit", "D_fit", "tau_fit", "amplitude_fit", "q",
+    "chi2", "chi2_reduced", "n_terms",
+]
+
+
+def _batch_task(args) -> Tuple[np.ndarray, np.ndarray]:
+    """Grid search for a block of spectra sharing one window's theta table."""
+    psd_norm, weights, models = args
+    return _grid_search(psd_norm, weights, models)
+
+
+def fit_jacobi_batch(dumps: RadialDumps,
+                     windows: Sequence[Tuple[int, int]] = ((134, 143),),
+                     n_terms: Optional[int] = 50,
+                     chunk_size: int = 64,
+                     workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Fit every (file, channel, window) combination of a dump set.
+    
+    Each window's grid table (theta_grid_table) is evaluated once and shared
+    by all spectra; the per-spectrum grid search is the one fit_jacobi_cluster
+    uses, so each row equals a single fit on that file, channel and window.
+    
+    Args:
+        dumps: Spectra from load_radial_dumps
+        windows: (k_min, k_max) fit ranges
+        n_terms: Number of terms in theta function (None: adaptive)
+        chunk_size: Spectra per grid-search task
+        workers: Worker processes (None or 1: in-process)
+    
+    Returns:
+        One dict per (file, channel, window) with the BATCH_FIELDS keys;
+        windows without data have n_points = 0 and NaN fit values
+    """
+    files, chans = np.nonzero(dumps.present)
+    spectra = dumps.psd[files, chans]
+    
+    windows = [(int(k_min), int(k_max)) for k_min, k_max in windows]
+    tables = []
+    tasks = []
+    for k_min, k_max in windows:
+        in_window = (dumps.k >= k_min) & (dumps.k <= k_max)
+        k_win = dumps.k[in_window]
+        psd_win = spectra[:, in_window]
+        weights = np.isfinite(psd_win).astype(float)
+        
+        # Normalize PSD to avoid numerical issues
+        with np.errstate(invalid='ignore'):
+            psd_max = np.max(np.where(weights > 0, psd_win, -np.inf), axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            psd_norm = np.where(weights > 0, psd_win / psd_max[:, None], 0.0)
+        
+        models = theta_grid_table(k_win, n_terms)
+        flat = models.reshape(-1, len(k_win))
+        tables.append((k_win, psd_win, weights, psd_max, models.shape[:-1], flat))
+        for start in range(0, len(spectra), chunk_size):
+            block = slice(start, start + chunk_size)
+            tasks.append((psd_norm[block], weights[block], flat))
+    
+    if workers is None or workers <= 1:
+        outputs = [_batch_task(task) for task in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(_batch_task, tasks))
+    
+    n_chunks = len(range(0, len(spectra), chunk_size))
+    results = []
+    for w in range(len(windows)):
+        chunk_out = outputs[w * n_chunks:(w + 1) * n_chunks]
+        best = np.concatenate([b for b, _ in chunk_out]) if chunk_out else np.empty(0, int)
+        amps = np.concatenate([a for _, a in chunk_out]) if chunk_out else np.empty(0)
+        results.append((best, amps))
+    
+    rows: List[Dict[str, Any]] = []
+    for t in range(len(spectra)):
+        for (k_min, k_max), table, (best, amps) in zip(windows, tables, results):
+            k_win, psd_win, weights, psd_max, grid_shape, flat = table
+            n_points = int(weights[t].sum())
+            row: Dict[str, Any] = {
+                "file": dumps.paths[files[t]],
+                "channel": dumps.channels[chans[t]],
+                "k_min": k_min,
+                "k_max": k_max,
+                "n_points": n_points,
+                "n_terms": n_terms,
+            }
+            if n_points == 0:
+                row.update({name: float('nan') for name in BATCH_FIELDS if name not in row})
+                rows.append(row)
+                continue
+            
+            if best[t] >= 0:
+                i, j, l = np.unravel_index(best[t], grid_shape)
+                k0_fit, D_fit, tau_fit = K0_GRID[i], D_GRID[j], TAU_GRID[l]
+                amp_fit = amps[t] * psd_max[t]
+                model = flat[best[t]]
+            else:
+                # Same fallback as fit_jacobi_cluster's initial guess
+                k0_fit, D_fit, tau_fit, amp_fit = 137.0, 0.01, 1.0, 1.0
+                model = jacobi_theta3_power_spectrum(k_win, k0_fit, D_fit, tau_fit, n_terms)
+            
+            valid = weights[t] > 0
+            residuals = psd_win[t, valid] - amp_fit * model[valid]
+            chi2 = float(np.sum(residuals ** 2))
+            dof = n_points - 4  # 4 parameters: k0, D, tau, amplitude
+            row.update({
+                "k0_fit": float(k0_fit),
+                "D_fit": float(D_fit),
+                "tau_fit": float(tau_fit),
+                "amplitude_fit": float(amp_fit),
+                "q": float(np.exp(-D_fit * tau_fit)),
+                "chi2": chi2,
+                "chi2_reduced": chi2 / dof if dof > 0 else float('inf'),
+            })
+            rows.append(row)
+    
+    return rows
+
+
+def write_batch_results(rows: Sequence[Dict[str, Any]], output_path: str) -> None:
+    """Write fit_jacobi_batch rows as one CSV table."""
+    _ensure_dir_for(output_path)
+    with open(output_path, 'w', newline='') as f:
+        w = csv.DictWriter(f, fieldnames=BATCH_FIELDS)
+        w.writeheader()
+        for row in rows:
+            w.writerow(row)
+
+
 def write_fit_report(result: JacobiFitResult, output_path: str) -> None:
     """Write fit results to text file."""
     _ensure_dir_for(output_path)
@@ -335,13 +569,34 @@ def plot_fit_results(result: JacobiFitResult, output_path: str) -> None:
     print(f"[info] wrote plot: {output_path}")
 
 
+def run_batch(args: argparse.Namespace) -> None:
+    """Batch mode of the CLI: one consolidated table for all inputs."""
+    channels = [c.strip() for c in args.channels.split(',') if c.strip()] or None
+    if args.windows:
+        windows = [tuple(int(x) for x in w.split(':')) for w in args.windows.split(',')]
+    else:
+        windows = [(args.k_min, args.k_max)]
+    
+    print(f"[jacobi_cluster_fit] Loading {len(args.input)} radial dump(s)...")
+    dumps = load_radial_dumps(args.input, channels)
+    n_spectra = int(dumps.present.sum())
+    print(f"[jacobi_cluster_fit] {n_spectra} spectra × {len(windows)} window(s), "
+          f"channels: {','.join(dumps.channels)}")
+    
+    rows = fit_jacobi_batch(dumps, windows, n_terms=args.n_terms or None,
+                            workers=args.workers)
+    write_batch_results(rows, args.results_csv)
+    print(f"[info] wrote batch results ({len(rows)} fits): {args.results_csv}")
+
+
 def main() -> None:
     """Main entry point."""
     ap = argparse.ArgumentParser(description=__doc__, 
                                  formatter_class=argparse.RawDescriptionHelpFormatter)
     
-    ap.add_argument('--input', required=True, 
-                    help='Input CSV from cmb_fft2d_scan.py --dump-radial-csv')
+    ap.add_argument('--input', required=True, nargs='+',
+                    help='Input CSV from cmb_fft2d_scan.py --dump-radial-csv '
+                         '(several files with --results-csv)')
     ap.add_argument('--channel', default='TT',
                     help='Channel to analyze (default: TT)')
     ap.add_argument('--k-min', type=int, default=134,
@@ -349,16 +604,33 @@ def main() -> None:
     ap.add_argument('--k-max', type=int, default=143,
                     help='Maximum k for fit cluster (default: 143)')
     ap.add_argument('--n-terms', type=int, default=50,
-                    help='Number of terms in Jacobi theta expansion (default: 50)')
+                    help='Number of terms in Jacobi theta expansion (default: 50; '
+                         '0 = adaptive truncation with modular transform near q → 1)')
     ap.add_argument('--output', default='',
                     help='Output text file for fit report')
     ap.add_argument('--plot', default='',
                     help='Output PNG file for diagnostic plot')
+    ap.add_argument('--results-csv', default='',
+                    help='Batch mode: fit every input/channel/window and write one results table')
+    ap.add_argument('--channels', default='',
+                    help='Batch mode: comma-separated channels (default: all in the dumps)')
+    ap.add_argument('--windows', default='',
+                    help='Batch mode: comma-separated k_min:k_max windows '
+                         '(default: --k-min:--k-max)')
+    ap.add_argument('--workers', type=int, default=None,
+                    help='Batch mode: worker processes (default: in-process)')
     
     args = ap.parse_args()
     
-    print(f"[jacobi_cluster_fit] Loading data from {args.input}...")
-    k_data, psd_data = load_radial_csv(args.input, args.channel)
+    if args.results_csv:
+        run_batch(args)
+        return
+    if len(args.input) > 1:
+        ap.error("several --input files require --results-csv")
+    input_path = args.input[0]
+    
+    print(f"[jacobi_cluster_fit] Loading data from {input_path}...")
+    k_data, psd_data = load_radial_csv(input_path, args.channel)
     
     print(f"[jacobi_cluster_fit] Loaded {len(k_data)} data points for channel {args.channel}")
     print(f"[jacobi_cluster_fit] k range: [{np.min(k_data)}, {np.max(k_data)}]")
@@ -368,7 +640,7 @@ def main() -> None:
         k_data, psd_data,
         k_min=args.k_min,
         k_max=args.k_max,
-        n_terms=args.n_terms
+        n_terms=args.n_terms or None
     )
     
     print("\n" + "=" * 70)
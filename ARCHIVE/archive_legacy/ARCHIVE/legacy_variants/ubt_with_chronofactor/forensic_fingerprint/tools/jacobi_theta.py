@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Jacobi Theta Library for UBT Fit and Scan Tools
+
+Vectorised evaluation of the Jacobi theta function
+
+    θ₃(z, q) = Σ_{n=-∞}^{∞} q^{n²} exp(2πinz) = 1 + 2 Σ_{n≥1} q^{n²} cos(2πnz)
+
+(period-1 convention, as in jacobi_cluster_fit) and of its analytic
+derivatives ∂θ₃/∂z and ∂θ₃/∂q, shared by jacobi_cluster_fit, theta_fit_tau
+and EXPERIMENTS/channel_selection/jacobi_packet_width_analysis.
+
+Evaluation strategy:
+  - n_terms given: the truncated series Σ_{|n|≤n_terms} exactly. Models whose
+    definition includes the truncation (theta_fit_tau's M) rely on this.
+  - n_terms=None: the truncation is chosen from |q| so that the first omitted
+    term is below `tol`; for real q in (e^{-π}, 1) the modular (Poisson) form
+
+        θ₃(z, e^{-s}) = sqrt(π/s) Σ_m exp(-π²(z-m)²/s)
+
+    is used instead, which needs O(√s) terms where the q-series needs
+    O(1/√s), so evaluation stays cheap and accurate near the cusp q → 1.
+
+z and q broadcast against each other.  Tables of q^{n²} for scalar q are
+cached, so repeated calls with the same nome (grid searches, fixed-q scans)
+skip the power evaluation.
+
+Copyright (c) 2025 Ing. David Jaroš
+Licensed under the MIT License
+"""
+
+import math
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Dual (modular) series is used for s = -ln q below this value, i.e. q > e^{-π};
+# at s = π both series need the same number of terms.
+MODULAR_SWITCH_S = math.pi
+
+DEFAULT_TOL = 1e-16
+
+
+def adaptive_n_terms(q_abs: float, tol: float = DEFAULT_TOL) -> int:
+    """
+    Smallest N with |q|^{(N+1)²} < tol (at least 1).
+
+    Args:
+        q_abs: |q|, must be < 1
+        tol: Size of the first omitted term relative to θ₃ ≈ 1
+
+    Returns:
+        Number of terms N for the truncated series Σ_{|n|≤N}
+    """
+    if q_abs <= 0.0:
+        return 1
+    if q_abs >= 1.0:
+        raise ValueError(f"theta series diverges for |q| = {q_abs} >= 1")
+    return max(1, int(math.ceil(math.sqrt(math.log(tol) / math.log(q_abs)))))
+
+
+@lru_cache(maxsize=512)
+def _nome_powers_scalar(q, n_terms: int) -> np.ndarray:
+    n = np.arange(n_terms + 1)
+    table = np.asarray(q) ** (n * n)
+    table.setflags(write=False)
+    return table
+
+
+def nome_powers(q, n_terms: int) -> np.ndarray:
+    """
+    Table q^{n²} for n = 0..n_terms.
+
+    Args:
+        q: Scalar or array nome
+        n_terms: Largest n
+
+    Returns:
+        Array of shape q.shape + (n_terms + 1,); cached (read-only) for scalar q
+    """
+    q = np.asarray(q)
+    if q.ndim == 0:
+        key = complex(q) if np.iscomplexobj(q) else float(q)
+        return _nome_powers_scalar(key, int(n_terms))
+    n = np.arange(n_terms + 1)
+    return q[..., None] ** (n * n)
+
+
+def _direct_series(z, q, n_terms: int, derivatives: bool):
+    """Truncated q-series and (optionally) its z and q derivatives."""
+    n = np.arange(1, n_terms + 1)
+    q_n2 = nome_powers(q, n_terms)[..., 1:]
+    arg = (2.0 * np.pi) * z[..., None] * n
+    cos_arg = np.cos(arg)
+    theta = 1.0 + 2.0 * np.sum(q_n2 * cos_arg, axis=-1)
+    if not derivatives:
+        return theta, None, None
+    theta_z = -4.0 * np.pi * np.sum(n * q_n2 * np.sin(arg), axis=-1)
+    q_n2m1 = np.asarray(q)[..., None] ** (n * n - 1)
+    theta_q = 2.0 * np.sum(n * n * q_n2m1 * cos_arg, axis=-1)
+    return theta, theta_z, theta_q
+
+
+def _modular_series(z, q, tol: float, derivatives: bool):
+    """Poisson-dual series for real q in (e^{-π}, 1)."""
+    s = -np.log(q)
+    # θ₃ has period 1 in z: reduce so only |m| ≲ M terms matter
+    z = z - np.round(np.real(z))
+    M = int(math.ceil(math.sqrt(float(np.max(s)) * math.log(1.0 / tol)) / math.pi)) + 1
+    m = np.arange(-M, M + 1)
+    s_ = s[..., None]
+    d = z[..., None] - m
+    gauss = np.exp(-(np.pi**2) * d * d / s_)
+    pref = np.sqrt(np.pi / s)
+    theta = pref * np.sum(gauss, axis=-1)
+    if not derivatives:
+        return theta, None, None
+    theta_z = pref * np.sum(gauss * (-2.0 * np.pi**2 * d / s_), axis=-1)
+    theta_s = pref * np.sum(gauss * (np.pi**2 * d * d / s_**2 - 0.5 / s_), axis=-1)
+    return theta, theta_z, -theta_s / q
+
+
+def _evaluate(z, q, n_terms: Optional[int], tol: float, derivatives: bool):
+    z = np.asarray(z)
+    q = np.asarray(q)
+    if n_terms is not None:
+        return _direct_series(z, q, int(n_terms), derivatives)
+
+    dual = np.isrealobj(q) & (q > math.exp(-MODULAR_SWITCH_S)) & (q < 1.0)
+    if not np.any(dual):
+        N = adaptive_n_terms(float(np.max(np.abs(q))), tol)
+        return _direct_series(z, q, N, derivatives)
+    if np.all(dual):
+        return _modular_series(z, q, tol, derivatives)
+
+    # Mixed nomes: evaluate each branch on its own subset
+    z_b, q_b = np.broadcast_arrays(z, q)
+    dual = np.broadcast_to(dual, z_b.shape)
+    dtype = np.result_type(z_b, q_b, float)
+    out = [np.empty(z_b.shape, dtype=dtype) for _ in range(3 if derivatives else 1)]
+    for mask, branch in ((dual, "dual"), (~dual, "direct")):
+        zs, qs = z_b[mask], q_b[mask]
+        if branch == "dual":
+            vals = _modular_series(zs, qs, tol, derivatives)
+        else:
+            N = adaptive_n_terms(float(np.max(np.abs(qs))), tol)
+            vals = _direct_series(zs, qs, N, derivatives)
+        for target, val in zip(out, vals):
+            target[mask] = val
+    return tuple(out) if derivatives else (out[0], None, None)
+
+
+def theta3(z, q, n_terms: Optional[int] = None, tol: float = DEFAULT_TOL) -> np.ndarray:
+    """
+    Jacobi theta function θ₃(z, q) = Σ_n q^{n²} exp(2πinz).
+
+    Args:
+        z: Real or complex argument (array-like)
+        q: Nome, |q| < 1 unless n_terms is given (array-like, broadcasts with z)
+        n_terms: Fixed truncation |n| ≤ n_terms; None chooses it adaptively
+            and uses the modular transformation for real q near 1
+        tol: Target accuracy for the adaptive evaluation
+
+    Returns:
+        θ₃ values with the broadcast shape of z and q (real for real inputs)
+    """
+    return _evaluate(z, q, n_terms, tol, derivatives=False)[0]
+
+
+def theta3_derivatives(
+    z, q, n_terms: Optional[int] = None, tol: float = DEFAULT_TOL
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    θ₃(z, q) together with its analytic derivatives ∂θ₃/∂z and ∂θ₃/∂q.
+
+    For a log-nome parameterisation q = exp(-s) use ∂θ₃/∂s = -q ∂θ₃/∂q.
+
+    Args:
+        z, q, n_terms, tol: As for theta3
+
+    Returns:
+        (theta, dtheta_dz, dtheta_dq)
+    """
+    return _evaluate(z, q, n_terms, tol, derivatives=True)
@@ -6,9 +6,11 @@ Creates synthetic data with Jacobi theta function structure and verifies
 that the fitting routine can recover the parameters.
 """
 
+import csv
 import numpy as np
 import sys
 import os
+import tempfile
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,7 +18,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from forensic_fingerprint.tools.jacobi_cluster_fit import (
     jacobi_theta3,
     jacobi_theta3_power_spectrum,
+    fit_jacobi_batch,
     fit_jacobi_cluster,
+    load_radial_csv,
+    load_radial_dumps,
+    write_batch_results,
 )
 
 
@@ -128,6 +134,67 @@ def test_fit_recovery():
     print("[test] Parameter recovery test PASSED\n")
 
 
+def _write_dump(path, spectra):
+    """Write {channel: psd} in the cmb_fft2d_scan.py radial dump layout."""
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["channel", "nside_out", "nlat", "nlon", "lat_cut_deg", "field", "window2d",
+                    "radial", "null", "mc", "seed", "k", "obs_psd", "mc_mean", "mc_std", "z", "p_tail"])
+        for channel, psd in spectra.items():
+            for k, value in enumerate(psd):
+                w.writerow([channel, 64, 128, 256, 20.0, "T", "hann", True, "", 0, 0,
+                            k, value, "nan", "nan", "nan", "nan"])
+
+
+def test_batch_fit_matches_single():
+    """Test that the batch fitter reproduces one fit per (file, channel, window)."""
+    print("[test] Testing batch fit over several radial dumps...")
+    
+    rng = np.random.default_rng(7)
+    k = np.arange(160)
+    windows = [(134, 143), (130, 150)]
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(4):
+            spectra = {}
+            for channel in ("TT", "EE"):
+                psd = rng.uniform(100, 1000) * jacobi_theta3_power_spectrum(
+                    k, rng.uniform(136, 139), 10 ** rng.uniform(-3, -1), rng.uniform(0.2, 1.8))
+                spectra[channel] = psd * (1 + 0.02 * rng.normal(size=len(k)))
+            if i == 1:
+                spectra["EE"][138] = np.nan      # missing point inside both windows
+            if i == 2:
+                del spectra["EE"]                # channel absent from this dump
+            paths.append(os.path.join(tmp, f"radial_{i}.csv"))
+            _write_dump(paths[-1], spectra)
+        
+        dumps = load_radial_dumps(paths)
+        assert dumps.psd.shape == (4, 2, 160)
+        assert dumps.present.sum() == 7
+        
+        rows = fit_jacobi_batch(dumps, windows)
+        pooled = fit_jacobi_batch(dumps, windows, chunk_size=3, workers=2)
+        assert len(rows) == len(pooled) == 7 * len(windows)
+        
+        for row, other in zip(rows, pooled):
+            k_data, psd_data = load_radial_csv(row["file"], row["channel"])
+            single = fit_jacobi_cluster(k_data, psd_data, row["k_min"], row["k_max"])
+            for r in (row, other):
+                assert (r["k0_fit"], r["D_fit"], r["tau_fit"]) == \
+                    (single.k0_fit, single.D_fit, single.tau_fit)
+                assert r["n_points"] == len(single.k_data)
+                assert np.isclose(r["amplitude_fit"], single.amplitude_fit, rtol=1e-12)
+                assert np.isclose(r["chi2"], single.chi2, rtol=1e-10)
+        
+        out = os.path.join(tmp, "batch.csv")
+        write_batch_results(rows, out)
+        with open(out) as f:
+            assert sum(1 for _ in csv.DictReader(f)) == len(rows)
+    
+    print(f"  ✓ {len(rows)} batch fits match individual fits")
+    print("[test] Batch fit test PASSED\n")
+
+
 def main():
     """Run all tests."""
     print("=" * 70)
@@ -138,6 +205,7 @@ def main():
         test_jacobi_theta3_basic()
         test_power_spectrum_model()
         test_fit_recovery()
+        test_batch_fit_matches_single()
         
         print("=" * 70)
         print("ALL TESTS PASSED ✓")
@@ -19,6 +19,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 from scipy.optimize import curve_fit
 
+from .jacobi_theta import theta3, theta3_derivatives
+
 
 def load_csv(csv_path: Path) -> Tuple[np.ndarray, np.ndarray]:
     """
@@ -99,6 +101,32 @@ def gauss_envelope(
     return baseline + A * np.exp(-((k - k0) ** 2) / (2 * sigma**2))
 
 
+def gauss_envelope_jacobian(
+    k: np.ndarray,
+    baseline: float,
+    A: float,
+    k0: float,
+    sigma: float,
+) -> np.ndarray:
+    """
+    Analytic Jacobian of gauss_envelope w.r.t. (baseline, A, k0, sigma).
+
+    Args:
+        k, baseline, A, k0, sigma: As for gauss_envelope
+
+    Returns:
+        Array of shape (len(k), 4)
+    """
+    d = np.asarray(k, dtype=float) - k0
+    g = np.exp(-(d**2) / (2 * sigma**2))
+    return np.column_stack([
+        np.ones_like(g),
+        g,
+        A * g * d / sigma**2,
+        A * g * d**2 / sigma**3,
+    ])
+
+
 def gauss_envelope_with_spikes(
     k: np.ndarray,
     baseline: float,
@@ -158,14 +186,43 @@ def theta3_envelope(
     Returns:
         Fitted PSD values
     """
-    w = np.zeros_like(k, dtype=float)
-
-    for m in range(-M, M + 1):
-        w += np.exp(-a * m**2) * np.cos(2 * np.pi * m * (k - k0) / K)
+    w = theta3((np.asarray(k) - k0) / K, np.exp(-a), n_terms=M)
 
     return baseline + A * w
 
 
+def theta3_envelope_jacobian(
+    k: np.ndarray,
+    baseline: float,
+    A: float,
+    k0: float,
+    a: float,
+    M: int = 6,
+    K: float = 1.0,
+) -> np.ndarray:
+    """
+    Analytic Jacobian of theta3_envelope with respect to (baseline, A, k0, a).
+
+    With q = exp(-a) and z = (k-k0)/K:
+        d/dk0 = -A * dθ₃/dz / K,   d/da = -A * q * dθ₃/dq
+
+    Args:
+        k: Index array
+        baseline, A, k0, a, M, K: As for theta3_envelope
+
+    Returns:
+        Array of shape (len(k), 4)
+    """
+    q = np.exp(-a)
+    w, w_z, w_q = theta3_derivatives((np.asarray(k) - k0) / K, q, n_terms=M)
+    return np.column_stack([
+        np.ones_like(w),
+        w,
+        -A * w_z / K,
+        -A * q * w_q,
+    ])
+
+
 def fit_gauss_envelope(
     k: np.ndarray,
     psd_obs: np.ndarray,
@@ -173,6 +230,7 @@ def fit_gauss_envelope(
     kmax: int,
     include_spikes: bool = False,
     spike_ks: Optional[List[int]] = None,
+    p0: Optional[np.ndarray] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Fit Gaussian envelope model to data in [kmin, kmax] range.
@@ -184,6 +242,7 @@ def fit_gauss_envelope(
         kmax: Maximum k for fit window
         include_spikes: Whether to include spike terms
         spike_ks: List of k values for spikes
+        p0: Initial parameters (e.g. a previous fit); default is a data-based guess
 
     Returns:
         popt: Optimal parameters
@@ -211,7 +270,7 @@ def fit_gauss_envelope(
     if include_spikes and spike_ks:
         # Include spike amplitudes in fit
         n_spikes = len(spike_ks)
-        p0 = [baseline_guess, A_guess, k0_guess, sigma_guess] + [0.5] * n_spikes
+        guess = [baseline_guess, A_guess, k0_guess, sigma_guess] + [0.5] * n_spikes
 
         def model(k_val, baseline, A, k0, sigma, *spike_amps):
             return gauss_envelope_with_spikes(
@@ -219,19 +278,20 @@ def fit_gauss_envelope(
             )
 
     else:
-        p0 = [baseline_guess, A_guess, k0_guess, sigma_guess]
+        guess = [baseline_guess, A_guess, k0_guess, sigma_guess]
         model = gauss_envelope
 
+    lower = [0, 0, kmin, 0.1] + ([0] * (len(guess) - 4))
+    upper = [np.inf, np.inf, kmax, (kmax - kmin)] + ([np.inf] * (len(guess) - 4))
+    p0 = guess if p0 is None else np.clip(p0, lower, upper)
+
     try:
         popt, pcov = curve_fit(
             model,
             k_fit,
             psd_fit,
             p0=p0,
-            bounds=(
-                [0, 0, kmin, 0.1] + ([0] * (len(p0) - 4)),
-                [np.inf, np.inf, kmax, (kmax - kmin)] + ([np.inf] * (len(p0) - 4)),
-            ),
+            bounds=(lower, upper),
             maxfev=10000,
         )
         return popt, pcov
@@ -247,6 +307,7 @@ def fit_theta3_envelope(
     kmax: int,
     M: int = 6,
     K: float = 1.0,
+    p0: Optional[np.ndarray] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Fit theta3 envelope model to data in [kmin, kmax] range.
@@ -258,6 +319,7 @@ def fit_theta3_envelope(
         kmax: Maximum k for fit window
         M: Truncation order
         K: Period parameter
+        p0: Initial parameters (e.g. a previous fit); default is a data-based guess
 
     Returns:
         popt: Optimal parameters [baseline, A, k0, a]
@@ -282,21 +344,25 @@ def fit_theta3_envelope(
     A_guess = (np.max(psd_fit) - baseline_guess) / (2 * M + 1)  # Normalize by sum
     a_guess = 0.1
 
-    p0 = [baseline_guess, A_guess, k0_guess, a_guess]
+    guess = [baseline_guess, A_guess, k0_guess, a_guess]
+    lower = [0, 0, kmin, 0.001]
+    upper = [np.inf, np.inf, kmax, 10.0]
+    p0 = guess if p0 is None else np.clip(p0, lower, upper)
 
     def model(k_val, baseline, A, k0, a):
         return theta3_envelope(k_val, baseline, A, k0, a, M=M, K=K)
 
+    def jac(k_val, baseline, A, k0, a):
+        return theta3_envelope_jacobian(k_val, baseline, A, k0, a, M=M, K=K)
+
     try:
         popt, pcov = curve_fit(
             model,
             k_fit,
             psd_fit,
             p0=p0,
-            bounds=(
-                [0, 0, kmin, 0.001],
-                [np.inf, np.inf, kmax, 10.0],
-            ),
+            jac=jac,
+            bounds=(lower, upper),
             maxfev=10000,
         )
         return popt, pcov
@@ -305,7 +371,45 @@ def fit_theta3_envelope(
         raise RuntimeError(f"Theta3 fit failed: {e}") from e
 
 
-def bootstrap_uncertainty(
+def _fit_model(
+    model_name: str,
+    k: np.ndarray,
+    psd_obs: np.ndarray,
+    kmin: int,
+    kmax: int,
+    p0: Optional[np.ndarray] = None,
+    **fit_kwargs,
+) -> np.ndarray:
+    """Dispatch to the fit function for model_name and return popt."""
+    if model_name == "gauss_envelope":
+        popt, _ = fit_gauss_envelope(k, psd_obs, kmin, kmax, p0=p0, **fit_kwargs)
+    elif model_name == "theta3_envelope":
+        popt, _ = fit_theta3_envelope(k, psd_obs, kmin, kmax, p0=p0, **fit_kwargs)
+    else:
+        raise ValueError(f"Unknown model: {model_name}")
+    return popt
+
+
+def _bootstrap_task(args) -> np.ndarray:
+    """Fit a block of resamples; rows of failed fits are NaN."""
+    k_fit, psd_fit, kmin, kmax, model_name, p0, seeds, fit_kwargs = args
+    n_points = len(k_fit)
+    out = np.full((len(seeds), len(p0)), np.nan)
+    for i, seed_seq in enumerate(seeds):
+        # Resample with replacement; each resample owns its seed, so results
+        # do not depend on how resamples are split across workers
+        indices = np.random.default_rng(seed_seq).choice(n_points, size=n_points, replace=True)
+        try:
+            out[i] = _fit_model(
+                model_name, k_fit[indices], psd_fit[indices], kmin, kmax, p0=p0, **fit_kwargs
+            )
+        except Exception:
+            # Skip failed fits
+            continue
+    return out
+
+
+def bootstrap_samples(
     k: np.ndarray,
     psd_obs: np.ndarray,
     kmin: int,
@@ -313,10 +417,18 @@ def bootstrap_uncertainty(
     model_name: str,
     n_bootstrap: int = 200,
     seed: int = 0,
+    p0: Optional[np.ndarray] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
     **fit_kwargs,
-) -> Tuple[np.ndarray, np.ndarray]:
+) -> np.ndarray:
     """
-    Estimate parameter uncertainties via bootstrap resampling.
+    Bootstrap parameter samples from warm-started refits.
+
+    Resample i draws its indices from SeedSequence(seed).spawn(n_bootstrap)[i],
+    so the samples are identical for any `workers`. Every refit starts from the
+    point estimate p0 (fitted on the full window if not given), which is where
+    resampled optima cluster, instead of from the generic initial guess.
 
     Args:
         k: Index array
@@ -326,14 +438,14 @@ def bootstrap_uncertainty(
         model_name: 'gauss_envelope' or 'theta3_envelope'
         n_bootstrap: Number of bootstrap resamples
         seed: Random seed for reproducibility
+        p0: Point estimate used as warm start
+        workers: Worker processes (None or 1: in-process)
+        chunk_size: Resamples per worker task
         fit_kwargs: Additional arguments for fit function
 
     Returns:
-        param_means: Mean parameter values
-        param_stds: Standard deviations of parameters
+        Array of shape (n_successful, n_params) with the refitted parameters
     """
-    rng = np.random.default_rng(seed)
-
     # Filter to fit window
     mask = (k >= kmin) & (k <= kmax)
     k_fit = k[mask]
@@ -343,30 +455,62 @@ def bootstrap_uncertainty(
     if n_points < 4:
         raise ValueError(f"Insufficient data for bootstrap: {n_points} points")
 
-    # Storage for bootstrap parameters
-    boot_params = []
+    if p0 is None:
+        p0 = _fit_model(model_name, k_fit, psd_fit, kmin, kmax, **fit_kwargs)
+    p0 = np.asarray(p0, dtype=float)
+
+    seeds = np.random.SeedSequence(seed).spawn(n_bootstrap)
+    tasks = [
+        (k_fit, psd_fit, kmin, kmax, model_name, p0, seeds[i:i + chunk_size], fit_kwargs)
+        for i in range(0, n_bootstrap, chunk_size)
+    ]
+    if workers is None or workers <= 1:
+        blocks = [_bootstrap_task(task) for task in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
 
-    for _ in range(n_bootstrap):
-        # Resample with replacement
-        indices = rng.choice(n_points, size=n_points, replace=True)
-        k_boot = k_fit[indices]
-        psd_boot = psd_fit[indices]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            blocks = list(pool.map(_bootstrap_task, tasks))
 
-        try:
-            if model_name == "gauss_envelope":
-                popt, _ = fit_gauss_envelope(k_boot, psd_boot, kmin, kmax, **fit_kwargs)
-            elif model_name == "theta3_envelope":
-                popt, _ = fit_theta3_envelope(
-                    k_boot, psd_boot, kmin, kmax, **fit_kwargs
-                )
-            else:
-                raise ValueError(f"Unknown model: {model_name}")
+    boot_params = np.concatenate(blocks) if blocks else np.empty((0, len(p0)))
+    return boot_params[np.isfinite(boot_params).all(axis=1)]
 
-            boot_params.append(popt)
 
-        except Exception:
-            # Skip failed fits
-            continue
+def bootstrap_uncertainty(
+    k: np.ndarray,
+    psd_obs: np.ndarray,
+    kmin: int,
+    kmax: int,
+    model_name: str,
+    n_bootstrap: int = 200,
+    seed: int = 0,
+    p0: Optional[np.ndarray] = None,
+    workers: Optional[int] = None,
+    **fit_kwargs,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimate parameter uncertainties via bootstrap resampling.
+
+    Args:
+        k: Index array
+        psd_obs: Observed PSD values
+        kmin: Minimum k for fit window
+        kmax: Maximum k for fit window
+        model_name: 'gauss_envelope' or 'theta3_envelope'
+        n_bootstrap: Number of bootstrap resamples
+        seed: Random seed for reproducibility
+        p0: Point estimate used as warm start (see bootstrap_samples)
+        workers: Worker processes (None or 1: in-process)
+        fit_kwargs: Additional arguments for fit function
+
+    Returns:
+        param_means: Mean parameter values
+        param_stds: Standard deviations of parameters
+    """
+    boot_params = bootstrap_samples(
+        k, psd_obs, kmin, kmax, model_name,
+        n_bootstrap=n_bootstrap, seed=seed, p0=p0, workers=workers, **fit_kwargs,
+    )
 
     if len(boot_params) < n_bootstrap / 2:
         print(
@@ -374,8 +518,6 @@ def bootstrap_uncertainty(
             file=sys.stderr,
         )
 
-    boot_params = np.array(boot_params)
-
     if len(boot_params) == 0:
         raise RuntimeError("All bootstrap fits failed")
 
@@ -385,6 +527,67 @@ def bootstrap_uncertainty(
     return param_means, param_stds
 
 
+def laplace_uncertainty(
+    k: np.ndarray,
+    psd_obs: np.ndarray,
+    kmin: int,
+    kmax: int,
+    model_name: str,
+    popt: np.ndarray,
+    M: int = 6,
+    K: float = 1.0,
+    include_spikes: bool = False,
+    spike_ks: Optional[List[int]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parameter uncertainties from the Laplace (linearised) approximation.
+
+    Uses the analytic Jacobian J at the optimum: cov = s² (JᵀJ)⁺ with
+    s² = RSS / (n - p), the covariance curve_fit reports for unweighted data.
+    No refits are needed, so this costs one model evaluation; it is accurate
+    when the residual surface is close to quadratic over the bootstrap spread.
+
+    Args:
+        k: Index array
+        psd_obs: Observed PSD values
+        kmin: Minimum k for fit window
+        kmax: Maximum k for fit window
+        model_name: 'gauss_envelope' or 'theta3_envelope'
+        popt: Fitted parameters
+        M, K: theta3_envelope truncation order and period
+        include_spikes, spike_ks: gauss_envelope spike terms
+
+    Returns:
+        param_means: popt (the approximation is centred on the optimum)
+        param_stds: Standard deviations of parameters
+    """
+    mask = (k >= kmin) & (k <= kmax)
+    k_fit = k[mask]
+    psd_fit = psd_obs[mask]
+    popt = np.asarray(popt, dtype=float)
+
+    if model_name == "gauss_envelope":
+        J = gauss_envelope_jacobian(k_fit, *popt[:4])
+        model = gauss_envelope(k_fit, *popt[:4])
+        if include_spikes and spike_ks:
+            spikes = np.column_stack([(k_fit == sk).astype(float) for sk in spike_ks])
+            J = np.hstack([J, spikes])
+            model = model + spikes @ popt[4:]
+    elif model_name == "theta3_envelope":
+        J = theta3_envelope_jacobian(k_fit, *popt, M=M, K=K)
+        model = theta3_envelope(k_fit, *popt, M=M, K=K)
+    else:
+        raise ValueError(f"Unknown model: {model_name}")
+
+    n_points, n_params = J.shape
+    if n_points <= n_params:
+        raise ValueError(f"Insufficient data for Laplace approximation: {n_points} points")
+
+    s2 = np.sum((psd_fit - model) ** 2) / (n_points - n_params)
+    cov = s2 * np.linalg.pinv(J.T @ J)
+    return popt, np.sqrt(np.clip(np.diag(cov), 0.0, None))
+
+
 def compute_derived_params(
     model_name: str, popt: np.ndarray, perr: np.ndarray
 ) -> Dict[str, Any]:
@@ -718,6 +921,20 @@ Examples:
         default=200,
         help="Number of bootstrap resamples (default: 200)",
     )
+    parser.add_argument(
+        "--uncertainty",
+        type=str,
+        choices=["bootstrap", "laplace"],
+        default="bootstrap",
+        help="Uncertainty method: warm-started bootstrap refits or the Laplace "
+        "approximation at the optimum (default: bootstrap)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for bootstrap refits (default: in-process)",
+    )
 
     args = parser.parse_args()
 
@@ -781,33 +998,48 @@ Examples:
         print(f"Error during fit: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Bootstrap uncertainties
-    print(f"Computing bootstrap uncertainties ({args.n_bootstrap} resamples)...")
-    try:
-        fit_kwargs = {}
-        if args.model == "gauss_envelope" and args.include_spikes:
-            fit_kwargs["include_spikes"] = True
-            fit_kwargs["spike_ks"] = spike_ks
+    fit_kwargs = {}
+    if args.model == "gauss_envelope" and args.include_spikes:
+        fit_kwargs["include_spikes"] = True
+        fit_kwargs["spike_ks"] = spike_ks
 
-        boot_means, boot_stds = bootstrap_uncertainty(
-            k,
-            psd_obs,
-            args.kmin,
-            args.kmax,
-            args.model,
-            n_bootstrap=args.n_bootstrap,
-            seed=args.seed,
-            **fit_kwargs,
-        )
+    if args.uncertainty == "laplace":
+        # Reuses the Jacobian at the optimum: no refits
+        try:
+            _, laplace_stds = laplace_uncertainty(
+                k, psd_obs, args.kmin, args.kmax, args.model, popt, **fit_kwargs
+            )
+            perr = np.maximum(perr, laplace_stds)
+            print("Laplace approximation complete!")
 
-        # Use bootstrap uncertainties if larger (more conservative)
-        perr = np.maximum(perr, boot_stds)
+        except ValueError as e:
+            print(f"Warning: Laplace approximation failed: {e}", file=sys.stderr)
+            print("Using covariance-based uncertainties only")
+    else:
+        # Bootstrap uncertainties
+        print(f"Computing bootstrap uncertainties ({args.n_bootstrap} resamples)...")
+        try:
+            boot_means, boot_stds = bootstrap_uncertainty(
+                k,
+                psd_obs,
+                args.kmin,
+                args.kmax,
+                args.model,
+                n_bootstrap=args.n_bootstrap,
+                seed=args.seed,
+                p0=popt,
+                workers=args.workers,
+                **fit_kwargs,
+            )
 
-        print("Bootstrap complete!")
+            # Use bootstrap uncertainties if larger (more conservative)
+            perr = np.maximum(perr, boot_stds)
 
-    except (ValueError, RuntimeError) as e:
-        print(f"Warning: Bootstrap failed: {e}", file=sys.stderr)
-        print("Using covariance-based uncertainties only")
+            print("Bootstrap complete!")
+
+        except (ValueError, RuntimeError) as e:
+            print(f"Warning: Bootstrap failed: {e}", file=sys.stderr)
+            print("Using covariance-based uncertainties only")
 
     # Compute derived parameters
     derived = compute_derived_params(args.model, popt, perr)
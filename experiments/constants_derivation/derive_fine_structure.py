@@ -37,6 +37,12 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from tools.prime_switching import optimal_prime as _switching_optimal_prime  # noqa: E402
+
 
 # ---------------------------------------------------------------------------
 # Physical constants (CODATA 2022 reference values — NOT fitted parameters)
@@ -183,13 +189,14 @@ def find_optimal_prime(A: float, B: float, limit: int = 500) -> Tuple[int, float
     unstable because they can decay by splitting. Only prime winding numbers
     give stable, irreducible vacuum sectors.
 
+    The minimum over primes ≤ limit is read from the shared switching-threshold
+    table (tools/prime_switching.py) instead of scanning every prime.
+
     Returns:
         (p_opt, V_min): Optimal prime and its potential value
     """
-    primes = sieve_primes(limit)
-    v_values = [(p, V_eff(float(p), A, B)) for p in primes]
-    p_opt, v_min = min(v_values, key=lambda x: x[1])
-    return p_opt, v_min
+    p_opt = _switching_optimal_prime(A, B, 2, limit)
+    return p_opt, V_eff(float(p_opt), A, B)
 
 
 # ---------------------------------------------------------------------------
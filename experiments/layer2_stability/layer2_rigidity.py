@@ -47,6 +47,12 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from tools.prime_switching import optimal_prime as _switching_optimal_prime  # noqa: E402
+
 
 # ---------------------------------------------------------------------------
 # Reproduce V_eff computation inline (no import dependencies)
@@ -73,11 +79,17 @@ def V_eff(n: int, A: float, B: float) -> float:
 
 
 def optimal_prime(A: float, B: float, prime_range: Tuple[int, int] = (50, 300)) -> int:
-    """Return the prime p in prime_range that minimizes V_eff(p)."""
-    candidates = [p for p in PRIMES_300 if prime_range[0] <= p <= prime_range[1]]
-    if not candidates:
+    """Return the prime p in prime_range that minimizes V_eff(p).
+
+    Candidates are the primes ≤ 300 inside prime_range; the minimum is read
+    from the shared switching-threshold table (tools/prime_switching.py).
+    """
+    try:
+        return _switching_optimal_prime(
+            A, B, prime_range[0], min(prime_range[1], PRIMES_300[-1])
+        )
+    except ValueError:
         return -1
-    return min(candidates, key=lambda p: V_eff(p, A, B))
 
 
 # ---------------------------------------------------------------------------
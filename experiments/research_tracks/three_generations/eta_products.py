@@ -0,0 +1,314 @@
+# Copyright (c) 2026 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+
+"""
+eta_products.py
+===============
+
+Exact q-expansions of eta products f = ∏_d η(d z)^{r_d} via Euler's
+pentagonal number theorem.
+
+    η(d z) = q^{d/24} · ∏_{n≥1} (1 - q^{d n})
+    ∏_{n≥1} (1 - q^n) = Σ_{k∈Z} (-1)^k q^{k(3k-1)/2}
+
+so each η(d z) series is a sparse ±1 series with O(√(M/d)) non-zero terms up
+to q^M, generated in O(M).  Multiplying a dense series by it is O(M·√(M/d))
+shifted NumPy adds instead of the O(M²) per factor of the direct product.
+Cubes use Jacobi's identity ∏(1 - q^n)³ = Σ_{k≥0} (-1)^k (2k+1) q^{k(k+1)/2},
+which is sparse as well, so η^r costs ⌊r/3⌋ + (r mod 3) sparse products.
+Negative exponents r_d < 0 divide by the pentagonal series (partition-type
+recurrence in exact Python integers).
+
+Coefficients outgrow int64 quickly (τ(n) for Δ = η(z)^24 passes 2^63 near
+n ~ 10⁴), so a series is held as int64 "limbs" in balanced base 2^31:
+
+    c_n = Σ_i limb_i[n] · 2^{31 i}
+
+Multiplication by a fixed sparse series is linear, so it is applied to every
+limb independently.  Before each product the limbs are carry-normalised so
+that no int64 add can overflow, and a new limb is appended when the top one
+grows.  Results are therefore exact at a small constant-factor cost.
+
+Results are cached per (d, r) and per eta product; a request for q^M with a
+cached longer series is served by slicing, since the coefficients up to q^M
+do not depend on the truncation order.
+
+Used by:
+    search_hecke_lmfdb_local.eta_product_qexp
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_LIMB_BITS = 31
+_LIMB_HALF = 1 << (_LIMB_BITS - 1)
+_LIMB_MASK = (1 << _LIMB_BITS) - 1
+_INT64_SAFE = 1 << 62
+
+# A series as int64 limbs (least significant first), all of the same length.
+Limbs = Tuple[np.ndarray, ...]
+
+_FACTOR_CACHE: Dict[Tuple[int, int], Limbs] = {}
+_PRODUCT_CACHE: Dict[Tuple[Tuple[int, int], ...], Limbs] = {}
+
+
+# ---------------------------------------------------------------------------
+# Sparse series
+# ---------------------------------------------------------------------------
+
+def pentagonal_terms(d: int, M: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exponents and signs of ∏_{n≥1}(1 - q^{d n}) up to q^M (exponent 0 included).
+
+    Exponents are d·k(3k-1)/2 for k = 0, ±1, ±2, ... in increasing order.
+    """
+    if d < 1:
+        raise ValueError(f"eta divisor d={d} must be a positive integer")
+    exps = [0]
+    signs = [1]
+    k = 1
+    while True:
+        e1 = d * k * (3 * k - 1) // 2
+        if e1 > M:
+            break
+        s = -1 if k % 2 else 1
+        exps.append(e1)
+        signs.append(s)
+        e2 = d * k * (3 * k + 1) // 2
+        if e2 <= M:
+            exps.append(e2)
+            signs.append(s)
+        k += 1
+    return np.asarray(exps, dtype=np.int64), np.asarray(signs, dtype=np.int64)
+
+
+def jacobi_cube_terms(d: int, M: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exponents and coefficients of ∏_{n≥1}(1 - q^{d n})³ up to q^M.
+
+    Jacobi's identity: ∏(1 - q^n)³ = Σ_{k≥0} (-1)^k (2k+1) q^{k(k+1)/2}.
+    """
+    if d < 1:
+        raise ValueError(f"eta divisor d={d} must be a positive integer")
+    exps = []
+    coeffs = []
+    k = 0
+    while d * k * (k + 1) // 2 <= M:
+        exps.append(d * k * (k + 1) // 2)
+        coeffs.append(-(2 * k + 1) if k % 2 else 2 * k + 1)
+        k += 1
+    return np.asarray(exps, dtype=np.int64), np.asarray(coeffs, dtype=np.int64)
+
+
+def pentagonal_series(d: int, M: int) -> np.ndarray:
+    """Dense int64 coefficients of ∏_{n≥1}(1 - q^{d n}) up to q^M."""
+    exps, signs = pentagonal_terms(d, M)
+    out = np.zeros(M + 1, dtype=np.int64)
+    out[exps] = signs
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Limb arithmetic
+# ---------------------------------------------------------------------------
+
+def _one(M: int) -> Limbs:
+    series = np.zeros(M + 1, dtype=np.int64)
+    series[0] = 1
+    return (series,)
+
+
+def _normalise(limbs: Limbs, l1: int) -> List[np.ndarray]:
+    """
+    Carry-propagate into balanced base-2^31 limbs so that every limb can be
+    multiplied by a sparse series of coefficient mass l1 without overflow.
+    """
+    out = [limb.copy() for limb in limbs]
+    limit = _INT64_SAFE // max(1, l1)
+    i = 0
+    while i < len(out):
+        limb = out[i]
+        is_top = i == len(out) - 1
+        if is_top and int(np.abs(limb).max(initial=0)) < limit:
+            break
+        lo = ((limb + _LIMB_HALF) & _LIMB_MASK) - _LIMB_HALF
+        carry = (limb - lo) >> _LIMB_BITS
+        out[i] = lo
+        if is_top:
+            out.append(carry)
+        else:
+            out[i + 1] = out[i + 1] + carry
+        i += 1
+    while len(out) > 1 and not out[-1].any():
+        out.pop()
+    return out
+
+
+def _mul_sparse(limbs: Limbs, exps: np.ndarray, coeffs: np.ndarray) -> Limbs:
+    """Multiply a limb series by a sparse series whose constant term is 1."""
+    l1 = int(np.abs(coeffs).sum())
+    if l1 >= _INT64_SAFE >> _LIMB_BITS:
+        raise ValueError("sparse factor too large for limb arithmetic")
+    terms = list(zip(exps[1:].tolist(), coeffs[1:].tolist()))
+    result = []
+    for limb in _normalise(limbs, l1):
+        out = limb.copy()
+        n = len(out)
+        for e, c in terms:
+            if e >= n:
+                break
+            out[e:] += c * limb[: n - e]
+        result.append(out)
+    return tuple(result)
+
+
+def _mul_power(limbs: Limbs, d: int, r: int, M: int) -> Limbs:
+    """Multiply by ∏_{n≥1}(1 - q^{d n})^r for r ≥ 0 (Jacobi cubes + pentagonal)."""
+    if r <= 0:
+        return limbs
+    cube_exps, cube_coeffs = jacobi_cube_terms(d, M)
+    pent_exps, pent_signs = pentagonal_terms(d, M)
+    for _ in range(r // 3):
+        limbs = _mul_sparse(limbs, cube_exps, cube_coeffs)
+    for _ in range(r % 3):
+        limbs = _mul_sparse(limbs, pent_exps, pent_signs)
+    return limbs
+
+
+def _to_object(limbs: Limbs) -> np.ndarray:
+    """Exact Python-integer coefficients from limbs."""
+    total = limbs[-1].astype(object)
+    for limb in reversed(limbs[:-1]):
+        total = (total << _LIMB_BITS) + limb.astype(object)
+    return total
+
+
+def _from_object(series: np.ndarray) -> Limbs:
+    """Split exact Python-integer coefficients into balanced limbs."""
+    limbs = []
+    rest = series.astype(object)
+    while True:
+        lo = ((rest + _LIMB_HALF) & _LIMB_MASK) - _LIMB_HALF
+        limbs.append(lo.astype(np.int64))
+        rest = (rest - lo) >> _LIMB_BITS
+        if not rest.any():
+            break
+    return tuple(limbs)
+
+
+def _div_pentagonal(limbs: Limbs, d: int, M: int) -> Limbs:
+    """Divide by ∏_{n≥1}(1 - q^{d n}) (exact recurrence in Python integers)."""
+    exps, signs = pentagonal_terms(d, M)
+    exps_l = exps[1:].tolist()
+    signs_l = signs[1:].tolist()
+    out = _to_object(limbs).tolist()
+    for n in range(1, len(out)):
+        acc = out[n]
+        for e, s in zip(exps_l, signs_l):
+            if e > n:
+                break
+            acc -= s * out[n - e]
+        out[n] = acc
+    return _from_object(np.asarray(out, dtype=object))
+
+
+def _apply_factor(limbs: Limbs, d: int, r: int, M: int) -> Limbs:
+    limbs = _mul_power(limbs, d, r, M)
+    for _ in range(-r):
+        limbs = _div_pentagonal(limbs, d, M)
+    return limbs
+
+
+def _freeze(limbs: Limbs) -> Limbs:
+    for limb in limbs:
+        limb.setflags(write=False)
+    return limbs
+
+
+def _as_array(limbs: Limbs) -> np.ndarray:
+    """int64 array when one limb suffices, else an exact object array."""
+    if len(limbs) == 1:
+        return limbs[0]
+    return _to_object(limbs)
+
+
+def _eta_power_limbs(d: int, r: int, M: int) -> Limbs:
+    cached = _FACTOR_CACHE.get((d, r))
+    if cached is not None and len(cached[0]) > M:
+        return tuple(limb[: M + 1] for limb in cached)
+    limbs = _freeze(_apply_factor(_one(M), d, r, M))
+    _FACTOR_CACHE[(d, r)] = limbs
+    return limbs
+
+
+def _eta_product_limbs(pairs: Sequence[Tuple[int, int]], M: int) -> Limbs:
+    key = tuple(sorted((int(d), int(r)) for d, r in pairs if r != 0))
+    cached = _PRODUCT_CACHE.get(key)
+    if cached is not None and len(cached[0]) > M:
+        return tuple(limb[: M + 1] for limb in cached)
+    if not key:
+        return _one(M)
+    # Start from the cached power with the most work in it, then apply the
+    # remaining factors as sparse multiplications / divisions.
+    first = max(key, key=lambda dr: abs(dr[1]) / dr[0] ** 0.5)
+    limbs = _eta_power_limbs(first[0], first[1], M)
+    for d, r in key:
+        if (d, r) != first:
+            limbs = _apply_factor(limbs, d, r, M)
+    limbs = _freeze(tuple(limb.copy() for limb in limbs))
+    _PRODUCT_CACHE[key] = limbs
+    return limbs
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def eta_power_series(d: int, r: int, M: int) -> np.ndarray:
+    """
+    Coefficients of ∏_{n≥1}(1 - q^{d n})^r up to q^M.
+
+    Returns an int64 array when all coefficients fit in 31 bits (balanced),
+    else an exact object array.  Cached per (d, r); do not modify the result.
+    """
+    return _as_array(_eta_power_limbs(d, r, M))
+
+
+def eta_product_series(pairs: Sequence[Tuple[int, int]], M: int) -> np.ndarray:
+    """
+    Coefficients of ∏_d ∏_{n≥1}(1 - q^{d n})^{r_d} up to q^M
+    (the eta product without its q^{Σ r_d d / 24} prefactor).
+    """
+    return _as_array(_eta_product_limbs(pairs, M))
+
+
+def eta_product_coefficients(
+    pairs: Sequence[Tuple[int, int]],
+    max_n: int,
+) -> Optional[List[int]]:
+    """
+    Exact coefficients of f = ∏_d η(d z)^{r_d} up to q^max_n as Python ints.
+
+    Returns None if the leading power Σ r_d·d/24 is not a non-negative
+    integer or exceeds max_n; otherwise a list of length max_n+1
+    (coefficient of q^n at index n).
+    """
+    L_num = sum(r * d for d, r in pairs)
+    if L_num % 24 != 0:
+        return None
+    leading = L_num // 24
+    if leading < 0 or leading > max_n:
+        return None
+    coeffs = [0] * (max_n + 1)
+    coeffs[leading:] = [int(v) for v in eta_product_series(pairs, max_n - leading)]
+    return coeffs
+
+
+def clear_cache() -> None:
+    """Drop all cached factor and product series."""
+    _FACTOR_CACHE.clear()
+    _PRODUCT_CACHE.clear()
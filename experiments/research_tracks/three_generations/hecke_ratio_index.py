@@ -0,0 +1,226 @@
+# Copyright (c) 2026 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+
+"""
+hecke_ratio_index.py
+====================
+
+Sorted-ratio index for the (f_0, f_1, f_2) Hecke eigenvalue triple search.
+
+The triple condition used by the search scripts is
+
+    |ratio_mu  - MU_RATIO|  / MU_RATIO  ≤ tol,   ratio_mu  = |a_p(f_1)| / |a_p(f_0)|
+    |ratio_tau - TAU_RATIO| / TAU_RATIO ≤ tol,   ratio_tau = |a_p(f_2)| / |a_p(f_0)|
+
+For fixed f_0 both conditions are independent windows on |a_p|:
+
+    |a_p(f_1)| ∈ |a_p(f_0)| · MU_RATIO  · [1 - tol, 1 + tol]
+    |a_p(f_2)| ∈ |a_p(f_0)| · TAU_RATIO · [1 - tol, 1 + tol]
+
+so the weight-4 and weight-6 forms are sorted by |a_p| once and each f_0
+costs two binary searches.  Every triple is the Cartesian product of the two
+windows, giving O(n log n + matches) instead of O(|k2|·|k4|·|k6|).
+
+Windows are widened by a relative 1e-12 before the binary search and every
+hit is re-checked with the exact error formula above, so the matches (and
+their order: f_0, then f_1, then f_2 in input order) are identical to the
+nested-loop search.
+
+Used by:
+    search_hecke_lmfdb_local.search_triples
+    search_hecke_lmfdb_api.run_api_search
+    run_hecke_lmfdb_search.find_triples
+
+Several tolerances are served in one pass (search at the widest tolerance,
+then bucket each hit by its max(err_mu, err_tau)); several primes are served
+by search_many_primes, which builds one index per prime.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import (
+    Any, Callable, Dict, Generic, Iterable, Iterator, List, NamedTuple,
+    Optional, Sequence, Tuple, TypeVar,
+)
+
+T = TypeVar("T")
+
+# Relative slack for the binary-search window; hits are re-checked exactly.
+_WINDOW_SLACK = 1e-12
+
+
+class TripleMatch(NamedTuple):
+    """One (f_0, f_1, f_2) triple passing both ratio windows."""
+    f0: Any
+    f1: Any
+    f2: Any
+    a0: float
+    a1: float
+    a2: float
+    ratio_mu: float
+    ratio_tau: float
+    err_mu: float
+    err_tau: float
+
+
+class EigenvalueIndex(Generic[T]):
+    """
+    Forms of one weight sorted by |a_p| for window queries.
+
+    `a_p` maps an item to its eigenvalue (or None to drop the item).
+    Window queries return (a_p, item) pairs in the original input order.
+    """
+
+    def __init__(self, items: Iterable[T], a_p: Callable[[T], Optional[float]]):
+        keyed: List[Tuple[float, int, float, T]] = []
+        for pos, item in enumerate(items):
+            a = a_p(item)
+            if a is None:
+                continue
+            keyed.append((abs(a), pos, a, item))
+        keyed.sort(key=lambda t: (t[0], t[1]))
+        self._abs = [t[0] for t in keyed]
+        self._pos = [t[1] for t in keyed]
+        self._val = [t[2] for t in keyed]
+        self._items = [t[3] for t in keyed]
+
+    def __len__(self) -> int:
+        return len(self._abs)
+
+    def window(self, lo: float, hi: float) -> List[Tuple[float, T]]:
+        """Return (a_p, item) for all items with lo ≤ |a_p| ≤ hi, in input order."""
+        i = bisect_left(self._abs, lo)
+        j = bisect_right(self._abs, hi)
+        hits = sorted(range(i, j), key=self._pos.__getitem__)
+        return [(self._val[k], self._items[k]) for k in hits]
+
+
+def _ratio_window(abs0: float, target: float, tol: float) -> Tuple[float, float]:
+    """|a_p| bounds for which |a_p|/abs0 lies within tol of target."""
+    centre = abs0 * target
+    return (centre * (1.0 - tol) * (1.0 - _WINDOW_SLACK),
+            centre * (1.0 + tol) * (1.0 + _WINDOW_SLACK))
+
+
+def ratio_hits(
+    index: EigenvalueIndex,
+    abs0: float,
+    target: float,
+    tol: float,
+) -> List[Tuple[float, Any, float, float]]:
+    """
+    (a_p, item, ratio, err) for indexed items with |a_p|/abs0 within tol of target.
+
+    err is the exact relative error |ratio - target| / target; items are in
+    input order.
+    """
+    hits = []
+    for a, item in index.window(*_ratio_window(abs0, target, tol)):
+        ratio = abs(a) / abs0
+        err = abs(ratio - target) / target
+        if err <= tol:
+            hits.append((a, item, ratio, err))
+    return hits
+
+
+def iter_ratio_triples(
+    f0_items: Sequence[Any],
+    f1_index: EigenvalueIndex,
+    f2_index: EigenvalueIndex,
+    a_p: Callable[[Any], Optional[float]],
+    target_mu: float,
+    target_tau: float,
+    tol: float,
+    min_abs0: float = 0.0,
+    stats: Optional[Dict[str, int]] = None,
+) -> Iterator[TripleMatch]:
+    """
+    Yield all triples within `tol`, f_0 in input order.
+
+    f_0 items with a_p None, a_p == 0 or |a_p| < min_abs0 are skipped.
+    If `stats` is given, stats["mu_pairs"] is increased by the number of
+    (f_0, f_1) pairs inside the μ window (the pairs a nested loop would
+    test against every f_2).
+    """
+    for f0 in f0_items:
+        a0 = a_p(f0)
+        if a0 is None or a0 == 0:
+            continue
+        abs0 = abs(a0)
+        if abs0 < min_abs0:
+            continue
+
+        mu_hits = ratio_hits(f1_index, abs0, target_mu, tol)
+        if stats is not None:
+            stats["mu_pairs"] = stats.get("mu_pairs", 0) + len(mu_hits)
+        if not mu_hits:
+            continue
+        tau_hits = ratio_hits(f2_index, abs0, target_tau, tol)
+
+        for a1, f1, ratio_mu, err_mu in mu_hits:
+            for a2, f2, ratio_tau, err_tau in tau_hits:
+                yield TripleMatch(f0, f1, f2, a0, a1, a2,
+                                  ratio_mu, ratio_tau, err_mu, err_tau)
+
+
+def find_ratio_triples(
+    f0_items: Sequence[Any],
+    f1_items: Sequence[Any],
+    f2_items: Sequence[Any],
+    a_p: Callable[[Any], Optional[float]],
+    target_mu: float,
+    target_tau: float,
+    tolerances: Sequence[float],
+    min_abs0: float = 0.0,
+) -> Dict[float, List[TripleMatch]]:
+    """
+    Run the triple search for several tolerances in one pass.
+
+    Returns {tol: [TripleMatch, ...]} with every tolerance in `tolerances`.
+    """
+    tols = sorted(set(tolerances))
+    if not tols:
+        return {}
+    f1_index = EigenvalueIndex(f1_items, a_p)
+    f2_index = EigenvalueIndex(f2_items, a_p)
+    out: Dict[float, List[TripleMatch]] = {t: [] for t in tols}
+    for m in iter_ratio_triples(f0_items, f1_index, f2_index, a_p,
+                                target_mu, target_tau, tols[-1], min_abs0):
+        worst = max(m.err_mu, m.err_tau)
+        for t in reversed(tols):
+            if worst > t:
+                break
+            out[t].append(m)
+    return out
+
+
+def search_many_primes(
+    forms_by_weight: Dict[int, Sequence[Any]],
+    primes: Sequence[int],
+    a_p_at: Callable[[Any, int], Optional[float]],
+    target_mu: float,
+    target_tau: float,
+    tolerances: Sequence[float],
+    weights: Tuple[int, int, int] = (2, 4, 6),
+    min_abs0: float = 0.0,
+) -> Dict[int, Dict[float, List[TripleMatch]]]:
+    """
+    Triple search at every prime in `primes` and every tolerance.
+
+    `a_p_at(record, p)` extracts a_p from a record.  Returns
+    {p: {tol: [TripleMatch, ...]}}.
+    """
+    k0, k1, k2 = weights
+    f0_items = forms_by_weight.get(k0, [])
+    f1_items = forms_by_weight.get(k1, [])
+    f2_items = forms_by_weight.get(k2, [])
+    results: Dict[int, Dict[float, List[TripleMatch]]] = {}
+    for p in primes:
+        results[p] = find_ratio_triples(
+            f0_items, f1_items, f2_items,
+            lambda rec, _p=p: a_p_at(rec, _p),
+            target_mu, target_tau, tolerances, min_abs0,
+        )
+    return results
@@ -0,0 +1,683 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+
+"""
+newform_store.py
+================
+
+Offline, versioned store of newform Hecke eigenvalues (SQLite, stdlib only).
+
+The LMFDB search scripts walk the API page by page and re-parse every record
+on each run, then pull a_p out of the record with one of several field
+layouts.  This module keeps the parsed result instead:
+
+    forms        (label, level, weight, char_label, is_cm, cm_disc, source)
+    eigenvalues  (label, p, a_p)          for primes p ≤ bound
+
+    coverage     (weight, level_min, level_max, is_cm, source)
+
+so that the searches can run without network and without re-parsing.
+
+Coverage
+--------
+Holding some forms of a weight says nothing about holding all of them, so
+the search scripts only answer a query from the store when a recorded
+*complete* LMFDB query contains it (same weight, wider or equal level range,
+same CM filter or none).  Coverage is recorded when a search script finishes
+a full paginated fetch, or by importing API dumps with an explicit
+--weight/--level declaration.  Imports of result files never add coverage:
+their forms are served by records() but never short-circuit a search.
+
+Bulk import accepts
+  * raw LMFDB API dumps: {"data": [...]}, {"results": [...]} or a bare list
+    of mf_newforms / mf_hecke_nf records (fields hecke_eigenvalues,
+    hecke_eigs, eigenvalues — prime-indexed — or an — Dirichlet a_1..a_N);
+  * result files written by the search scripts (hecke_lmfdb_results.json,
+    hecke_search_results.json, nonCM_search_results.json, ...): every nested
+    dict with an LMFDB label and an "a_<p>" entry is imported.
+
+Level, weight and character orbit are taken from the record when present,
+otherwise parsed from the label N.k.c.x.  Records without a label (e.g. the
+SageMath matches, which only know weight and level) are skipped.
+
+Later imports overwrite earlier values for the same (label, p).
+
+Usage:
+    python newform_store.py import hecke_lmfdb_results.json
+    python newform_store.py import --weight 6 --level 50..500 --non-cm dump_k6.json
+    python newform_store.py query --weight 4 --level 1..50 --prime 137
+    python newform_store.py info
+
+    from newform_store import NewformStore
+    with NewformStore(path) as store:
+        recs = store.records(weight=6, level_min=50, level_max=500,
+                             primes=[137], is_cm=False)
+        # each rec: {"label", "level", "weight", ..., "a_p": {137: ...}}
+        recs = store.cached_records(6, 50, 500, primes=[137], is_cm=False)
+        # None unless a complete query covering (6, 50..500, non-CM) is stored
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+#: Bump when the table layout changes; older stores must be re-imported.
+SCHEMA_VERSION = 2
+
+#: Default location used by the search scripts when no --store is given.
+DEFAULT_STORE_PATH = os.path.join(_HERE, "newform_store.sqlite")
+
+#: Largest prime whose a_p is kept from full coefficient lists.
+PRIME_BOUND = 1000
+
+_LABEL_RE = re.compile(r"^(\d+)\.(\d+)\.([a-z]+)\.([a-z]+)$")
+_A_P_KEY_RE = re.compile(r"^a_(\d+)$")
+_PRIME_INDEXED_FIELDS = ("hecke_eigenvalues", "hecke_eigs", "eigenvalues")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS forms (
+    label      TEXT PRIMARY KEY,
+    level      INTEGER NOT NULL,
+    weight     INTEGER NOT NULL,
+    char_label TEXT,
+    is_cm      INTEGER,
+    cm_disc    INTEGER,
+    source     TEXT
+);
+CREATE INDEX IF NOT EXISTS forms_weight_level ON forms (weight, level);
+CREATE TABLE IF NOT EXISTS eigenvalues (
+    label TEXT NOT NULL REFERENCES forms (label),
+    p     INTEGER NOT NULL,
+    a_p   REAL NOT NULL,
+    PRIMARY KEY (label, p)
+);
+CREATE INDEX IF NOT EXISTS eigenvalues_p ON eigenvalues (p);
+CREATE TABLE IF NOT EXISTS coverage (
+    weight    INTEGER NOT NULL,
+    level_min INTEGER NOT NULL,
+    level_max INTEGER NOT NULL,
+    is_cm     INTEGER,              -- NULL: all forms, 0: non-CM, 1: CM only
+    source    TEXT
+);
+"""
+
+
+# ---------------------------------------------------------------------------
+# Record parsing
+# ---------------------------------------------------------------------------
+
+def _primes_up_to(n: int) -> List[int]:
+    """Sieve of Eratosthenes — return all primes ≤ n."""
+    if n < 2:
+        return []
+    sieve = bytearray([1] * (n + 1))
+    sieve[0] = sieve[1] = 0
+    for i in range(2, int(n ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytearray(len(sieve[i * i :: i]))
+    return [i for i in range(2, n + 1) if sieve[i]]
+
+
+def parse_label(label: str) -> Optional[Tuple[int, int, str]]:
+    """Return (level, weight, char_orbit) from an LMFDB label N.k.c.x, else None."""
+    m = _LABEL_RE.match(label or "")
+    if m is None:
+        return None
+    return int(m.group(1)), int(m.group(2)), m.group(3)
+
+
+def _real_value(val: Any) -> Optional[float]:
+    """Rational value, or the first real embedding of an algebraic one."""
+    if isinstance(val, bool):
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+    if isinstance(val, list) and val and isinstance(val[0], (int, float)):
+        return float(val[0])
+    return None
+
+
+def eigenvalues_from_record(
+    record: Dict[str, Any],
+    bound: int = PRIME_BOUND,
+    prime_hint: Optional[int] = None,
+) -> Dict[int, float]:
+    """
+    Collect {p: a_p} for primes p ≤ bound from one record.
+
+    Understands the LMFDB prime-indexed fields, the 'an' coefficient list,
+    "a_<p>" keys written by the search scripts, and a bare "a_p" value when
+    the enclosing object names the prime (prime_hint).
+    """
+    primes = _primes_up_to(bound)
+    prime_set = set(primes)
+    out: Dict[int, float] = {}
+
+    an = record.get("an")
+    if isinstance(an, list):
+        for p in primes:
+            if p > len(an):
+                break
+            val = _real_value(an[p - 1])
+            if val is not None:
+                out[p] = val
+
+    for field in _PRIME_INDEXED_FIELDS:
+        eigs = record.get(field)
+        if isinstance(eigs, list):
+            for p, val in zip(primes, eigs):
+                val = _real_value(val)
+                if val is not None:
+                    out[p] = val
+
+    for key, val in record.items():
+        m = _A_P_KEY_RE.match(key)
+        if m and int(m.group(1)) in prime_set:
+            val = _real_value(val)
+            if val is not None:
+                out[int(m.group(1))] = val
+
+    if prime_hint is not None and "a_p" in record:
+        val = _real_value(record["a_p"])
+        if val is not None:
+            out[int(prime_hint)] = val
+    return out
+
+
+def _form_row(record: Dict[str, Any], source: str) -> Optional[Tuple]:
+    label = record.get("label")
+    if not isinstance(label, str):
+        return None
+    parsed = parse_label(label)
+    level = record.get("level")
+    weight = record.get("weight")
+    char_label = record.get("char_orbit_label")
+    if parsed is not None:
+        level = level if isinstance(level, int) else parsed[0]
+        weight = weight if isinstance(weight, int) else parsed[1]
+        char_label = char_label or parsed[2]
+    if not isinstance(level, int) or not isinstance(weight, int):
+        return None
+    is_cm = record.get("is_cm")
+    cm_disc = record.get("cm_disc")
+    return (
+        label, level, weight, char_label,
+        None if is_cm is None else int(bool(is_cm)),
+        cm_disc if isinstance(cm_disc, int) else None,
+        source,
+    )
+
+
+def api_dump_records(doc: Any) -> Optional[List[Dict[str, Any]]]:
+    """
+    Top-level records of a raw LMFDB API dump, or None for any other document.
+
+    Accepts {"data": [...]}, {"results": [...]} and a bare list of records.
+    """
+    if isinstance(doc, dict):
+        doc = doc.get("data", doc.get("results"))
+    if isinstance(doc, list) and all(isinstance(rec, dict) for rec in doc):
+        return doc
+    return None
+
+
+def iter_form_records(obj: Any, prime: Optional[int] = None) -> Iterator[Tuple[Dict, Optional[int]]]:
+    """
+    Walk a JSON document and yield (record, prime_hint) for every labelled dict.
+
+    prime_hint is the nearest enclosing "prime" entry, used for records that
+    store a bare "a_p".
+    """
+    if isinstance(obj, dict):
+        if isinstance(obj.get("prime"), int):
+            prime = obj["prime"]
+        if isinstance(obj.get("label"), str):
+            yield obj, prime
+        for val in obj.values():
+            if isinstance(val, (dict, list)):
+                yield from iter_form_records(val, prime)
+    elif isinstance(obj, list):
+        for val in obj:
+            if isinstance(val, (dict, list)):
+                yield from iter_form_records(val, prime)
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class NewformStore:
+    """
+    SQLite-backed newform eigenvalue store.
+
+    Opening a path creates the schema if needed; a store written with a
+    different SCHEMA_VERSION raises RuntimeError (re-import the dumps).
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        if row is None:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+        elif int(row[0]) != SCHEMA_VERSION:
+            self._conn.close()
+            raise RuntimeError(
+                f"{path}: newform store schema v{row[0]}, expected v{SCHEMA_VERSION}; "
+                "delete it and re-import the JSON dumps"
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "NewformStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -- import -------------------------------------------------------------
+
+    def add_records(
+        self,
+        records: Iterable[Any],
+        source: str = "",
+        bound: int = PRIME_BOUND,
+    ) -> Tuple[int, int]:
+        """
+        Insert records (dicts, or (dict, prime_hint) pairs) in one transaction.
+
+        Returns (forms_written, eigenvalues_written).
+        """
+        form_rows = []
+        eig_rows = []
+        for item in records:
+            record, hint = item if isinstance(item, tuple) else (item, None)
+            row = _form_row(record, source)
+            if row is None:
+                continue
+            form_rows.append(row)
+            for p, val in eigenvalues_from_record(record, bound, hint).items():
+                eig_rows.append((row[0], p, val))
+
+        with self._conn:
+            # Keep known metadata when a later, sparser record is imported.
+            self._conn.executemany(
+                """
+                INSERT INTO forms (label, level, weight, char_label, is_cm, cm_disc, source)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (label) DO UPDATE SET
+                    char_label = COALESCE(excluded.char_label, char_label),
+                    is_cm      = COALESCE(excluded.is_cm, is_cm),
+                    cm_disc    = COALESCE(excluded.cm_disc, cm_disc),
+                    source     = excluded.source
+                """,
+                form_rows,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO eigenvalues (label, p, a_p) VALUES (?, ?, ?)",
+                eig_rows,
+            )
+        return len(form_rows), len(eig_rows)
+
+    def import_json(self, path: str, bound: int = PRIME_BOUND) -> Tuple[int, int]:
+        """Import every labelled record found in a JSON file."""
+        with open(path, "r", encoding="utf-8") as fh:
+            doc = json.load(fh)
+        return self.add_records(iter_form_records(doc), os.path.basename(path), bound)
+
+    # -- coverage -----------------------------------------------------------
+
+    def add_coverage(
+        self,
+        weight: int,
+        level_min: int,
+        level_max: int,
+        is_cm: Optional[bool] = None,
+        source: str = "",
+    ) -> None:
+        """Record that every form matching this query is in the store."""
+        if self.covers(weight, level_min, level_max, is_cm):
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO coverage (weight, level_min, level_max, is_cm, source) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (weight, level_min, level_max,
+                 None if is_cm is None else int(bool(is_cm)), source),
+            )
+
+    def covers(
+        self,
+        weight: int,
+        level_min: int,
+        level_max: int,
+        is_cm: Optional[bool] = None,
+    ) -> bool:
+        """
+        True if one recorded complete query contains this one.
+
+        A query without CM filter is only covered by an unfiltered one; a
+        CM / non-CM query is covered by the same filter or by no filter.
+        """
+        sql = ("SELECT 1 FROM coverage WHERE weight = ? "
+               "AND level_min <= ? AND level_max >= ?")
+        args: List[Any] = [weight, level_min, level_max]
+        if is_cm is None:
+            sql += " AND is_cm IS NULL"
+        else:
+            sql += " AND (is_cm IS NULL OR is_cm = ?)"
+            args.append(int(bool(is_cm)))
+        return self._conn.execute(sql + " LIMIT 1", args).fetchone() is not None
+
+    def coverage(self) -> List[Dict[str, Any]]:
+        """Recorded complete queries ordered by (weight, level_min)."""
+        cur = self._conn.execute(
+            "SELECT weight, level_min, level_max, is_cm, source FROM coverage "
+            "ORDER BY weight, level_min, level_max"
+        )
+        keys = ("weight", "level_min", "level_max", "is_cm", "source")
+        out = []
+        for row in cur:
+            rec = dict(zip(keys, row))
+            if rec["is_cm"] is not None:
+                rec["is_cm"] = bool(rec["is_cm"])
+            out.append(rec)
+        return out
+
+    def add_query_result(
+        self,
+        records: Iterable[Dict[str, Any]],
+        weight: int,
+        level_min: int,
+        level_max: int,
+        is_cm: Optional[bool] = None,
+        source: str = "",
+        bound: int = PRIME_BOUND,
+    ) -> Tuple[int, int]:
+        """
+        Import the complete answer to one LMFDB query and record its coverage.
+
+        Only call this for a fetch that returned every page; partial answers
+        go through add_records.  Returns (forms_written, eigenvalues_written).
+        """
+        written = self.add_records(records, source, bound)
+        self.add_coverage(weight, level_min, level_max, is_cm, source)
+        return written
+
+    def import_api_dumps(
+        self,
+        paths: Sequence[str],
+        weight: int,
+        level_min: int,
+        level_max: int,
+        is_cm: Optional[bool] = None,
+        bound: int = PRIME_BOUND,
+    ) -> Tuple[int, int]:
+        """
+        Import raw API dumps that together answer one query, with coverage.
+
+        Raises ValueError if a file is not a raw API dump (result files never
+        count as coverage) or holds a form outside the declared query.
+        """
+        records: List[Dict[str, Any]] = []
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as fh:
+                dump = api_dump_records(json.load(fh))
+            if dump is None:
+                raise ValueError(f"{path}: not a raw LMFDB API dump")
+            for rec in dump:
+                row = _form_row(rec, "")
+                if row is not None and (row[2] != weight
+                                        or not level_min <= row[1] <= level_max):
+                    raise ValueError(
+                        f"{path}: {row[0]} is outside weight {weight}, "
+                        f"level {level_min}..{level_max}"
+                    )
+            records.extend(dump)
+        source = ",".join(os.path.basename(path) for path in paths)
+        return self.add_query_result(records, weight, level_min, level_max,
+                                     is_cm, source, bound)
+
+    # -- queries ------------------------------------------------------------
+
+    @staticmethod
+    def _where(
+        weight: Optional[int],
+        level_min: Optional[int],
+        level_max: Optional[int],
+        is_cm: Optional[bool],
+    ) -> Tuple[str, List[Any]]:
+        clauses = []
+        args: List[Any] = []
+        if weight is not None:
+            clauses.append("weight = ?")
+            args.append(weight)
+        if level_min is not None:
+            clauses.append("level >= ?")
+            args.append(level_min)
+        if level_max is not None:
+            clauses.append("level <= ?")
+            args.append(level_max)
+        if is_cm is not None:
+            cm = "(COALESCE(is_cm, 0) = 1 OR COALESCE(cm_disc, 0) != 0)"
+            clauses.append(cm if is_cm else f"NOT {cm}")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def forms(
+        self,
+        weight: Optional[int] = None,
+        level_min: Optional[int] = None,
+        level_max: Optional[int] = None,
+        is_cm: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """Form metadata ordered by (level, label)."""
+        where, args = self._where(weight, level_min, level_max, is_cm)
+        cur = self._conn.execute(
+            "SELECT label, level, weight, char_label, is_cm, cm_disc, source "
+            f"FROM forms{where} ORDER BY level, label",
+            args,
+        )
+        keys = ("label", "level", "weight", "char_orbit_label", "is_cm", "cm_disc", "source")
+        out = []
+        for row in cur:
+            rec = dict(zip(keys, row))
+            if rec["is_cm"] is not None:
+                rec["is_cm"] = bool(rec["is_cm"])
+            out.append(rec)
+        return out
+
+    def records(
+        self,
+        weight: Optional[int] = None,
+        level_min: Optional[int] = None,
+        level_max: Optional[int] = None,
+        primes: Optional[Sequence[int]] = None,
+        is_cm: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Form metadata plus "a_p": {p: a_p} (all stored primes, or `primes`).
+        """
+        recs = self.forms(weight, level_min, level_max, is_cm)
+        by_label = {rec["label"]: rec for rec in recs}
+        for rec in recs:
+            rec["a_p"] = {}
+        where, args = self._where(weight, level_min, level_max, is_cm)
+        sql = ("SELECT e.label, e.p, e.a_p FROM eigenvalues e "
+               f"JOIN (SELECT label FROM forms{where}) f ON e.label = f.label")
+        if primes is not None:
+            primes = list(primes)
+            sql += f" WHERE e.p IN ({','.join('?' * len(primes))})"
+            args += primes
+        for label, p, a_p in self._conn.execute(sql, args):
+            by_label[label]["a_p"][p] = a_p
+        return recs
+
+    def cached_records(
+        self,
+        weight: int,
+        level_min: int,
+        level_max: int,
+        primes: Optional[Sequence[int]] = None,
+        is_cm: Optional[bool] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        records(...) if a recorded complete query covers this one, else None.
+
+        This is the only store lookup that may replace an LMFDB fetch.
+        """
+        if not self.covers(weight, level_min, level_max, is_cm):
+            return None
+        return self.records(weight, level_min, level_max, primes, is_cm)
+
+    def a_p(self, label: str, p: int) -> Optional[float]:
+        """a_p for one form, or None if not stored."""
+        row = self._conn.execute(
+            "SELECT a_p FROM eigenvalues WHERE label = ? AND p = ?", (label, p)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def eigenvalue_table(
+        self,
+        weight: int,
+        p: int,
+        level_min: Optional[int] = None,
+        level_max: Optional[int] = None,
+        is_cm: Optional[bool] = None,
+    ) -> List[Tuple[str, int, float]]:
+        """(label, level, a_p) for every form of the given weight with a stored a_p."""
+        where, args = self._where(weight, level_min, level_max, is_cm)
+        cur = self._conn.execute(
+            "SELECT f.label, f.level, e.a_p FROM eigenvalues e "
+            f"JOIN (SELECT label, level FROM forms{where}) f ON e.label = f.label "
+            "WHERE e.p = ? ORDER BY f.level, f.label",
+            args + [p],
+        )
+        return cur.fetchall()
+
+    def counts(self) -> Dict[int, Tuple[int, int]]:
+        """{weight: (n_forms, n_eigenvalues)}."""
+        out: Dict[int, Tuple[int, int]] = {}
+        for weight, n in self._conn.execute(
+            "SELECT weight, COUNT(*) FROM forms GROUP BY weight"
+        ):
+            out[weight] = (n, 0)
+        for weight, n in self._conn.execute(
+            "SELECT f.weight, COUNT(*) FROM eigenvalues e "
+            "JOIN forms f ON e.label = f.label GROUP BY f.weight"
+        ):
+            out[weight] = (out.get(weight, (0, 0))[0], n)
+        return out
+
+
+def open_default_store(path: Optional[str] = None) -> Optional[NewformStore]:
+    """
+    Open `path`, or DEFAULT_STORE_PATH if it already exists; else return None.
+
+    Used by the search scripts: an explicit --store path is always opened
+    (and created), the default one only when an import has been done.  The
+    scripts still fetch from the LMFDB unless cached_records() finds coverage.
+    """
+    if path:
+        return NewformStore(path)
+    if os.path.exists(DEFAULT_STORE_PATH):
+        return NewformStore(DEFAULT_STORE_PATH)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+def _parse_range(text: str) -> Tuple[Optional[int], Optional[int]]:
+    """Parse an LMFDB-style range 'lo..hi' (either side optional) or a single N."""
+    if ".." in text:
+        lo, hi = text.split("..", 1)
+        return (int(lo) if lo else None), (int(hi) if hi else None)
+    return int(text), int(text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline newform eigenvalue store.")
+    parser.add_argument("--store", default=DEFAULT_STORE_PATH,
+                        help=f"SQLite file (default: {DEFAULT_STORE_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_imp = sub.add_parser("import", help="bulk import JSON dumps / result files")
+    p_imp.add_argument("files", nargs="+")
+    p_imp.add_argument("--bound", type=int, default=PRIME_BOUND,
+                       help=f"keep a_p for p ≤ bound (default: {PRIME_BOUND})")
+    p_imp.add_argument("--weight", type=int, default=None,
+                       help="declare the files a complete API answer for this "
+                            "weight (requires --level; records coverage)")
+    p_imp.add_argument("--level", default=None, help="level range lo..hi of that query")
+    p_imp.add_argument("--non-cm", action="store_true",
+                       help="the query was restricted to non-CM forms")
+
+    p_q = sub.add_parser("query", help="list a_p for one weight and prime")
+    p_q.add_argument("--weight", type=int, required=True)
+    p_q.add_argument("--prime", type=int, default=137)
+    p_q.add_argument("--level", default="..", help="level range lo..hi")
+    p_q.add_argument("--non-cm", action="store_true")
+
+    sub.add_parser("info", help="form / eigenvalue counts per weight")
+    args = parser.parse_args()
+    if args.command == "import" and (args.weight is None) != (args.level is None):
+        parser.error("--weight and --level must be given together")
+
+    with NewformStore(args.store) as store:
+        if args.command == "import" and args.weight is not None:
+            lo, hi = _parse_range(args.level)
+            if lo is None or hi is None:
+                parser.error("--level needs both bounds, e.g. 1..200")
+            try:
+                n_forms, n_eigs = store.import_api_dumps(
+                    args.files, args.weight, lo, hi,
+                    is_cm=False if args.non_cm else None, bound=args.bound,
+                )
+            except ValueError as exc:
+                parser.error(str(exc))
+            print(f"  {n_forms} forms, {n_eigs} eigenvalues; "
+                  f"coverage k={args.weight}, N={lo}..{hi}")
+        elif args.command == "import":
+            for path in args.files:
+                n_forms, n_eigs = store.import_json(path, args.bound)
+                print(f"  {path}: {n_forms} forms, {n_eigs} eigenvalues")
+        elif args.command == "query":
+            lo, hi = _parse_range(args.level)
+            rows = store.eigenvalue_table(args.weight, args.prime, lo, hi,
+                                          is_cm=False if args.non_cm else None)
+            for label, level, a_p in rows:
+                print(f"  {label:15s}  N={level:<5d}  a_{args.prime} = {a_p:g}")
+            print(f"  {len(rows)} form(s)")
+        else:
+            for weight, (n_forms, n_eigs) in sorted(store.counts().items()):
+                print(f"  k={weight}: {n_forms} forms, {n_eigs} eigenvalues")
+            for cov in store.coverage():
+                cm = {None: "all", False: "non-CM", True: "CM"}[cov["is_cm"]]
+                print(f"  covered: k={cov['weight']}, N={cov['level_min']}..{cov['level_max']}, "
+                      f"{cm} ({cov['source']})")
+
+
+if __name__ == "__main__":
+    main()
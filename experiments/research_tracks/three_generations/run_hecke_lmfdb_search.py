@@ -21,6 +21,14 @@ HOW TO RUN:
     python run_hecke_lmfdb_search.py
     → saves hecke_lmfdb_results.json
 
+  Offline — from saved API dumps (newform_store.py):
+    python newform_store.py import --weight 2 --level 1..200 dump_k2.json
+    python newform_store.py import --weight 4 --level 1..50 dump_k4.json
+    python newform_store.py import --weight 6 --level 50..500 --non-cm dump_k6.json
+    python run_hecke_lmfdb_search.py
+    → queries covered by a complete dump (or an earlier complete fetch)
+      are not fetched again; imported result files never skip a fetch
+
   Option B — SageMath (run_hecke_sage.py):
     Online: go to https://sagecell.sagemath.org/
             paste the contents of run_hecke_sage.py
@@ -53,6 +61,13 @@ import sys
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from hecke_ratio_index import find_ratio_triples  # noqa: E402
+from newform_store import NewformStore, open_default_store  # noqa: E402
+
 try:
     import requests
     _HAS_REQUESTS = True
@@ -116,8 +131,17 @@ def _extract_a_p_from_record(record: Dict[str, Any], p_idx: int) -> Optional[flo
       'hecke_eigs'          : same as 'hecke_eigenvalues' in mf_hecke_nf table.
       'eigenvalues'         : alternative name seen in some API versions.
 
+      'a_p'                 : {p: a_p} mapping on records from newform_store.
+
     We try all known formats and return the float value if found.
     """
+    # --- Format 0: offline store record ---
+    stored = record.get("a_p")
+    if isinstance(stored, dict) and p_idx < len(PRIMES_TO_P):
+        val = stored.get(PRIMES_TO_P[p_idx])
+        if val is not None:
+            return float(val)
+
     # --- Format 1: hecke_eigenvalues / hecke_eigs / eigenvalues (prime-indexed) ---
     for field in ("hecke_eigenvalues", "hecke_eigs", "eigenvalues"):
         eigs = record.get(field)
@@ -184,14 +208,16 @@ def _paginate(
     endpoint: str,
     base_params: Dict[str, Any],
     max_pages: int = 20,
-) -> Tuple[bool, List[Dict]]:
+) -> Tuple[bool, List[Dict], bool]:
     """
     Paginate through all results at `endpoint` using _limit / _offset.
-    Returns (network_ok, records).
+    Returns (network_ok, records, complete); complete is False if a page
+    failed or max_pages was reached before the last page.
     """
     records: List[Dict] = []
     offset = 0
     network_ok = False
+    complete = False
 
     for page_num in range(max_pages):
         params = {**base_params, "_limit": PAGE_LIMIT, "_offset": offset, "_format": "json"}
@@ -210,10 +236,55 @@ def _paginate(
         # Check if there are more pages
         total = data.get("count") or data.get("total") or 0
         if len(page) < PAGE_LIMIT or (total and offset + PAGE_LIMIT >= total):
+            complete = True
             break
         offset += PAGE_LIMIT
 
-    return network_ok, records
+    return network_ok, records, complete
+
+
+def _from_store(
+    store: Optional[NewformStore],
+    weight: int,
+    level_min: int,
+    level_max: int,
+    is_cm: Optional[bool] = None,
+) -> Optional[List[Dict]]:
+    """
+    Return stored records for a query (offline), or None unless the store
+    holds a complete earlier answer covering it (see NewformStore.covers).
+    """
+    if store is None:
+        return None
+    records = store.cached_records(weight, level_min, level_max, primes=[P], is_cm=is_cm)
+    if records is None:
+        return None
+    print(f"  [STORE] {len(records)} weight-{weight} records from {store.path} (no network).")
+    return records
+
+
+def _save_to_store(
+    store: Optional[NewformStore],
+    records: List[Dict],
+    complete: bool,
+    weight: int,
+    level_min: int,
+    level_max: int,
+    is_cm: Optional[bool] = None,
+) -> None:
+    """
+    Import freshly fetched API records so the next run can stay offline.
+
+    Only a complete, non-empty answer is recorded as coverage for the query;
+    partial fetches are stored but never served in place of a fetch.
+    """
+    if store is None or not records:
+        return
+    if complete:
+        store.add_query_result(records, weight, level_min, level_max, is_cm,
+                               source=LMFDB_BASE)
+    else:
+        store.add_records(records, source=LMFDB_BASE)
 
 
 # ---------------------------------------------------------------------------
@@ -252,7 +323,7 @@ def _fetch_a_p_from_hecke_nf(label: str) -> Optional[float]:
 # Step 1: Fetch weight-2 newforms, level ≤ 200
 # ---------------------------------------------------------------------------
 
-def fetch_k2_forms() -> Tuple[bool, List[Dict]]:
+def fetch_k2_forms(store: Optional[NewformStore] = None) -> Tuple[bool, List[Dict]]:
     """
     Query LMFDB for weight-2 newforms at levels 1..200.
 
@@ -261,15 +332,22 @@ def fetch_k2_forms() -> Tuple[bool, List[Dict]]:
     Note: Many weight-2 forms have rational (integer) Hecke eigenvalues and
     LMFDB stores them directly in 'hecke_eigenvalues'.  Algebraic eigenvalues
     (higher-dimensional Galois orbits) are stored as lists of embeddings.
+
+    If `store` holds a complete earlier answer covering this query it is
+    used instead of the API; API results are imported into `store`.
     """
     print("\n[STEP 1] Fetching weight-2 newforms, N ≤ 200 ...")
+    cached = _from_store(store, 2, 1, 200)
+    if cached is not None:
+        return True, cached
     endpoint = f"{LMFDB_BASE}/mf_newforms/"
     params = {
         "weight": 2,
         "level": "1..200",
         "_fields": "label,level,weight,hecke_eigenvalues,an,an_normalization,is_cm,cm_disc",
     }
-    ok, records = _paginate(endpoint, params)
+    ok, records, complete = _paginate(endpoint, params)
+    _save_to_store(store, records, complete, 2, 1, 200)
     print(f"  → {len(records)} weight-2 records retrieved.")
     return ok, records
 
@@ -278,20 +356,24 @@ def fetch_k2_forms() -> Tuple[bool, List[Dict]]:
 # Step 2: Fetch / verify weight-4 newforms, level ≤ 50
 # ---------------------------------------------------------------------------
 
-def fetch_k4_forms() -> Tuple[bool, List[Dict]]:
+def fetch_k4_forms(store: Optional[NewformStore] = None) -> Tuple[bool, List[Dict]]:
     """
     Query LMFDB for weight-4 newforms at levels 1..50.
     We already know 4.4.a.a, 5.4.a.a, 6.4.a.a from the local search;
     this call verifies them via the API and extends to the full level range.
     """
     print("\n[STEP 2] Fetching weight-4 newforms, N ≤ 50 ...")
+    cached = _from_store(store, 4, 1, 50)
+    if cached is not None:
+        return True, cached
     endpoint = f"{LMFDB_BASE}/mf_newforms/"
     params = {
         "weight": 4,
         "level": "1..50",
         "_fields": "label,level,weight,hecke_eigenvalues,an,an_normalization,is_cm,cm_disc",
     }
-    ok, records = _paginate(endpoint, params)
+    ok, records, complete = _paginate(endpoint, params)
+    _save_to_store(store, records, complete, 4, 1, 50)
     print(f"  → {len(records)} weight-4 records retrieved.")
     return ok, records
 
@@ -300,7 +382,7 @@ def fetch_k4_forms() -> Tuple[bool, List[Dict]]:
 # Step 3: Fetch weight-6 NON-CM newforms, level 50–500
 # ---------------------------------------------------------------------------
 
-def fetch_k6_nonCM_forms() -> Tuple[bool, List[Dict]]:
+def fetch_k6_nonCM_forms(store: Optional[NewformStore] = None) -> Tuple[bool, List[Dict]]:
     """
     Query LMFDB for weight-6 NON-CM newforms at levels 50..500.
 
@@ -318,6 +400,9 @@ def fetch_k6_nonCM_forms() -> Tuple[bool, List[Dict]]:
     checking record['is_cm'] == False or record['cm_disc'] == 0.
     """
     print("\n[STEP 3] Fetching weight-6 NON-CM newforms, N ∈ [50, 500] ...")
+    cached = _from_store(store, 6, 50, 500, is_cm=False)
+    if cached is not None:
+        return True, cached
     endpoint = f"{LMFDB_BASE}/mf_newforms/"
 
     # Try with CM filter (preferred — reduces data transfer)
@@ -327,7 +412,8 @@ def fetch_k6_nonCM_forms() -> Tuple[bool, List[Dict]]:
         "cm_disc": 0,           # 0 = not CM in LMFDB schema
         "_fields": "label,level,weight,hecke_eigenvalues,an,an_normalization,is_cm,cm_disc",
     }
-    ok, records = _paginate(endpoint, params)
+    ok, records, complete = _paginate(endpoint, params)
+    _save_to_store(store, records, complete, 6, 50, 500, is_cm=False)
 
     if ok and records:
         print(f"  → {len(records)} weight-6 records (cm_disc=0 filter applied).")
@@ -340,7 +426,8 @@ def fetch_k6_nonCM_forms() -> Tuple[bool, List[Dict]]:
             "level": "50..500",
             "_fields": "label,level,weight,hecke_eigenvalues,an,an_normalization,is_cm,cm_disc",
         }
-        ok, all_records = _paginate(endpoint, params_nofilt)
+        ok, all_records, complete = _paginate(endpoint, params_nofilt)
+        _save_to_store(store, all_records, complete, 6, 50, 500)
         # Filter: keep only non-CM forms
         records = [
             r for r in all_records
@@ -362,10 +449,11 @@ def get_a_p(record: Dict[str, Any]) -> Optional[float]:
     Tries in order:
       1. 'hecke_eigenvalues' / 'hecke_eigs' / 'eigenvalues' (prime-indexed list)
       2. 'an' (Dirichlet coefficient list, index 136)
-      3. mf_hecke_nf API endpoint (per-label fallback)
+      3. mf_hecke_nf API endpoint (per-label fallback; skipped for records
+         from the offline store, which already hold every known a_p)
     """
     val = _extract_a_p_from_record(record, P_INDEX)
-    if val is not None:
+    if val is not None or isinstance(record.get("a_p"), dict):
         return val
 
     # Fallback: fetch from dedicated Hecke table
@@ -436,42 +524,33 @@ def find_triples(
     if injected:
         print(f"  Injected {injected} known k=4 form(s) not returned by API.")
 
-    candidates: List[Dict] = []
+    # Sorted-|a_137| windows: O(n log n + matches) instead of |e2|·|e4|·|e6|
+    matches = find_ratio_triples(
+        e2, e4, e6, lambda rec: rec["a_137"],
+        MU_RATIO, TAU_RATIO, [tolerance],
+        min_abs0=1.0,  # avoid near-zero denominators
+    )[tolerance]
 
-    for f0 in e2:
-        abs0 = abs(f0["a_137"])
-        if abs0 < 1.0:
-            continue  # avoid near-zero denominators
-
-        for f1 in e4:
-            ratio_mu = abs(f1["a_137"]) / abs0
-            err_mu   = abs(ratio_mu - MU_RATIO) / MU_RATIO
-            if err_mu > tolerance:
-                continue  # early exit
-
-            for f2 in e6:
-                ratio_tau = abs(f2["a_137"]) / abs0
-                err_tau   = abs(ratio_tau - TAU_RATIO) / TAU_RATIO
-                if err_tau > tolerance:
-                    continue
-
-                print(
-                    f"  *** CANDIDATE FOUND ***\n"
-                    f"    f0(k=2): {f0['label']}  a_137={f0['a_137']}\n"
-                    f"    f1(k=4): {f1['label']}  a_137={f1['a_137']}\n"
-                    f"    f2(k=6): {f2['label']}  a_137={f2['a_137']}\n"
-                    f"    ratio_μ = {ratio_mu:.5f}  (target {MU_RATIO:.5f}, err {err_mu:.2%})\n"
-                    f"    ratio_τ = {ratio_tau:.4f}  (target {TAU_RATIO:.4f}, err {err_tau:.2%})"
-                )
-                candidates.append({
-                    "f0":        {"label": f0["label"], "level": f0["level"], "a_137": f0["a_137"]},
-                    "f1":        {"label": f1["label"], "level": f1["level"], "a_137": f1["a_137"]},
-                    "f2":        {"label": f2["label"], "level": f2["level"], "a_137": f2["a_137"]},
-                    "ratio_mu":  ratio_mu,
-                    "ratio_tau": ratio_tau,
-                    "error_mu":  err_mu,
-                    "error_tau": err_tau,
-                })
+    candidates: List[Dict] = []
+    for m in matches:
+        f0, f1, f2 = m.f0, m.f1, m.f2
+        print(
+            f"  *** CANDIDATE FOUND ***\n"
+            f"    f0(k=2): {f0['label']}  a_137={f0['a_137']}\n"
+            f"    f1(k=4): {f1['label']}  a_137={f1['a_137']}\n"
+            f"    f2(k=6): {f2['label']}  a_137={f2['a_137']}\n"
+            f"    ratio_μ = {m.ratio_mu:.5f}  (target {MU_RATIO:.5f}, err {m.err_mu:.2%})\n"
+            f"    ratio_τ = {m.ratio_tau:.4f}  (target {TAU_RATIO:.4f}, err {m.err_tau:.2%})"
+        )
+        candidates.append({
+            "f0":        {"label": f0["label"], "level": f0["level"], "a_137": f0["a_137"]},
+            "f1":        {"label": f1["label"], "level": f1["level"], "a_137": f1["a_137"]},
+            "f2":        {"label": f2["label"], "level": f2["level"], "a_137": f2["a_137"]},
+            "ratio_mu":  m.ratio_mu,
+            "ratio_tau": m.ratio_tau,
+            "error_mu":  m.err_mu,
+            "error_tau": m.err_tau,
+        })
 
     return candidates
 
@@ -585,7 +664,16 @@ def main() -> None:
         default=TOLERANCE,
         help=f"Relative tolerance for ratio matching (default: {TOLERANCE})",
     )
+    parser.add_argument(
+        "--store",
+        default=None,
+        help="Offline newform store (SQLite, see newform_store.py).  Queries "
+             "covered by a complete stored answer are not re-fetched; fetched "
+             "forms are imported.  Default: "
+             "newform_store.sqlite next to this script, if it exists.",
+    )
     args = parser.parse_args()
+    store = open_default_store(args.store)
 
     if not _HAS_REQUESTS:
         print(
@@ -613,9 +701,11 @@ def main() -> None:
     print()
 
     # --- Fetch forms ---
-    ok2, k2_forms = fetch_k2_forms()
-    ok4, k4_forms = fetch_k4_forms()
-    ok6, k6_forms = fetch_k6_nonCM_forms()
+    ok2, k2_forms = fetch_k2_forms(store)
+    ok4, k4_forms = fetch_k4_forms(store)
+    ok6, k6_forms = fetch_k6_nonCM_forms(store)
+    if store is not None:
+        store.close()
 
     # --- Verify known k=4 forms via API ---
     print("\n[STEP 2b] Verifying known k=4 forms via API ...")
@@ -23,6 +23,7 @@ automatically to Approach A (search_hecke_lmfdb_local.py).
 Run with:
     python search_hecke_lmfdb_api.py
     python search_hecke_lmfdb_api.py --max-level 500 --output results.json
+    python search_hecke_lmfdb_api.py --store newform_store.sqlite   # offline if covered
 """
 
 from __future__ import annotations
@@ -37,6 +38,13 @@ import urllib.parse
 import urllib.request
 from typing import Any, Dict, List, Optional, Tuple
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from hecke_ratio_index import EigenvalueIndex, iter_ratio_triples  # noqa: E402
+from newform_store import NewformStore, open_default_store  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Physical constants (CODATA 2022 / PDG 2022) — same as local script
 # ---------------------------------------------------------------------------
@@ -48,6 +56,7 @@ P = 137                    # UBT prime
 # LMFDB API base URL
 LMFDB_API = "https://www.lmfdb.org/api/mf_newforms/"
 TIMEOUT    = 15            # seconds per HTTP request
+QUERY_LIMIT = 500          # records per request; a full page may be truncated
 
 
 # ---------------------------------------------------------------------------
@@ -70,23 +79,40 @@ def lmfdb_query(params: Dict[str, Any], timeout: int = TIMEOUT) -> Optional[Dict
         return None
 
 
-def fetch_newforms_for_weight(weight: int, max_level: int) -> Tuple[bool, List[Dict]]:
+def fetch_newforms_for_weight(
+    weight: int,
+    max_level: int,
+    store: Optional[NewformStore] = None,
+) -> Tuple[bool, List[Dict]]:
     """
     Query LMFDB for all newforms with given weight and level ≤ max_level.
     Returns (network_ok, list_of_records).
     Each record is a LMFDB mf_newforms dict (or a minimal synthetic dict on failure).
+
+    If `store` holds a complete earlier answer covering this query it is
+    returned without network access; API results are imported into `store`,
+    as coverage only when the answer was shorter than QUERY_LIMIT.
     """
+    if store is not None:
+        cached = store.cached_records(weight, 1, max_level, primes=[P])
+        if cached is not None:
+            return True, cached
     params = {
         "weight": weight,
         "level": f"1..{max_level}",
         "_fields": "label,level,weight,hecke_eigenvalues,an_normalization,char_labels",
         "_format": "json",
-        "_limit": 500,
+        "_limit": QUERY_LIMIT,
     }
     data = lmfdb_query(params)
     if data is None:
         return False, []
     records = data.get("data", data.get("results", []))
+    if store is not None and records:
+        if len(records) < QUERY_LIMIT:
+            store.add_query_result(records, weight, 1, max_level, source=LMFDB_API)
+        else:
+            store.add_records(records, source=LMFDB_API)
     return True, records
 
 
@@ -105,6 +131,12 @@ def extract_a_p(record: Dict, p: int) -> Optional[float]:
     representing the minimal polynomial or an embedding).  We return the
     real embedding if available, else None.
     """
+    stored = record.get("a_p")
+    if isinstance(stored, dict):
+        # Record from newform_store: {p: a_p}
+        val = stored.get(p)
+        return None if val is None else float(val)
+
     eigs = record.get("hecke_eigenvalues") or record.get("hecke_orbit_code")
     if eigs is None:
         return None
@@ -139,49 +171,15 @@ def _primes_up_to(n: int) -> List[int]:
     return [i for i in range(2, n + 1) if sieve[i]]
 
 
-# ---------------------------------------------------------------------------
-# Ratio checker
-# ---------------------------------------------------------------------------
-
-def check_triple(
-    f0: Dict,
-    f1: Dict,
-    f2: Dict,
-    target_mu: float,
-    target_tau: float,
-    tol: float,
-) -> Optional[Dict]:
-    """Return a candidate dict if the triple matches, else None."""
-    ap0 = extract_a_p(f0, P)
-    ap1 = extract_a_p(f1, P)
-    ap2 = extract_a_p(f2, P)
-    if ap0 is None or ap1 is None or ap2 is None:
-        return None
-    if ap0 == 0:
-        return None
-    abs0, abs1, abs2 = abs(ap0), abs(ap1), abs(ap2)
-    ratio_mu  = abs1 / abs0
-    ratio_tau = abs2 / abs0
-    err_mu    = abs(ratio_mu  - target_mu)  / target_mu
-    err_tau   = abs(ratio_tau - target_tau) / target_tau
-    if err_mu > tol or err_tau > tol:
-        return None
-    return {
-        "f0": {"label": f0.get("label"), "level": f0.get("level"), f"a_{P}": ap0},
-        "f1": {"label": f1.get("label"), "level": f1.get("level"), f"a_{P}": ap1},
-        "f2": {"label": f2.get("label"), "level": f2.get("level"), f"a_{P}": ap2},
-        "ratio_mu":  ratio_mu,
-        "ratio_tau": ratio_tau,
-        "err_mu":    err_mu,
-        "err_tau":   err_tau,
-    }
-
-
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
-def run_api_search(max_level: int = 500, tolerance: float = TOLERANCE) -> Dict:
+def run_api_search(
+    max_level: int = 500,
+    tolerance: float = TOLERANCE,
+    store: Optional[NewformStore] = None,
+) -> Dict:
     print(f"\n{'='*60}")
     print(f"HECKE EIGENVALUE SEARCH (LMFDB API)")
     print(f"  endpoint: {LMFDB_API}")
@@ -198,7 +196,7 @@ def run_api_search(max_level: int = 500, tolerance: float = TOLERANCE) -> Dict:
 
     for weight in (2, 4, 6):
         print(f"[API] Querying weight-{weight} newforms (N≤{max_level}) ...")
-        ok, records = fetch_newforms_for_weight(weight, max_level)
+        ok, records = fetch_newforms_for_weight(weight, max_level, store)
         if not ok:
             print(f"  ✗ Network failure or timeout for weight={weight}.")
             network_ok = False
@@ -240,31 +238,41 @@ def run_api_search(max_level: int = 500, tolerance: float = TOLERANCE) -> Dict:
     w4 = forms_by_weight.get(4, [])
     w6 = forms_by_weight.get(6, [])
 
+    # Extract a_P once per record (keyed by LMFDB label, which encodes the
+    # weight), then sort k=4 / k=6 forms by |a_P| so each f0 costs two binary
+    # searches instead of a |k4|·|k6| loop.
+    ap_cache = {r.get("label"): extract_a_p(r, P) for r in (*w2, *w4, *w6)}
+
+    def _a_p(record: Dict) -> Optional[float]:
+        return ap_cache[record.get("label")]
+
+    skipped_no_eig = sum(1 for f0 in w2 if not _a_p(f0))
+    w4_index = EigenvalueIndex(w4, _a_p)
+    w6_index = EigenvalueIndex(w6, _a_p)
+
     candidates = []
-    skipped_no_eig = 0
-    total_checked = 0
-
-    for f0 in w2:
-        ap0 = extract_a_p(f0, P)
-        if ap0 is None or ap0 == 0:
-            skipped_no_eig += 1
-            continue
-        for f1 in w4:
-            ap1 = extract_a_p(f1, P)
-            if ap1 is None:
-                continue
-            if abs(abs(ap1) / abs(ap0) - MU_RATIO) / MU_RATIO > tolerance:
-                continue
-            for f2 in w6:
-                total_checked += 1
-                c = check_triple(f0, f1, f2, MU_RATIO, TAU_RATIO, tolerance)
-                if c is not None:
-                    candidates.append(c)
+    stats: Dict[str, int] = {"mu_pairs": 0}
+    for m in iter_ratio_triples(w2, w4_index, w6_index, _a_p,
+                                MU_RATIO, TAU_RATIO, tolerance, stats=stats):
+        candidates.append({
+            "f0": {"label": m.f0.get("label"), "level": m.f0.get("level"), f"a_{P}": m.a0},
+            "f1": {"label": m.f1.get("label"), "level": m.f1.get("level"), f"a_{P}": m.a1},
+            "f2": {"label": m.f2.get("label"), "level": m.f2.get("level"), f"a_{P}": m.a2},
+            "ratio_mu":  m.ratio_mu,
+            "ratio_tau": m.ratio_tau,
+            "err_mu":    m.err_mu,
+            "err_tau":   m.err_tau,
+        })
+
+    # Same count as the nested-loop search: every (f0, f1) pair inside the
+    # μ window was evaluated against all k=6 forms.
+    total_checked = stats["mu_pairs"] * len(w6)
 
     verdict = "MATCH_FOUND" if candidates else "NO_MATCH_IN_SEARCH_SPACE"
 
     print(f"  Forms checked: k=2:{len(w2)}, k=4:{len(w4)}, k=6:{len(w6)}")
     print(f"  Triples fully evaluated: {total_checked}")
+    print(f"  Forms with a_{P}: k=4:{len(w4_index)}, k=6:{len(w6_index)}")
     if candidates:
         print(f"  *** {len(candidates)} CANDIDATE(S) FOUND ***")
         for c in candidates:
@@ -329,9 +337,21 @@ def main() -> None:
         default=TOLERANCE,
         help=f"Relative tolerance (default: {TOLERANCE})",
     )
+    parser.add_argument(
+        "--store",
+        default=None,
+        help="Offline newform store (SQLite, see newform_store.py); default: "
+             "newform_store.sqlite next to this script, if it exists",
+    )
     args = parser.parse_args()
 
-    output = run_api_search(max_level=args.max_level, tolerance=args.tolerance)
+    store = open_default_store(args.store)
+    try:
+        output = run_api_search(max_level=args.max_level, tolerance=args.tolerance,
+                                store=store)
+    finally:
+        if store is not None:
+            store.close()
 
     with open(args.output, "w") as fh:
         json.dump(output, fh, indent=2)
@@ -43,6 +43,14 @@ import os
 import sys
 from typing import Dict, List, Optional, Tuple
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from hecke_ratio_index import find_ratio_triples  # noqa: E402
+from eta_products import eta_product_coefficients  # noqa: E402
+from point_counting import hecke_eigenvalues_batch, hecke_eigenvalues_up_to  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Physical constants (CODATA 2022 / PDG 2022)
 # ---------------------------------------------------------------------------
@@ -109,34 +117,12 @@ def eta_product_qexp(
 
     Returns a list `coeffs` of length max_n+1 where coeffs[n] is the
     coefficient of q^n in the q-expansion (integer valued).
+
+    Each η(d z) series comes from Euler's pentagonal theorem and the factors
+    are combined by sparse NumPy multiplication (exact, cached per (d, r));
+    see eta_products.py.
     """
-    L_num = sum(r * d for d, r in divisor_exponent_pairs)
-    if L_num % 24 != 0:
-        return None                     # fractional leading power
-    leading = L_num // 24
-    if leading > max_n:
-        return None                     # starts beyond our range
-
-    # Compute ∏_d (1 - q^d)^{r_d}  up to degree M = max_n - leading
-    M = max_n - leading
-    poly = [0] * (M + 1)
-    poly[0] = 1
-
-    for d, r in divisor_exponent_pairs:
-        # η(d·z) = q^{d/24} · ∏_{k≥1}(1-q^{d·k})
-        # Multiply current poly by ∏_{k=1}^{M//d} (1-q^{d·k})^r
-        for k in range(1, M // d + 1):
-            factor = d * k
-            for _ in range(r):
-                for j in range(M, factor - 1, -1):
-                    poly[j] -= poly[j - factor]
-
-    # Shift by leading
-    coeffs = [0] * (max_n + 1)
-    for n in range(M + 1):
-        if n + leading <= max_n:
-            coeffs[n + leading] = poly[n]
-    return coeffs
+    return eta_product_coefficients(divisor_exponent_pairs, max_n)
 
 
 # ---------------------------------------------------------------------------
@@ -300,6 +286,76 @@ def verify_hecke_multiplicativity(
     return True
 
 
+def valid_weight2_curves(
+    max_level: int = 200,
+    verbose: bool = False,
+) -> List[Tuple[int, str, List[int]]]:
+    """
+    Entries of ELLIPTIC_CURVES_WEIGHT2 with conductor ≤ max_level whose
+    Weierstrass model passes the discriminant check.
+    """
+    curves = []
+    skipped_invalid = 0
+    for cond, label, weierstrass in ELLIPTIC_CURVES_WEIGHT2:
+        if cond > max_level:
+            continue
+        # Runtime validity check: discriminant prime factors ⊆ conductor prime factors
+        if not _is_valid_weierstrass(cond, weierstrass):
+            if verbose:
+                print(f"  [SKIP] {label}: Weierstrass model failed discriminant check "
+                      f"(Δ={_discriminant_weierstrass(*weierstrass)})")
+            skipped_invalid += 1
+            continue
+        curves.append((cond, label, weierstrass))
+    if skipped_invalid and verbose:
+        print(f"  [{skipped_invalid} models skipped due to invalid discriminant]")
+    return curves
+
+
+def curve_eigenvalue_table(
+    bound: int,
+    max_level: int = 200,
+) -> Tuple[List[int], Dict[str, Dict[int, int]]]:
+    """
+    a_p for every valid weight-2 curve and every prime p ≤ bound, in one
+    batched point-counting call.
+
+    Returns (primes, {label: {p: a_p}}).  Primes dividing the conductor are
+    included; there a_p is the bad-reduction value of the given model.
+    """
+    curves = valid_weight2_curves(max_level)
+    primes, a = hecke_eigenvalues_up_to([w for _, _, w in curves], bound)
+    table = {
+        label: dict(zip(primes, row.tolist()))
+        for (_, label, _), row in zip(curves, a)
+    }
+    return primes, table
+
+
+def verify_eta_against_curves(bound: int = 1000) -> Dict[str, Dict]:
+    """
+    Compare weight-2 eta-product q-expansion coefficients with point-count
+    a_p at every prime p ≤ bound not dividing the level.
+
+    Returns {label: {"primes_checked": n, "mismatches": [p, ...]}} for each
+    weight-2 eta product that has an elliptic-curve model with the same label.
+    """
+    _, table = curve_eigenvalue_table(bound)
+    report: Dict[str, Dict] = {}
+    for wt, level, label, de_pairs in ETA_PRODUCT_NEWFORMS:
+        if wt != 2 or label not in table:
+            continue
+        coeffs = eta_product_qexp(de_pairs, bound)
+        if coeffs is None:
+            continue
+        good = [p for p in table[label] if level % p != 0]
+        report[label] = {
+            "primes_checked": len(good),
+            "mismatches": [p for p in good if coeffs[p] != table[label][p]],
+        }
+    return report
+
+
 def verify_eta_leading(de_pairs: List[Tuple[int, int]]) -> Optional[int]:
     """Return the integer leading exponent, or None if not integer."""
     total = sum(r * d for d, r in de_pairs)
@@ -348,28 +404,17 @@ def compute_all_eigenvalues(prime: int, max_level: int = 200) -> Dict:
 
     # --- Weight-2 via elliptic curves ---
     print(f"[k=2] Computing a_{prime} via elliptic curve point counting ...")
-    skipped_invalid = 0
-    for cond, label, weierstrass in ELLIPTIC_CURVES_WEIGHT2:
-        if cond > max_level:
-            continue
-        # Runtime validity check: discriminant prime factors ⊆ conductor prime factors
-        if not _is_valid_weierstrass(cond, weierstrass):
-            print(f"  [SKIP] {label}: Weierstrass model failed discriminant check "
-                  f"(Δ={_discriminant_weierstrass(*weierstrass)})")
-            skipped_invalid += 1
-            continue
-        a1, a2, a3, a4, a6 = weierstrass
-        ap = hecke_eigenvalue_from_curve(a1, a2, a3, a4, a6, prime)
-        rec = {
-            "label": label,
-            "weight": 2,
-            "level": cond,
-            "method": "elliptic_curve_point_counting",
-            f"a_{prime}": ap,
-        }
-        results["weight_2"].append(rec)
-    if skipped_invalid:
-        print(f"  [{skipped_invalid} models skipped due to invalid discriminant]")
+    curves = valid_weight2_curves(max_level, verbose=True)
+    if curves:
+        a_p = hecke_eigenvalues_batch([w for _, _, w in curves], [prime])[:, 0]
+        for (cond, label, _), ap in zip(curves, a_p):
+            results["weight_2"].append({
+                "label": label,
+                "weight": 2,
+                "level": cond,
+                "method": "elliptic_curve_point_counting",
+                f"a_{prime}": int(ap),
+            })
 
     # --- Weight-2 via eta products (may duplicate above) ---
     for wt, level, label, de_pairs in ETA_PRODUCT_NEWFORMS:
@@ -457,39 +502,23 @@ def search_triples(
 
     prime_key = f"a_{P}"
 
+    # Sorted-|a_p| windows instead of the full w2 × w4 × w6 loop
+    matches = find_ratio_triples(
+        w2, w4, w6, lambda rec: rec.get(prime_key),
+        target_mu, target_tau, [tol],
+    )[tol]
+
     candidates = []
-    for f0 in w2:
-        ap0 = f0.get(prime_key)
-        if ap0 is None or ap0 == 0:
-            continue
-        abs_ap0 = abs(ap0)
-        for f1 in w4:
-            ap1 = f1.get(prime_key)
-            if ap1 is None:
-                continue
-            abs_ap1 = abs(ap1)
-            ratio_mu = abs_ap1 / abs_ap0
-            err_mu = abs(ratio_mu - target_mu) / target_mu
-            if err_mu > tol:
-                continue
-            for f2 in w6:
-                ap2 = f2.get(prime_key)
-                if ap2 is None:
-                    continue
-                abs_ap2 = abs(ap2)
-                ratio_tau = abs_ap2 / abs_ap0
-                err_tau = abs(ratio_tau - target_tau) / target_tau
-                if err_tau > tol:
-                    continue
-                candidates.append({
-                    "f0": {"label": f0["label"], "level": f0["level"], f"a_{P}": ap0},
-                    "f1": {"label": f1["label"], "level": f1["level"], f"a_{P}": ap1},
-                    "f2": {"label": f2["label"], "level": f2["level"], f"a_{P}": ap2},
-                    "ratio_mu":  ratio_mu,
-                    "ratio_tau": ratio_tau,
-                    "err_mu":    err_mu,
-                    "err_tau":   err_tau,
-                })
+    for m in matches:
+        candidates.append({
+            "f0": {"label": m.f0["label"], "level": m.f0["level"], f"a_{P}": m.a0},
+            "f1": {"label": m.f1["label"], "level": m.f1["level"], f"a_{P}": m.a1},
+            "f2": {"label": m.f2["label"], "level": m.f2["level"], f"a_{P}": m.a2},
+            "ratio_mu":  m.ratio_mu,
+            "ratio_tau": m.ratio_tau,
+            "err_mu":    m.err_mu,
+            "err_tau":   m.err_tau,
+        })
     return candidates
 
 
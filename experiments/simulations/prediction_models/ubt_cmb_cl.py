@@ -65,17 +65,20 @@ from __future__ import annotations
 
 import math
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
 
 # Import from the companion script in the same directory
 import sys
 _here = Path(__file__).parent
 sys.path.insert(0, str(_here))
 from ubt_primordial_spectrum import (
-    ubt_spectrum,
-    standard_spectrum,
     f_psi,
+    standard_spectrum_array,
+    ubt_spectrum_table,
     HUBBLE_LENGTH_MPC,
     K_HUBBLE_MPC,
 )
@@ -109,34 +112,9 @@ PLANCK_2018_LOW_L = {
 # Spherical Bessel function j_l(x)
 # ---------------------------------------------------------------------------
 
-def _jl_recurrence(l_max: int, x: float) -> List[float]:
-    """
-    Compute j_l(x) for l = 0, 1, ..., l_max by upward recurrence.
-
-    j_0(x) = sin(x)/x
-    j_1(x) = sin(x)/x² - cos(x)/x
-    j_{l+1}(x) = (2l+1)/x * j_l(x) - j_{l-1}(x)
-
-    Returns list of length l_max+1.
+def matter_transfer(k):
     """
-    if x < 1e-10:
-        # j_0(0) = 1, j_l(0) = 0 for l > 0
-        result = [0.0] * (l_max + 1)
-        result[0] = 1.0
-        return result
-
-    j = [0.0] * (l_max + 1)
-    j[0] = math.sin(x) / x
-    if l_max >= 1:
-        j[1] = math.sin(x) / (x * x) - math.cos(x) / x
-    for ll in range(1, l_max):
-        j[ll + 1] = (2 * ll + 1) / x * j[ll] - j[ll - 1]
-    return j
-
-
-def matter_transfer(k: float) -> float:
-    """
-    Simplified matter transfer function T(k).
+    Simplified matter transfer function T(k), elementwise for arrays.
 
     Accounts for suppression of sub-equality-scale perturbations.
     Uses a simplified fitting formula:
@@ -152,14 +130,100 @@ def matter_transfer(k: float) -> float:
     without T(k), the SW integral is dominated by k >> k_eq modes
     that are unphysically large.
     """
-    x = k / K_EQ_MPC
-    return 1.0 / math.sqrt(1.0 + x ** 4)
+    x = np.asarray(k, dtype=float) / K_EQ_MPC
+    return 1.0 / np.sqrt(1.0 + x ** 4)
 
 
 
 def spherical_bessel(l: int, x: float) -> float:
-    """Return j_l(x)."""
-    return _jl_recurrence(l, x)[l]
+    """Return j_l(x) (stable for l > x, see spherical_bessel_table)."""
+    return float(spherical_bessel_table(l, [x])[0, l])
+
+
+def _miller_start(l_max: int) -> int:
+    """Starting order for the backward recurrence (Numerical Recipes, ACC = 40)."""
+    return l_max + 16 + int(math.sqrt(40.0 * max(l_max, 1)))
+
+
+def spherical_bessel_table(l_max: int, x: Sequence[float]) -> np.ndarray:
+    """
+    Table of j_l(x) for l = 0..l_max and every x at once.
+
+    The upward recurrence j_{l+1} = (2l+1)/x j_l - j_{l-1} is only stable for l ≲ x:
+    above the turning point j_l decays while the error grows like y_l, so
+    j_l(kη_0) at small k and large l is dominated by rounding.  Columns with
+    x > l_max therefore use the upward recurrence, all others Miller's
+    backward recurrence
+
+        f_{l-1} = (2l+1)/x f_l - f_{l+1},   f_L = 0, f_{L-1} = 1
+
+    started at L = l_max + 16 + sqrt(40 l_max) and normalised to the closed
+    forms of j_0 and j_1 (least squares over both, so zeros of j_0 are
+    harmless).  Both recurrences run over all columns simultaneously;
+    the backward sweep rescales columns that approach overflow.
+
+    Parameters
+    ----------
+    l_max : largest multipole
+    x     : arguments (array-like, x >= 0)
+
+    Returns
+    -------
+    Array of shape (len(x), l_max + 1) with j_l(x) in column l
+    """
+    x = np.atleast_1d(np.asarray(x, dtype=float))
+    table = np.zeros((x.size, l_max + 1))
+    tiny = x < 1e-10
+    table[tiny, 0] = 1.0   # j_0(0) = 1, j_l(0) = 0 for l > 0
+
+    upward = ~tiny & (x > l_max)
+    backward = ~tiny & ~upward
+
+    if np.any(upward):
+        xu = x[upward]
+        j = np.empty((l_max + 1, xu.size))
+        j[0] = np.sin(xu) / xu
+        if l_max >= 1:
+            j[1] = np.sin(xu) / (xu * xu) - np.cos(xu) / xu
+        for ll in range(1, l_max):
+            j[ll + 1] = (2 * ll + 1) / xu * j[ll] - j[ll - 1]
+        table[upward] = j.T
+
+    if np.any(backward):
+        xb = x[backward]
+        start = _miller_start(l_max)
+        big = 1e250
+        f = np.empty((l_max + 1, xb.size))
+        # f_l is stored before the rescalings applied below order l, i.e. in
+        # units of big**(count - n_rescale[l]) relative to the final f_0
+        n_rescale = np.zeros((l_max + 1, xb.size), dtype=np.int64)
+        count = np.zeros(xb.size, dtype=np.int64)
+        f_next = np.zeros(xb.size)
+        f_cur = np.ones(xb.size)
+        for ll in range(start - 1, 0, -1):
+            if ll <= l_max:
+                f[ll] = f_cur
+                n_rescale[ll] = count
+            f_prev = (2 * ll + 1) / xb * f_cur - f_next
+            over = np.abs(f_prev) > big
+            if np.any(over):
+                f_prev = np.where(over, f_prev / big, f_prev)
+                f_cur = np.where(over, f_cur / big, f_cur)
+                count = count + over
+            f_next, f_cur = f_cur, f_prev
+        f[0] = f_cur
+        n_rescale[0] = count
+
+        f *= np.power(big, -(count - n_rescale).astype(float))
+        j0 = np.sin(xb) / xb
+        j1 = np.sin(xb) / (xb * xb) - np.cos(xb) / xb
+        f1 = f[1] if l_max >= 1 else f_next
+        norm = np.maximum(np.abs(f[0]), np.abs(f1))
+        a, b = f[0] / norm, f1 / norm
+        scale = (j0 * a + j1 * b) / (a * a + b * b) / norm
+        table[backward] = (scale * f).T
+
+    return table
 
 
 
@@ -168,6 +232,83 @@ def spherical_bessel(l: int, x: float) -> float:
 # C_l computation (Sachs-Wolfe approximation)
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=16)
+def sw_kernel(
+    l_max: int,
+    k_min: float = 1e-5,
+    k_max: float = 0.1,
+    n_points: int = 300,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sachs-Wolfe integration kernel on the logarithmic k grid.
+
+    W[i, l] = (2/π) k_i³ Δ(log k) T²(k_i) [j_l(k_i η_0) / 3]²
+
+    so that C_l = Σ_i W[i, l] P(k_i) for any primordial spectrum P.
+    Cached per grid, so scenario sweeps build the Bessel table once.
+
+    Returns
+    -------
+    (k, W) with k of length n_points and W of shape (n_points, l_max + 1),
+    both read-only
+    """
+    log_k = np.linspace(math.log(k_min), math.log(k_max), n_points)
+    d_log_k = (log_k[-1] - log_k[0]) / (n_points - 1)
+    k = np.exp(log_k)
+    tk = matter_transfer(k)
+    jl = spherical_bessel_table(l_max, k * ETA_0_MPC)
+    weight = (2.0 / math.pi) * k ** 3 * d_log_k * (tk / 3.0) ** 2
+    kernel = weight[:, None] * jl * jl
+    k.setflags(write=False)
+    kernel.setflags(write=False)
+    return k, kernel
+
+
+def compute_cl_sw_sweep(
+    l_max: int,
+    r_psi_values: Sequence[float],
+    k_min: float = 1e-5,
+    k_max: float = 0.1,
+    n_points: int = 300,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    C_l^UBT for several R_ψ and C_l^ΛCDM, all l = 0..l_max.
+
+    The primordial spectra come from the cached ubt_spectrum_table, so
+    repeated sweeps over the same grid only redo the final product.
+
+    Returns
+    -------
+    (C_l_ubt, C_l_lcdm) of shapes (len(r_psi_values), l_max + 1) and (l_max + 1,)
+    """
+    k, kernel = sw_kernel(l_max, k_min, k_max, n_points)
+    spectra = np.vstack([ubt_spectrum_table(k, r_psi_values), standard_spectrum_array(k)])
+    cl = spectra @ kernel
+    return cl[:-1], cl[-1]
+
+
+def compute_cl_sw_table(
+    l_max: int,
+    r_psi_mpc: float,
+    k_min: float = 1e-5,
+    k_max: float = 0.1,
+    n_points: int = 300,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    C_l^UBT and C_l^ΛCDM for all l = 0..l_max in one pass.
+
+    Same integral and grid as compute_cl_sw; the Bessel table for every
+    (k, l) is built once (sw_kernel) and both spectra are integrated by a
+    single product [P_UBT, P_ΛCDM] W.
+
+    Returns
+    -------
+    (C_l_ubt, C_l_lcdm), each of length l_max + 1, indexed by l
+    """
+    cl_ubt, cl_lcdm = compute_cl_sw_sweep(l_max, [r_psi_mpc], k_min, k_max, n_points)
+    return cl_ubt[0], cl_lcdm
+
+
 def compute_cl_sw(
     l: int,
     r_psi_mpc: float,
@@ -185,6 +326,9 @@ def compute_cl_sw(
     to prevent the integral from being dominated by high-k oscillatory
     tails of j_l (which are unphysical in the real CMB).
 
+    For many multipoles use compute_cl_sw_table, which shares the Bessel
+    table between them.
+
     Parameters
     ----------
     l          : multipole moment
@@ -197,35 +341,8 @@ def compute_cl_sw(
     -------
     (C_l_ubt, C_l_lcdm) in arbitrary units (same normalisation)
     """
-    # Logarithmic grid in k
-    log_k_min = math.log(k_min)
-    log_k_max = math.log(k_max)
-    d_log_k = (log_k_max - log_k_min) / (n_points - 1)
-
-    cl_ubt = 0.0
-    cl_lcdm = 0.0
-
-    for i in range(n_points):
-        log_k = log_k_min + i * d_log_k
-        k = math.exp(log_k)
-        jl = spherical_bessel(l, k * ETA_0_MPC)
-        tk = matter_transfer(k)
-        transfer_sq = (jl * tk / 3.0) ** 2
-
-        p_ubt = ubt_spectrum(k, r_psi_mpc)
-        p_std = standard_spectrum(k)
-
-        # Integrand: (2/π) k² P(k) T²(k) [j_l(k η_0) / 3]² dk
-        # On log grid: dk = k d(log k)
-        integrand_ubt = k * k * p_ubt * transfer_sq * k * d_log_k
-        integrand_std = k * k * p_std * transfer_sq * k * d_log_k
-
-        cl_ubt += integrand_ubt
-        cl_lcdm += integrand_std
-
-    cl_ubt *= 2.0 / math.pi
-    cl_lcdm *= 2.0 / math.pi
-    return cl_ubt, cl_lcdm
+    cl_ubt, cl_lcdm = compute_cl_sw_table(l, r_psi_mpc, k_min, k_max, n_points)
+    return float(cl_ubt[l]), float(cl_lcdm[l])
 
 
 def cl_to_dl(l: int, cl: float) -> float:
@@ -247,9 +364,11 @@ def analyse_low_l(
 
     Returns dict with results for each l.
     """
+    cl_ubt_table, cl_lcdm_table = compute_cl_sw_table(max(l_values), r_psi_mpc)
     results = {}
     for l in l_values:
-        cl_ubt, cl_lcdm = compute_cl_sw(l, r_psi_mpc)
+        cl_ubt = float(cl_ubt_table[l])
+        cl_lcdm = float(cl_lcdm_table[l])
         if cl_lcdm > 0:
             ratio = cl_ubt / cl_lcdm
         else:
@@ -62,6 +62,14 @@ scenarios are implemented:
 
 This script computes P_UBT(k) for all three scenarios.
 
+Tables
+------
+ubt_spectrum_table / f_psi_table evaluate a whole (R_ψ × k) grid at once.
+F_ψ rows are cached per (R_ψ, n_winding, k-grid hash): in memory (LRU,
+F_PSI_CACHE_SIZE rows) and, if a cache directory is given or the
+environment variable UBT_SPECTRUM_CACHE is set, as one .npz per row on
+disk, so scenario sweeps and C_l runs reuse them.
+
 Usage
 -----
     python ubt_primordial_spectrum.py
@@ -71,10 +79,15 @@ Outputs a JSON summary and prints key values.
 
 from __future__ import annotations
 
+import hashlib
 import math
 import json
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 # ---------------------------------------------------------------------------
@@ -199,6 +212,167 @@ def ubt_spectrum(k: float, r_psi_mpc: float) -> float:
     return standard_spectrum(k) * f_psi(k, r_psi_mpc)
 
 
+# ---------------------------------------------------------------------------
+# Vectorised tables
+# ---------------------------------------------------------------------------
+
+#: Bump when the F_ψ formula or the on-disk layout changes.
+CACHE_FORMAT_VERSION = 1
+
+CACHE_ENV_VAR = "UBT_SPECTRUM_CACHE"
+
+#: Number of F_ψ rows kept in memory.
+F_PSI_CACHE_SIZE = 256
+
+_F_PSI_CACHE: "OrderedDict[Tuple[float, int, str], np.ndarray]" = OrderedDict()
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Return the disk cache directory from UBT_SPECTRUM_CACHE, or None (memory only)."""
+    override = os.environ.get(CACHE_ENV_VAR)
+    if not override or override.strip().lower() in ("off", "0", "none", "false"):
+        return None
+    return Path(override)
+
+
+def k_grid_key(k: Sequence[float]) -> str:
+    """SHA-256 of a k grid (float64 values and length)."""
+    k = np.ascontiguousarray(k, dtype=np.float64)
+    h = hashlib.sha256(f"k_grid:{k.size}:".encode())
+    h.update(k.tobytes())
+    return h.hexdigest()
+
+
+def clear_spectrum_cache() -> None:
+    """Drop all in-memory F_ψ rows (the disk cache is left untouched)."""
+    _F_PSI_CACHE.clear()
+
+
+def standard_spectrum_array(k: Sequence[float]) -> np.ndarray:
+    """standard_spectrum evaluated on an array of k (0 for k <= 0)."""
+    k = np.asarray(k, dtype=float)
+    safe = np.where(k > 0, k, K_STAR)
+    return np.where(k > 0, A_S * (safe / K_STAR) ** (N_S - 1.0), 0.0)
+
+
+def _f_psi_rows(k: np.ndarray, r_psi: np.ndarray, n_winding: int) -> np.ndarray:
+    """Uncached F_ψ table of shape (len(r_psi), len(k)), same arithmetic as f_psi."""
+    r = r_psi[:, None]
+    compact = r > 0
+    r_safe = np.where(compact, r, 1.0)
+    x = k[None, :] * r_safe
+    ir_factor = 1.0 - np.exp(-x * x)
+    winding_sum = np.zeros_like(x)
+    for n in range(1, n_winding + 1):
+        dx = (k[None, :] - float(n) / r_safe) * r_safe
+        winding_sum += np.exp(-dx * dx)
+    return np.where(compact, ir_factor * (1.0 + A_WINDING * winding_sum), 1.0)
+
+
+def _row_path(cache_dir: Path, key: Tuple[float, int, str]) -> Path:
+    r_psi, n_winding, grid = key
+    h = hashlib.sha256(
+        f"f_psi/v{CACHE_FORMAT_VERSION}|{r_psi!r}|{n_winding}|{A_WINDING!r}|{grid}".encode()
+    )
+    return cache_dir / f"f_psi_{h.hexdigest()[:32]}.npz"
+
+
+def _load_row(path: Path, n_k: int) -> Optional[np.ndarray]:
+    if not path.is_file():
+        return None
+    try:
+        with np.load(path) as data:
+            if int(data["version"]) == CACHE_FORMAT_VERSION and data["f_psi"].shape == (n_k,):
+                return data["f_psi"]
+    except (OSError, KeyError, ValueError):
+        pass
+    return None
+
+
+def _save_row(path: Path, row: np.ndarray) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            np.savez(fh, version=np.int64(CACHE_FORMAT_VERSION), f_psi=row)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _remember(key: Tuple[float, int, str], row: np.ndarray) -> None:
+    row.setflags(write=False)
+    _F_PSI_CACHE[key] = row
+    _F_PSI_CACHE.move_to_end(key)
+    while len(_F_PSI_CACHE) > F_PSI_CACHE_SIZE:
+        _F_PSI_CACHE.popitem(last=False)
+
+
+def f_psi_table(
+    k: Sequence[float],
+    r_psi_mpc: Sequence[float],
+    n_winding: int = 5,
+    cache_dir: Optional[Path] = None,
+) -> np.ndarray:
+    """
+    F_ψ(k, R_ψ) for every pair of a k grid and a list of radii.
+
+    Parameters
+    ----------
+    k         : wavenumbers in Mpc^-1 (array-like)
+    r_psi_mpc : ψ-circle radii in Mpc (scalar or array-like)
+    n_winding : number of winding modes to include
+    cache_dir : directory for the .npz row cache (default: default_cache_dir())
+
+    Returns
+    -------
+    Array of shape (len(r_psi_mpc), len(k)); rows are reused from the cache
+    when the same (R_ψ, n_winding, k grid) was evaluated before
+    """
+    k = np.atleast_1d(np.asarray(k, dtype=float))
+    radii = np.atleast_1d(np.asarray(r_psi_mpc, dtype=float))
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    grid = k_grid_key(k)
+    table = np.empty((radii.size, k.size))
+    missing = []
+    for i, r in enumerate(radii):
+        key = (float(r), int(n_winding), grid)
+        row = _F_PSI_CACHE.get(key)
+        if row is None and cache_dir is not None:
+            row = _load_row(_row_path(Path(cache_dir), key), k.size)
+            if row is not None:
+                _remember(key, row)
+        if row is None:
+            missing.append(i)
+        else:
+            _F_PSI_CACHE.move_to_end(key)
+            table[i] = row
+    if missing:
+        rows = _f_psi_rows(k, radii[missing], int(n_winding))
+        table[missing] = rows
+        for i, row in zip(missing, rows):
+            key = (float(radii[i]), int(n_winding), grid)
+            if cache_dir is not None:
+                _save_row(_row_path(Path(cache_dir), key), row)
+            _remember(key, row)
+    return table
+
+
+def ubt_spectrum_table(
+    k: Sequence[float],
+    r_psi_mpc: Sequence[float],
+    n_winding: int = 5,
+    cache_dir: Optional[Path] = None,
+) -> np.ndarray:
+    """
+    P_UBT(k) = P_standard(k) × F_ψ(k, R_ψ) on a (len(r_psi_mpc), len(k)) grid.
+
+    See f_psi_table for the arguments and caching.
+    """
+    return standard_spectrum_array(k)[None, :] * f_psi_table(k, r_psi_mpc, n_winding, cache_dir)
+
+
 def evaluate_scenarios(k_values: List[float]) -> dict:
     """
     Evaluate P_UBT(k) for three scenarios of R_ψ.
@@ -223,14 +397,14 @@ def evaluate_scenarios(k_values: List[float]) -> dict:
         },
     }
 
+    radii = [sc["R_psi_mpc"] for sc in scenarios.values()]
+    f_table = f_psi_table(k_values, radii)
+    p_std = standard_spectrum_array(k_values)
+
     results = {}
-    for name, sc in scenarios.items():
+    for (name, sc), f_vals in zip(scenarios.items(), f_table):
         r = sc["R_psi_mpc"]
-        p_vals = [ubt_spectrum(k, r) for k in k_values]
-        p_std = [standard_spectrum(k) for k in k_values]
-
-        # Compute F_ψ values
-        f_vals = [f_psi(k, r) for k in k_values]
+        p_vals = p_std * f_vals
 
         results[name] = {
             "R_psi_mpc": r,
@@ -238,9 +412,9 @@ def evaluate_scenarios(k_values: List[float]) -> dict:
             "observable_effect": sc["observable_effect"],
             "k_min_mpc_inv": 1.0 / r if r > 0 else None,
             "sample_k": k_values[:5],
-            "sample_P_standard": [round(p, 6) for p in p_std[:5]],
-            "sample_P_UBT": [round(p, 6) for p in p_vals[:5]],
-            "sample_F_psi": [round(f, 6) for f in f_vals[:5]],
+            "sample_P_standard": [round(float(p), 6) for p in p_std[:5]],
+            "sample_P_UBT": [round(float(p), 6) for p in p_vals[:5]],
+            "sample_F_psi": [round(float(f), 6) for f in f_vals[:5]],
         }
 
     return results
@@ -48,6 +48,13 @@ For each N_eff:
 
 import math
 import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from tools.prime_switching import optimal_prime as _switching_optimal_prime  # noqa: E402
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Configuration
@@ -122,17 +129,14 @@ def nearest_prime(x: float) -> int:
 
 
 def prime_minimum(A: float, B: float) -> int:
-    """Return the prime n that minimises V_eff(n) among primes."""
+    """Return the prime n that minimises V_eff(n) among primes.
+
+    Uses the shared switching-threshold table (tools/prime_switching.py)
+    restricted to primes ≤ MAX_PRIME.
+    """
     if B <= 0:
         return PRIMES[0]
-    best_n = PRIMES[0]
-    best_v = v_eff(PRIMES[0], A, B)
-    for p in PRIMES:
-        v = v_eff(p, A, B)
-        if v < best_v:
-            best_v = v
-            best_n = p
-    return best_n
+    return _switching_optimal_prime(A, B, PRIMES[0], MAX_PRIME)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,44 @@
+"""
+hypercomplex.py — Array-backed biquaternions and octonions.
+
+Re-exports the shared NumPy types from tools/biquaternion_array.py at the
+repository root, so that field grids over ℂ⊗ℍ and ℂ⊗𝕆 can be handled as
+array operations here as well:
+
+- BiquaternionArray: (..., 4) complex buffer; Hamilton product,
+  conjugations, norms, Sc(p q†), Mat(2,ℂ) image (1, i, j, k ↦ I₂, iσ₂, iσ₁, iσ₃
+  as in biquaternion_algebra.quaternion_basis)
+- OctonionArray: (..., 8) buffer multiplied through OCTONION_TENSOR
+- associator(x, y, z) = (xy)z − x(yz)
+
+Author: UBT Research Team
+License: See repository LICENSE.md
+"""
+
+import sys
+from pathlib import Path
+
+# tools/ lives at the repository root, one level above research_tracks/
+REPO_ROOT = Path(__file__).resolve().parents[4]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from tools.biquaternion_array import (  # noqa: E402
+    BiquaternionArray,
+    OctonionArray,
+    OCTONION_SIGN_TABLE,
+    OCTONION_TENSOR,
+    QUATERNION_MATRICES,
+    associator,
+    structure_tensor,
+)
+
+__all__ = [
+    'BiquaternionArray',
+    'OctonionArray',
+    'OCTONION_SIGN_TABLE',
+    'OCTONION_TENSOR',
+    'QUATERNION_MATRICES',
+    'associator',
+    'structure_tensor',
+]
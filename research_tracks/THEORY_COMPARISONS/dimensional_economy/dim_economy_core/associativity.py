@@ -22,6 +22,12 @@ License: See repository LICENSE.md
 
 from sympy import Matrix, I, symbols, simplify, zeros, eye
 
+from THEORY_COMPARISONS.dimensional_economy.common.hypercomplex import (
+    OctonionArray,
+    OCTONION_SIGN_TABLE,
+    associator,
+)
+
 
 # ---------------------------------------------------------------------------
 # Mat(2,ℂ) associativity
@@ -71,18 +77,9 @@ def verify_mat2c_associativity():
 # Cayley-Dickson octonion multiplication table (indices 0–7).
 # e₀ = 1, e₁..e₇ = imaginary units.
 # Entry OCTONION_MULT[i][j] = (sign, k) meaning  eᵢ · eⱼ = sign · eₖ.
-# Fano plane encoding; cross-checked against standard table.
-_OCTONION_SIGN_TABLE = [
-    # e0  e1  e2  e3  e4  e5  e6  e7
-    [(+1,0),(+1,1),(+1,2),(+1,3),(+1,4),(+1,5),(+1,6),(+1,7)],   # e0·ej
-    [(+1,1),(-1,0),(+1,3),(-1,2),(+1,5),(-1,4),(-1,7),(+1,6)],   # e1·ej
-    [(+1,2),(-1,3),(-1,0),(+1,1),(+1,6),(+1,7),(-1,4),(-1,5)],   # e2·ej
-    [(+1,3),(+1,2),(-1,1),(-1,0),(+1,7),(-1,6),(+1,5),(-1,4)],   # e3·ej
-    [(+1,4),(-1,5),(-1,6),(-1,7),(-1,0),(+1,1),(+1,2),(+1,3)],   # e4·ej
-    [(+1,5),(+1,4),(-1,7),(+1,6),(-1,1),(-1,0),(-1,3),(+1,2)],   # e5·ej
-    [(+1,6),(+1,7),(+1,4),(-1,5),(-1,2),(+1,3),(-1,0),(-1,1)],   # e6·ej
-    [(+1,7),(-1,6),(+1,5),(+1,4),(-1,3),(-1,2),(+1,1),(-1,0)],   # e7·ej
-]
+# Fano plane encoding; cross-checked against standard table.  The table is
+# shared with OctonionArray, which uses it as an (8, 8, 8) einsum tensor.
+_OCTONION_SIGN_TABLE = OCTONION_SIGN_TABLE
 
 
 def octonion_mult(a, b):
@@ -101,12 +98,24 @@ def octonion_mult(a, b):
     list of float, length 8
         Product a · b.
     """
-    result = [0.0] * 8
-    for i in range(8):
-        for j in range(8):
-            sign, k = _OCTONION_SIGN_TABLE[i][j]
-            result[k] += sign * a[i] * b[j]
-    return result
+    return (OctonionArray(a) * OctonionArray(b)).data.tolist()
+
+
+def octonion_associator_grid(x, y, z):
+    """
+    Associator (x·y)·z − x·(y·z) over whole batches of octonions.
+
+    Parameters
+    ----------
+    x, y, z : array_like, shape (..., 8)
+        Octonion coefficients; batch shapes broadcast.
+
+    Returns
+    -------
+    numpy.ndarray, shape (..., 8)
+        Zero exactly where the three octonions associate.
+    """
+    return associator(OctonionArray(x), OctonionArray(y), OctonionArray(z)).data
 
 
 def demonstrate_octonion_non_associativity():
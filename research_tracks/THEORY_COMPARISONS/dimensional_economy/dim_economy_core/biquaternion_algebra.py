@@ -20,6 +20,7 @@ License: See repository LICENSE.md
 from sympy import Matrix, I, eye, simplify, zeros, symbols, Rational
 
 from THEORY_COMPARISONS.dimensional_economy.common.algebra import pauli_matrices
+from THEORY_COMPARISONS.dimensional_economy.common.hypercomplex import BiquaternionArray
 
 
 # ---------------------------------------------------------------------------
@@ -135,6 +136,41 @@ def verify_quaternion_relations():
     return True
 
 
+def verify_homomorphism_numeric(n_samples=10000, seed=0):
+    """
+    Check numerically that q ↦ M(q) is an algebra isomorphism ℂ⊗ℍ → Mat(2,ℂ).
+
+    For random batches p, q ∈ ℂ⊗ℍ (BiquaternionArray) verifies
+        M(p·q) = M(p)·M(q),   M⁻¹(M(p)) = p,   det M(q) = N(q) = a²+b²+c²+d²
+    as array operations over the whole batch.
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of random pairs.
+    seed : int
+        Random seed.
+
+    Returns
+    -------
+    float
+        Largest absolute residual over all checks (≈ 1e-15 expected).
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    p, q = (BiquaternionArray(rng.normal(size=(n_samples, 4))
+                              + 1j * rng.normal(size=(n_samples, 4)))
+            for _ in range(2))
+    Mp, Mq = p.to_matrix(), q.to_matrix()
+    residuals = [
+        np.abs((p * q).to_matrix() - Mp @ Mq).max(),
+        np.abs(BiquaternionArray.from_matrix(Mp).data - p.data).max(),
+        np.abs(np.linalg.det(Mq) - q.quaternion_norm()).max(),
+    ]
+    return float(max(residuals))
+
+
 def basis_is_linearly_independent():
     """
     Check that the 8 biquaternion basis elements are ℝ-linearly independent.
@@ -5,3 +5,9 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[3]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
+
+# experiments/research_tracks/three_generations/ holds flat script modules
+# (hecke_ratio_index, newform_store, ...) imported by the Hecke-search tests
+THREE_GEN_DIR = REPO_ROOT.parent / "experiments" / "research_tracks" / "three_generations"
+if str(THREE_GEN_DIR) not in sys.path:
+    sys.path.insert(0, str(THREE_GEN_DIR))
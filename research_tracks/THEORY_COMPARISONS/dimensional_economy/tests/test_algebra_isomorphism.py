@@ -19,6 +19,7 @@ from THEORY_COMPARISONS.dimensional_economy.dim_economy_core.biquaternion_algebr
     verify_quaternion_relations,
     basis_is_linearly_independent,
     dimension_count,
+    verify_homomorphism_numeric,
 )
 from THEORY_COMPARISONS.dimensional_economy.common.algebra import pauli_matrices
 
@@ -113,6 +114,14 @@ class TestBiquaternionBasis:
         assert basis[0] == eye(2)
 
 
+class TestBatchedIsomorphism:
+    """Array-backed check of ℂ⊗ℍ ≅ Mat(2,ℂ) on random batches."""
+
+    def test_homomorphism_residual(self):
+        """M(pq) = M(p)M(q), inverse map and det = N(q) on 10⁴ samples."""
+        assert verify_homomorphism_numeric(n_samples=10000) < 1e-12
+
+
 class TestDimensionCount:
     """Tests for the dimensional inventory table."""
 
@@ -18,6 +18,7 @@ from THEORY_COMPARISONS.dimensional_economy.dim_economy_core.associativity impor
     demonstrate_octonion_non_associativity,
     verify_octonions_non_associative,
     associativity_comparison_summary,
+    octonion_associator_grid,
 )
 
 
@@ -84,6 +85,34 @@ class TestOctonionMultiplication:
         assert result['lhs'] != result['rhs']
 
 
+class TestOctonionArrays:
+    """Associator over whole batches of octonions."""
+
+    def test_associator_grid(self):
+        """Random octonions fail to associate; quaternion subalgebra associates."""
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        x, y, z = rng.normal(size=(3, 500, 8))
+        assoc = octonion_associator_grid(x, y, z)
+        assert assoc.shape == (500, 8)
+        assert np.all(np.abs(assoc).max(axis=-1) > 1e-8)
+
+        # span{e0, e1, e2, e3} is the quaternion subalgebra
+        x[..., 4:] = y[..., 4:] = z[..., 4:] = 0.0
+        assert np.abs(octonion_associator_grid(x, y, z)).max() < 1e-12
+
+    def test_grid_matches_scalar_product(self):
+        """Batched product agrees with octonion_mult on basis pairs."""
+        import numpy as np
+
+        lhs = octonion_associator_grid(np.eye(8)[1], np.eye(8)[2], np.eye(8)[4])
+        e1, e2, e4 = ([float(i == k) for i in range(8)] for k in (1, 2, 4))
+        expected = np.subtract(octonion_mult(octonion_mult(e1, e2), e4),
+                               octonion_mult(e1, octonion_mult(e2, e4)))
+        assert np.array_equal(lhs, expected)
+
+
 class TestAssociativitySummary:
     """Tests for the summary comparison function."""
 
@@ -0,0 +1,101 @@
+"""
+test_eta_products.py — Pentagonal/limb eta-product engine vs. direct products.
+
+Validates:
+- eta_product_coefficients equals the direct factor-by-factor product
+  (the former eta_product_qexp) for every entry of ETA_PRODUCT_NEWFORMS.
+- τ(n) from Δ = η(z)^24 is multiplicative, including coefficients beyond
+  int64 where the multi-limb representation is exercised.
+- Cached longer series serve shorter requests; fractional or negative
+  leading powers return None.
+
+Author: UBT Research Team
+License: See repository LICENSE.md
+"""
+
+import pytest
+
+import eta_products
+from eta_products import eta_product_coefficients
+from search_hecke_lmfdb_local import ETA_PRODUCT_NEWFORMS
+
+
+DELTA = [(1, 24)]
+
+
+def _direct_qexp(pairs, max_n):
+    """Former eta_product_qexp: multiply (1 - q^{dk}) factors one at a time."""
+    L_num = sum(r * d for d, r in pairs)
+    if L_num % 24 != 0:
+        return None
+    leading = L_num // 24
+    if leading > max_n:
+        return None
+    M = max_n - leading
+    poly = [0] * (M + 1)
+    poly[0] = 1
+    for d, r in pairs:
+        for k in range(1, M // d + 1):
+            factor = d * k
+            for _ in range(r):
+                for j in range(M, factor - 1, -1):
+                    poly[j] -= poly[j - factor]
+    coeffs = [0] * (max_n + 1)
+    for n in range(M + 1):
+        coeffs[n + leading] = poly[n]
+    return coeffs
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    eta_products.clear_cache()
+    yield
+    eta_products.clear_cache()
+
+
+class TestAgainstDirectProduct:
+    @pytest.mark.parametrize(
+        "weight,level,label,pairs",
+        ETA_PRODUCT_NEWFORMS,
+        ids=[entry[2] for entry in ETA_PRODUCT_NEWFORMS],
+    )
+    def test_newform_database(self, weight, level, label, pairs):
+        assert eta_product_coefficients(pairs, 300) == _direct_qexp(pairs, 300)
+
+    def test_known_eigenvalues(self):
+        # a_137 values recorded next to ETA_PRODUCT_NEWFORMS
+        assert eta_product_coefficients([(1, 2), (11, 2)], 137)[137] == -7
+        assert eta_product_coefficients([(2, 4), (4, 4)], 137)[137] == 1626
+
+
+class TestRamanujanTau:
+    @pytest.fixture
+    def tau(self):
+        return eta_product_coefficients(DELTA, 12000)
+
+    def test_small_values(self, tau):
+        assert tau[:8] == [0, 1, -24, 252, -1472, 4830, -6048, -16744]
+
+    def test_multiplicative_on_coprime_pairs(self, tau):
+        for m, n in [(2, 3), (5, 7), (11, 13), (31, 37), (97, 101), (101, 103)]:
+            assert tau[m * n] == tau[m] * tau[n]
+
+    def test_prime_square_recursion(self, tau):
+        for p in (2, 3, 7, 43, 109):
+            assert tau[p * p] == tau[p] ** 2 - p ** 11
+
+    def test_beyond_int64(self, tau):
+        assert abs(tau[10403]) > 2 ** 63
+        assert tau[10403] == tau[101] * tau[103]
+
+
+class TestEdgeCases:
+    def test_cached_series_serves_shorter_request(self):
+        long = eta_product_coefficients(DELTA, 2000)
+        assert eta_product_coefficients(DELTA, 500) == long[:501]
+
+    def test_fractional_leading_power(self):
+        assert eta_product_coefficients([(1, 1)], 10) is None
+
+    def test_negative_leading_power(self):
+        assert eta_product_coefficients([(1, -24)], 10) is None
@@ -0,0 +1,148 @@
+"""
+test_hecke_ratio_index.py — Sorted-ratio index vs. brute-force triple search.
+
+Validates:
+- iter_ratio_triples returns exactly the triples (and order) of the nested
+  |k2|·|k4|·|k6| loop, on random eigenvalue sets built around the targets.
+- find_ratio_triples buckets one pass into every requested tolerance.
+- ratio_hits applies the exact error formula at the window edges.
+- stats["mu_pairs"] counts the (f_0, f_1) pairs the nested loop evaluated.
+
+Author: UBT Research Team
+License: See repository LICENSE.md
+"""
+
+import random
+
+import pytest
+
+from hecke_ratio_index import (
+    EigenvalueIndex,
+    find_ratio_triples,
+    iter_ratio_triples,
+    ratio_hits,
+)
+
+
+MU_RATIO = 206.7682830
+TAU_RATIO = 3477.23
+
+
+def _a_p(record):
+    return record["a_p"]
+
+
+def _brute_force(w2, w4, w6, target_mu, target_tau, tol):
+    """Nested-loop search as in the original search scripts."""
+    out = []
+    for f0 in w2:
+        a0 = _a_p(f0)
+        if a0 is None or a0 == 0:
+            continue
+        for f1 in w4:
+            a1 = _a_p(f1)
+            if a1 is None:
+                continue
+            err_mu = abs(abs(a1) / abs(a0) - target_mu) / target_mu
+            if err_mu > tol:
+                continue
+            for f2 in w6:
+                a2 = _a_p(f2)
+                if a2 is None:
+                    continue
+                err_tau = abs(abs(a2) / abs(a0) - target_tau) / target_tau
+                if err_tau <= tol:
+                    out.append((f0["label"], f1["label"], f2["label"]))
+    return out
+
+
+def _random_forms(rng, weight, n, scale):
+    """Forms with a_p near multiples of `scale` so that windows get hits."""
+    forms = []
+    for i in range(n):
+        roll = rng.random()
+        if roll < 0.1:
+            a = None
+        elif roll < 0.15:
+            a = 0.0
+        else:
+            a = rng.choice([-1, 1]) * scale * rng.choice([1, 2, 3]) * rng.uniform(0.9, 1.1)
+            if rng.random() < 0.3:
+                a = float(round(a))
+        forms.append({"label": f"{i}.{weight}.a.a", "a_p": a})
+    return forms
+
+
+def _labels(matches):
+    return [(m.f0["label"], m.f1["label"], m.f2["label"]) for m in matches]
+
+
+class TestAgainstBruteForce:
+    """The index must reproduce the nested-loop search exactly."""
+
+    def test_random_trials_match_including_order(self):
+        rng = random.Random(137)
+        for _ in range(200):
+            w2 = _random_forms(rng, 2, rng.randint(0, 12), 8.0)
+            w4 = _random_forms(rng, 4, rng.randint(0, 15), 8.0 * MU_RATIO)
+            w6 = _random_forms(rng, 6, rng.randint(0, 15), 8.0 * TAU_RATIO)
+            tol = rng.choice([0.01, 0.05, 0.1, 0.3])
+
+            expected = _brute_force(w2, w4, w6, MU_RATIO, TAU_RATIO, tol)
+            got = iter_ratio_triples(w2, EigenvalueIndex(w4, _a_p),
+                                     EigenvalueIndex(w6, _a_p), _a_p,
+                                     MU_RATIO, TAU_RATIO, tol)
+            assert _labels(got) == expected
+
+    def test_match_fields(self):
+        w2 = [{"label": "11.2.a.a", "a_p": -8.0}]
+        w4 = [{"label": "4.4.a.a", "a_p": 8.0 * MU_RATIO}]
+        w6 = [{"label": "50.6.a.a", "a_p": -8.0 * TAU_RATIO * 1.01}]
+        (m,) = list(iter_ratio_triples(w2, EigenvalueIndex(w4, _a_p),
+                                       EigenvalueIndex(w6, _a_p), _a_p,
+                                       MU_RATIO, TAU_RATIO, 0.05))
+        assert m.a0 == -8.0
+        assert m.ratio_mu == pytest.approx(MU_RATIO)
+        assert m.err_tau == pytest.approx(0.01)
+
+
+class TestStats:
+    def test_mu_pairs_counts_nested_loop_pairs(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            w2 = _random_forms(rng, 2, rng.randint(0, 12), 8.0)
+            w4 = _random_forms(rng, 4, rng.randint(0, 15), 8.0 * MU_RATIO)
+            w6 = _random_forms(rng, 6, rng.randint(0, 15), 8.0 * TAU_RATIO)
+            expected = sum(
+                1 for f0 in w2 if _a_p(f0)
+                for f1 in w4 if _a_p(f1) is not None
+                and abs(abs(_a_p(f1)) / abs(_a_p(f0)) - MU_RATIO) / MU_RATIO <= 0.05
+            )
+            stats = {}
+            list(iter_ratio_triples(w2, EigenvalueIndex(w4, _a_p),
+                                    EigenvalueIndex(w6, _a_p), _a_p,
+                                    MU_RATIO, TAU_RATIO, 0.05, stats=stats))
+            assert stats.get("mu_pairs", 0) == expected
+
+
+class TestTolerances:
+    def test_one_pass_equals_separate_searches(self):
+        rng = random.Random(2026)
+        w2 = _random_forms(rng, 2, 20, 8.0)
+        w4 = _random_forms(rng, 4, 30, 8.0 * MU_RATIO)
+        w6 = _random_forms(rng, 6, 30, 8.0 * TAU_RATIO)
+        tols = [0.02, 0.05, 0.1]
+        buckets = find_ratio_triples(w2, w4, w6, _a_p, MU_RATIO, TAU_RATIO, tols)
+        assert sorted(buckets) == tols
+        for tol in tols:
+            assert _labels(buckets[tol]) == _brute_force(w2, w4, w6,
+                                                         MU_RATIO, TAU_RATIO, tol)
+
+    def test_window_edges_use_exact_error(self):
+        index = EigenvalueIndex(
+            [{"label": "a", "a_p": 105.0}, {"label": "b", "a_p": -95.0},
+             {"label": "c", "a_p": 105.0001}],
+            _a_p,
+        )
+        hits = ratio_hits(index, 1.0, 100.0, 0.05)
+        assert [item["label"] for _, item, _, _ in hits] == ["a", "b"]
@@ -0,0 +1,195 @@
+"""
+test_newform_store.py — Offline newform store for the LMFDB Hecke searches.
+
+Validates:
+- Schema: a store round-trips through close/reopen; a foreign schema
+  version is rejected.
+- records(weight, level range, primes, is_cm) filtering.
+- Import of raw LMFDB API dumps and of the search scripts' result files.
+- Coverage: only a complete query answer lets a search skip the LMFDB
+  fetch; a partial store (e.g. imported result files) never does.
+
+Author: UBT Research Team
+License: See repository LICENSE.md
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+import newform_store
+import run_hecke_lmfdb_search
+import search_hecke_lmfdb_api
+from newform_store import NewformStore, api_dump_records
+
+
+RESULTS_FILE = Path(newform_store.__file__).with_name("hecke_search_results.json")
+
+# First primes: 2, 3, 5, 7, 11 — hecke_eigenvalues is prime-indexed.
+K2_DUMP = {"data": [
+    {"label": "11.2.a.a", "level": 11, "weight": 2, "is_cm": False,
+     "hecke_eigenvalues": [-2, -1, 1, -2, 1]},
+    {"label": "27.2.a.a", "level": 27, "weight": 2, "is_cm": True, "cm_disc": -3,
+     "hecke_eigenvalues": [0, 0, 0, -1, 0]},
+    {"label": "37.2.a.a", "level": 37, "weight": 2, "is_cm": False,
+     "hecke_eigenvalues": [-2, -3, -2, -1, -5]},
+    {"label": "210.2.a.a", "level": 210, "weight": 2,
+     "an": [1, -1, 1, 1, -1, -1, -1, -1, 1, 1, -4]},
+]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    with NewformStore(str(tmp_path / "store.sqlite")) as st:
+        yield st
+
+
+@pytest.fixture
+def dump_file(tmp_path):
+    path = tmp_path / "dump_k2.json"
+    path.write_text(json.dumps(K2_DUMP))
+    return str(path)
+
+
+class TestSchema:
+    def test_roundtrip(self, tmp_path):
+        path = str(tmp_path / "store.sqlite")
+        with NewformStore(path) as st:
+            st.add_records(K2_DUMP["data"], source="test")
+            st.add_coverage(2, 1, 100)
+        with NewformStore(path) as st:
+            assert st.a_p("11.2.a.a", 5) == 1.0
+            assert st.a_p("210.2.a.a", 11) == -4.0
+            assert [f["label"] for f in st.forms(weight=2)] == [
+                "11.2.a.a", "27.2.a.a", "37.2.a.a", "210.2.a.a"]
+            assert st.coverage() == [{"weight": 2, "level_min": 1, "level_max": 100,
+                                      "is_cm": None, "source": ""}]
+
+    def test_other_schema_version_rejected(self, tmp_path):
+        path = str(tmp_path / "store.sqlite")
+        NewformStore(path).close()
+        conn = sqlite3.connect(path)
+        with conn:
+            conn.execute("UPDATE meta SET value = '1' WHERE key = 'schema_version'")
+        conn.close()
+        with pytest.raises(RuntimeError):
+            NewformStore(path)
+
+    def test_label_parsing(self):
+        assert newform_store.parse_label("37.2.b.a") == (37, 2, "b")
+        assert newform_store.parse_label("not a label") is None
+
+
+class TestRecords:
+    def test_filters(self, store):
+        store.add_records(K2_DUMP["data"], source="test")
+        recs = store.records(weight=2, level_min=20, level_max=100, primes=[3, 7])
+        assert [r["label"] for r in recs] == ["27.2.a.a", "37.2.a.a"]
+        assert recs[1]["a_p"] == {3: -3.0, 7: -1.0}
+
+        assert [r["label"] for r in store.records(weight=2, is_cm=True)] == ["27.2.a.a"]
+        assert [r["label"] for r in store.records(weight=2, is_cm=False)] == [
+            "11.2.a.a", "37.2.a.a", "210.2.a.a"]
+        assert store.records(weight=4) == []
+
+    def test_later_import_keeps_metadata(self, store):
+        store.add_records(K2_DUMP["data"], source="api")
+        store.add_records([{"label": "27.2.a.a", "a_5": 0}], source="results")
+        (rec,) = store.forms(weight=2, level_min=27, level_max=27)
+        assert rec["is_cm"] is True and rec["cm_disc"] == -3
+
+
+class TestImport:
+    def test_api_dump_shapes(self):
+        assert api_dump_records(K2_DUMP) == K2_DUMP["data"]
+        assert api_dump_records({"results": []}) == []
+        assert api_dump_records(K2_DUMP["data"]) == K2_DUMP["data"]
+        assert api_dump_records({"candidates": [], "verdict": "NO_MATCH"}) is None
+
+    def test_import_api_dump_records_coverage(self, store, dump_file):
+        assert store.import_api_dumps([dump_file], 2, 1, 300) == (4, 20)
+        assert store.covers(2, 1, 200)
+        assert store.covers(2, 10, 300, is_cm=False)
+        assert not store.covers(2, 1, 301)
+        assert not store.covers(4, 1, 200)
+
+    def test_import_api_dump_outside_query_rejected(self, store, dump_file):
+        with pytest.raises(ValueError):
+            store.import_api_dumps([dump_file], 2, 1, 100)
+        assert store.coverage() == []
+
+    def test_result_file_import(self, store):
+        store.import_json(str(RESULTS_FILE))
+        counts = store.counts()
+        assert {k: n for k, (n, _) in counts.items()} == {2: 15, 4: 3, 6: 3, 12: 1}
+        assert store.coverage() == []
+
+    def test_result_file_never_counts_as_coverage(self, store):
+        with pytest.raises(ValueError):
+            store.import_api_dumps([str(RESULTS_FILE)], 2, 1, 200)
+        assert store.coverage() == []
+
+
+class TestCoverage:
+    def test_cm_filter_rules(self, store):
+        store.add_coverage(6, 50, 500, is_cm=False)
+        assert store.covers(6, 100, 200, is_cm=False)
+        assert not store.covers(6, 100, 200)
+        assert not store.covers(6, 100, 200, is_cm=True)
+        store.add_coverage(6, 1, 500)
+        assert store.covers(6, 100, 200)
+        assert store.covers(6, 100, 200, is_cm=True)
+
+    def test_partial_store_does_not_short_circuit_api_search(self, store, monkeypatch):
+        store.import_json(str(RESULTS_FILE))
+        calls = []
+
+        def fake_query(params, timeout=None):
+            calls.append(params)
+            return K2_DUMP
+
+        monkeypatch.setattr(search_hecke_lmfdb_api, "lmfdb_query", fake_query)
+        ok, records = search_hecke_lmfdb_api.fetch_newforms_for_weight(2, 500, store)
+        assert ok and len(calls) == 1 and records == K2_DUMP["data"]
+
+        # The complete answer now covers narrower queries, served offline.
+        ok, records = search_hecke_lmfdb_api.fetch_newforms_for_weight(2, 300, store)
+        assert ok and len(calls) == 1
+        labels = {r["label"] for r in records}
+        assert {r["label"] for r in K2_DUMP["data"]} <= labels
+        assert all(r["weight"] == 2 and r["level"] <= 300 for r in records)
+
+        # A wider range is not covered and goes back to the API.
+        search_hecke_lmfdb_api.fetch_newforms_for_weight(2, 1000, store)
+        assert len(calls) == 2
+
+    def test_full_page_is_not_coverage(self, store, monkeypatch):
+        page = [{"label": f"{n}.2.a.a", "level": n, "weight": 2}
+                for n in range(1, search_hecke_lmfdb_api.QUERY_LIMIT + 1)]
+        monkeypatch.setattr(search_hecke_lmfdb_api, "lmfdb_query",
+                            lambda params, timeout=None: {"data": page})
+        search_hecke_lmfdb_api.fetch_newforms_for_weight(2, 1000, store)
+        assert len(store.forms(weight=2)) == len(page)
+        assert store.coverage() == []
+
+    def test_incomplete_pagination_is_not_coverage(self, store, monkeypatch):
+        store.import_json(str(RESULTS_FILE))
+        results = [(True, K2_DUMP["data"][:2], False), (True, K2_DUMP["data"], True)]
+        calls = []
+
+        def fake_paginate(endpoint, params, max_pages=20):
+            calls.append(params)
+            return results[len(calls) - 1]
+
+        monkeypatch.setattr(run_hecke_lmfdb_search, "_paginate", fake_paginate)
+        assert run_hecke_lmfdb_search._from_store(store, 2, 1, 200) is None
+
+        run_hecke_lmfdb_search.fetch_k2_forms(store)     # partial fetch
+        assert not store.covers(2, 1, 200)
+        run_hecke_lmfdb_search.fetch_k2_forms(store)     # complete fetch
+        assert store.covers(2, 1, 200)
+        ok, records = run_hecke_lmfdb_search.fetch_k2_forms(store)
+        assert ok and len(calls) == 2
+        assert {"11.2.a.a", "37.2.a.a"} <= {r["label"] for r in records}
@@ -0,0 +1,68 @@
+"""
+test_point_counting.py — Batched NumPy point counting vs. the scalar routine.
+
+Validates:
+- hecke_eigenvalues_batch equals hecke_eigenvalue_from_curve for every
+  weight-2 curve in the local database at all primes p ≤ 300.
+- count_points_batch and hecke_eigenvalues_batch are consistent
+  (a_p = p + 1 - #E(F_p)) and obey the Hasse bound |a_p| ≤ 2√p.
+- Known eigenvalues of 11.2.a.a.
+
+Author: UBT Research Team
+License: See repository LICENSE.md
+"""
+
+import numpy as np
+import pytest
+
+from point_counting import (
+    count_points_batch,
+    hecke_eigenvalues_batch,
+    hecke_eigenvalues_up_to,
+    legendre_table,
+)
+from search_hecke_lmfdb_local import (
+    ELLIPTIC_CURVES_WEIGHT2,
+    hecke_eigenvalue_from_curve,
+)
+
+
+CURVES = [ainvs for _, _, ainvs in ELLIPTIC_CURVES_WEIGHT2]
+PRIME_BOUND = 300
+
+
+@pytest.fixture(scope="module")
+def batched():
+    return hecke_eigenvalues_up_to(CURVES, PRIME_BOUND)
+
+
+class TestAgainstScalar:
+    def test_matches_hecke_eigenvalue_from_curve(self, batched):
+        primes, a = batched
+        assert a.shape == (len(CURVES), len(primes))
+        for i, ainvs in enumerate(CURVES):
+            expected = [hecke_eigenvalue_from_curve(*ainvs, p) for p in primes]
+            assert a[i].tolist() == expected, ELLIPTIC_CURVES_WEIGHT2[i][1]
+
+    def test_known_eigenvalues_11a(self):
+        # 11.2.a.a: a_2 = -2, a_3 = -1, a_5 = 1, a_137 = -7
+        a = hecke_eigenvalues_batch([[0, -1, 1, 0, 0]], [2, 3, 5, 137])
+        assert a.tolist() == [[-2, -1, 1, -7]]
+
+
+class TestConsistency:
+    def test_point_count_relation(self, batched):
+        primes, a = batched
+        counts = count_points_batch(CURVES, primes)
+        np.testing.assert_array_equal(a, np.asarray(primes) + 1 - counts)
+
+    def test_hasse_bound(self, batched):
+        primes, a = batched
+        assert np.all(a.astype(float) ** 2 <= 4.0 * np.asarray(primes, dtype=float))
+
+    def test_legendre_table(self):
+        chi = legendre_table(13)
+        assert chi[0] == 0
+        assert sorted(int(x) for x in np.flatnonzero(chi == 1)) == [1, 3, 4, 9, 10, 12]
+        with pytest.raises(ValueError):
+            legendre_table(1)
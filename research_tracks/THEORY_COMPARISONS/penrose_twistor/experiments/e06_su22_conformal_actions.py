@@ -8,6 +8,7 @@ This experiment demonstrates:
 3. Conformal (Möbius) action on 2×2 Hermitian matrices
 4. Preservation of null structure under conformal transformations
 5. Robust numerical verification with tight tolerances
+6. Batched (NumPy) check of the same invariants on many random elements
 
 Run with:
     python -m THEORY_COMPARISONS.penrose_twistor.experiments.e06_su22_conformal_actions
@@ -17,6 +18,7 @@ License: See repository LICENSE.md
 """
 
 import sys
+import numpy as np
 from sympy import Matrix, eye, simplify, I
 from THEORY_COMPARISONS.penrose_twistor.twistor_core.su22 import (
     get_su22_hermitian_form,
@@ -40,6 +42,7 @@ from THEORY_COMPARISONS.penrose_twistor.twistor_core.conformal import (
     is_hermitian,
 )
 from THEORY_COMPARISONS.penrose_twistor.twistor_core.numeric import norm_fro, max_abs
+from THEORY_COMPARISONS.penrose_twistor.twistor_core import batch
 
 
 def print_header(title):
@@ -357,6 +360,40 @@ def test_null_preservation(U):
     return null_preserved
 
 
+def test_batched_invariants(n=100_000, chunk=1 << 16, seed=2024):
+    """Check SU(2,2) membership and null preservation on n random elements."""
+    print_header("TEST 6: BATCHED INVARIANTS (NumPy)")
+    
+    print(f"Sampling {n} elements U = exp(A), A random in su(2,2) (scale 0.1)...")
+    print()
+    
+    max_h = 0.0
+    max_det = 0.0
+    n_not_null = 0
+    for start in range(0, n, chunk):
+        m = min(chunk, n - start)
+        U = batch.random_su22_elements(m, scale=0.1, seed=seed + start)
+        max_h = max(max_h, float(batch.H_unitarity_residual(U).max()))
+        max_det = max(max_det, float(np.abs(np.linalg.det(U) - 1.0).max()))
+        X = batch.random_null_X(m, seed=seed + n + start)
+        result = batch.verify_null_preservation(U, X, tol=1e-8)
+        n_not_null += int((~result['null_preserved']).sum())
+    
+    print(f"max ||U† H U - H||_F = {max_h:.2e}")
+    print(f"max |det(U) - 1|     = {max_det:.2e}")
+    print(f"null X mapped to non-null X' (|det| ≥ 1e-8): {n_not_null} / {n}")
+    print()
+    
+    passed = max_h < 1e-9 and max_det < 1e-9 and n_not_null == 0
+    if passed:
+        print(f"✓ All {n} random elements in SU(2,2) and preserve the light cone")
+    else:
+        print("✗ Batched invariant check failed")
+    
+    print()
+    return passed
+
+
 def summary():
     """Print summary of results."""
     print_header("SUMMARY")
@@ -412,6 +449,7 @@ def main():
     
     all_pass &= test_mobius_transformation(U)
     all_pass &= test_null_preservation(U)
+    all_pass &= test_batched_invariants()
     
     summary()
     
@@ -5,3 +5,16 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[3]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
+
+import pytest
+
+from THEORY_COMPARISONS.penrose_twistor.twistor_core import lie_cache
+
+
+@pytest.fixture(autouse=True)
+def _lie_audit_cache_dir(tmp_path, monkeypatch):
+    """Keep the lie_audit disk cache out of ~/.cache/ubt during tests."""
+    monkeypatch.setenv(lie_cache.CACHE_ENV_VAR, str(tmp_path / "lie_audit"))
+    lie_cache.set_cache(None)
+    yield
+    lie_cache.set_cache(None)
@@ -22,6 +22,8 @@ from THEORY_COMPARISONS.penrose_twistor.twistor_core.lie_audit import (
     killing_form,
     signature_of_symmetric_form,
     trace_invariants,
+    _closure_sympy,
+    _structure_constants_sympy,
 )
 
 from THEORY_COMPARISONS.penrose_twistor.experiments.e08_lie_algebra_audit import (
@@ -173,6 +175,23 @@ def test_structure_constants_antisymmetry():
     print("✓ Structure constants antisymmetry verified")
 
 
+def test_exact_path_matches_sympy_path():
+    """Incremental Gaussian-rational closure agrees with full recomputation."""
+    # Generates sl(3, C): 8 dimensions after two commutator passes
+    A = Matrix([[0, 1, 0], [0, 0, 0], [0, 0, 0]])
+    B = Matrix([[0, 0, 0], [0, 0, I / 2], [0, 0, 0]])
+    C = Matrix([[0, 0, 0], [0, 0, 0], [3, 0, 0]])
+    
+    basis, info = closure_under_commutator([A, B, C, A + C])
+    basis_ref, info_ref = _closure_sympy([A, B, C, A + C], max_iters=6)
+    assert info == info_ref
+    assert basis == basis_ref
+    assert len(basis) == 8
+    
+    assert structure_constants(basis) == _structure_constants_sympy(basis)
+    print(f"✓ Exact closure matches sympy path: {info['dims_per_iter']}")
+
+
 def test_killing_form_symmetry():
     """Test that Killing form is symmetric."""
     # Use su(2)
@@ -398,6 +417,7 @@ def main():
     test_closure_su2_already_closed()
     test_closure_grows_dimension()
     test_structure_constants_antisymmetry()
+    test_exact_path_matches_sympy_path()
     test_killing_form_symmetry()
     test_killing_form_semisimple_su2()
     test_signature_positive_definite()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+test_lie_cache.py - Tests for the content-addressed Lie audit cache
+
+Checks that cached structure constants, Killing forms, signatures and trace
+invariants equal freshly computed ones, survive a new process-wide cache
+instance (disk round trip) and that damaged files are treated as misses.
+
+Author: UBT Research Team
+License: See repository LICENSE.md
+"""
+
+import pytest
+from sympy import Matrix, I, Rational, sqrt
+
+from THEORY_COMPARISONS.penrose_twistor.twistor_core import lie_cache
+from THEORY_COMPARISONS.penrose_twistor.twistor_core.lie_cache import (
+    LieAuditCache,
+    basis_key,
+    encode_value,
+    decode_value,
+)
+from THEORY_COMPARISONS.penrose_twistor.twistor_core.lie_audit import (
+    structure_constants,
+    killing_form,
+    signature_of_symmetric_form,
+    trace_invariants,
+)
+
+
+SU2 = [
+    Matrix([[0, 1], [-1, 0]]) * I,
+    Matrix([[0, I], [I, 0]]),
+    Matrix([[I, 0], [0, -I]]),
+]
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Route lie_audit through a fresh cache in a temporary directory."""
+    cache = LieAuditCache(tmp_path)
+    lie_cache.set_cache(cache)
+    yield cache
+    lie_cache.set_cache(None)
+
+
+def _audit(basis):
+    struct = structure_constants(basis)
+    K = killing_form(basis, struct)
+    return struct, K, signature_of_symmetric_form(K), trace_invariants(basis)
+
+
+def test_encoding_is_exact():
+    """Gaussian rationals and general expressions round-trip exactly."""
+    for value in [0, Rational(-7, 3), 2 * I, Rational(1, 2) - Rational(5, 4) * I,
+                  sqrt(3) / 2]:
+        assert decode_value(encode_value(value)) == value
+    assert encode_value(Rational(1, 2) + 3 * I) == ["1/2", "3"]
+    print("✓ Exact value encoding round-trips")
+
+
+def test_basis_key_is_content_addressed():
+    """Equal matrices give equal keys; order and entries matter."""
+    copy = [Matrix(M) for M in SU2]
+    assert basis_key(copy) == basis_key(SU2)
+    assert basis_key(SU2[::-1]) != basis_key(SU2)
+    assert basis_key([2 * SU2[0]] + SU2[1:]) != basis_key(SU2)
+
+
+def test_cached_results_match_fresh(disk_cache, tmp_path):
+    """Second audit (memory and disk) reproduces the first exactly."""
+    fresh = _audit(SU2)
+    assert sum(fresh[2]) == 3
+    assert len(list(tmp_path.glob("*.json"))) == 3   # basis, struct, K
+
+    from_memory = _audit(SU2)
+    lie_cache.set_cache(LieAuditCache(tmp_path))
+    from_disk = _audit(SU2)
+    for result in (from_memory, from_disk):
+        assert result[0] == fresh[0]
+        assert result[1] == fresh[1]
+        assert result[2] == fresh[2]
+        assert result[3] == fresh[3]
+    print("✓ Cached audit matches fresh computation")
+
+
+def test_damaged_file_is_a_miss(disk_cache, tmp_path):
+    """A corrupt cache file is ignored and rewritten."""
+    expected = structure_constants(SU2)
+    path = tmp_path / f"{basis_key(SU2)}.json"
+    path.write_text("{not json")
+    lie_cache.set_cache(LieAuditCache(tmp_path))
+    assert structure_constants(SU2) == expected
+    assert path.read_text().startswith("{\"version\"")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
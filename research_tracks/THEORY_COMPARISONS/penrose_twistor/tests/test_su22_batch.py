@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+test_su22_batch.py - Tests for the batched NumPy SU(2,2) / twistor kernel
+
+Checks the stacked-array functions against their sympy counterparts and
+the defining invariants on many random elements.
+
+Author: UBT Research Team
+License: See repository LICENSE.md
+"""
+
+import numpy as np
+import pytest
+from sympy import Matrix, I
+from THEORY_COMPARISONS.penrose_twistor.twistor_core import batch
+from THEORY_COMPARISONS.penrose_twistor.twistor_core.su22 import (
+    random_su22_lie_element,
+    cayley_transform,
+    normalize_det,
+    is_H_unitary,
+)
+from THEORY_COMPARISONS.penrose_twistor.twistor_core.conformal import (
+    mobius_transform_X,
+    verify_null_preservation,
+)
+
+
+def _series_expm(A, terms=60):
+    """Reference exp(A) by a long Taylor series (small ||A|| only)."""
+    out = np.broadcast_to(np.eye(A.shape[-1], dtype=complex), A.shape).copy()
+    term = out.copy()
+    for k in range(1, terms):
+        term = term @ A / k
+        out += term
+    return out
+
+
+def test_expm_matches_series():
+    """expm agrees with a converged Taylor series, also for ||A|| > θ₁₃."""
+    A = batch.random_su22_lie_elements(200, scale=2.0, seed=1)
+    A_small = A / 8.0
+    reference = _series_expm(A_small)
+    for _ in range(3):                 # exp(A) = exp(A/8)^8
+        reference = reference @ reference
+    assert np.allclose(batch.expm(A), reference, rtol=1e-12, atol=1e-12)
+    print("✓ expm matches Taylor series with squaring")
+
+
+def test_random_elements_in_su22():
+    """Random exp(su(2,2)) elements are H-unitary with det 1."""
+    A = batch.random_su22_lie_elements(5000, scale=0.5, seed=7)
+    assert batch.lie_residual(A).max() < 1e-12
+    U = batch.expm(A)
+    assert batch.is_su22(U, tol=1e-9).all()
+    print("✓ 5000 random elements in SU(2,2)")
+
+
+def test_batched_cayley_is_H_unitary():
+    """Batched Cayley transform preserves H."""
+    A = batch.random_su22_lie_elements(1000, scale=1.0, seed=3)
+    U = batch.cayley_transform(A, alpha=0.05)
+    assert batch.is_H_unitary(U, tol=1e-9).all()
+
+
+def test_matches_sympy_mobius_and_null():
+    """Batched Möbius action and null check agree with the sympy versions."""
+    A = random_su22_lie_element(seed=54321, scale=0.8)
+    U = normalize_det(cayley_transform(A, alpha=0.05))
+    U_np = batch.from_sympy(U)[None]
+    assert is_H_unitary(U) == bool(batch.is_H_unitary(U_np)[0])
+
+    X = Matrix([[2, 1 + I], [1 - I, 3]])
+    X_prime = batch.from_sympy(mobius_transform_X(U, X))
+    X_prime_batch = batch.mobius_transform_X(U_np, batch.from_sympy(X))[0]
+    assert np.allclose(X_prime, X_prime_batch, atol=1e-12)
+
+    X_null = Matrix([[1, 1], [1, 1]])
+    expected = verify_null_preservation(U, X_null)
+    result = batch.verify_null_preservation(U_np, batch.from_sympy(X_null))
+    assert bool(result['null_preserved'][0]) == expected['null_preserved']
+    assert abs(complex(expected['det_X_prime']) - result['det_X_prime'][0]) < 1e-12
+
+
+def test_null_preservation_batched():
+    """Light cone is preserved for many random elements and null points."""
+    U = batch.random_su22_elements(20000, scale=0.1, seed=11)
+    X = batch.random_null_X(len(U), seed=12)
+    result = batch.verify_null_preservation(U, X, tol=1e-8)
+    assert result['X_is_null'].all()
+    assert result['null_preserved'].all()
+
+
+def test_incidence_roundtrip():
+    """Twistors built from (X, π) satisfy ω = i X π; x ↔ X round-trips."""
+    rng = np.random.default_rng(5)
+    x = rng.normal(size=(1000, 4))
+    X = batch.x_to_X(x)
+    assert np.allclose(batch.X_to_x(X), x)
+    assert np.allclose(batch.det2(X).real, x[:, 0]**2 - (x[:, 1:]**2).sum(axis=1))
+
+    pi = rng.normal(size=(1000, 2)) + 1j * rng.normal(size=(1000, 2))
+    Z = batch.twistor_from_X_pi(X, pi)
+    assert batch.check_incidence(Z, X).all()
+    assert not batch.check_incidence(Z + 0.1, X).any()
+
+
+def test_twistor_inner_invariant():
+    """⟨UZ₁, UZ₂⟩ = ⟨Z₁, Z₂⟩ for U in SU(2,2)."""
+    rng = np.random.default_rng(9)
+    U = batch.random_su22_elements(1000, scale=0.3, seed=10)
+    Z1 = rng.normal(size=(1000, 4)) + 1j * rng.normal(size=(1000, 4))
+    Z2 = rng.normal(size=(1000, 4)) + 1j * rng.normal(size=(1000, 4))
+    before = batch.twistor_inner(Z1, Z2)
+    after = batch.twistor_inner(batch.transform_twistor(U, Z1),
+                                batch.transform_twistor(U, Z2))
+    assert np.allclose(before, after, atol=1e-10)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -8,9 +8,10 @@ Modules:
 - twistor: Twistor dataclass and incidence relation
 - su22: SU(2,2) Hermitian form and invariants
 - ubt_bridge: Embedding into UBT 4×4 matrix framework
+- batch: Batched NumPy SU(2,2) / twistor kernel (stacked N×4×4 arrays)
 
 Author: UBT Research Team
 License: See repository LICENSE.md
 """
 
-__all__ = ['minkowski_spinor', 'twistor', 'su22', 'ubt_bridge']
+__all__ = ['minkowski_spinor', 'twistor', 'su22', 'ubt_bridge', 'batch']
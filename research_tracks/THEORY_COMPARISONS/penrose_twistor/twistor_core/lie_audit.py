@@ -12,14 +12,40 @@ represented as matrix generators. It computes:
 Key operations are performed using exact sympy Rational arithmetic where possible,
 falling back to high-precision numerical evaluation only for eigenvalues.
 
+When every entry is a Gaussian rational (a + b·i with a, b ∈ Q), closure and
+structure constants run on sympy's ZZ_I / QQ_I domain elements instead of
+symbolic expressions: the closure keeps a fraction-free echelon form and only
+commutes new elements against the existing basis, and all [T_i, T_j] are
+expanded in the basis with one factorisation of the basis matrix. Other inputs (symbols, surds)
+use the generic sympy path.
+
+Structure constants, Killing form, signature and trace invariants are
+memoised in the content-addressed cache of lie_cache (in memory and on disk),
+so repeated audits of the same basis skip the symbolic algebra.
+
 Author: UBT Research Team
 License: See repository LICENSE.md
 """
 
+from math import lcm
+
 import sympy as sp
 from sympy import Matrix, Rational, simplify, eye, zeros, nsimplify
+from sympy.polys.domains import ZZ_I, QQ_I
+from sympy.polys.matrices import DomainMatrix
+from sympy.polys.polyerrors import CoercionFailed
 from typing import List, Tuple, Dict, Optional
 
+from THEORY_COMPARISONS.penrose_twistor.twistor_core.lie_cache import (
+    basis_key,
+    struct_key,
+    encode_value,
+    decode_value,
+    encode_matrix,
+    decode_matrix,
+    get_cache,
+)
+
 
 def comm(A: Matrix, B: Matrix) -> Matrix:
     """
@@ -149,6 +175,179 @@ def basis_reduce(mats: List[Matrix], tol: float = 0) -> Tuple[List[Matrix], Dict
     return basis_mats, transform_info
 
 
+def gaussian_matrix(M: Matrix, domain=ZZ_I) -> Optional[DomainMatrix]:
+    """
+    Convert a matrix with Gaussian-rational entries to a DomainMatrix.
+    
+    Parameters
+    ----------
+    M : sympy.Matrix
+        Matrix whose entries are of the form a + b*I with rational a, b
+    domain : {ZZ_I, QQ_I}, optional
+        ZZ_I (default) returns M scaled by the common denominator of its
+        entries, so that all entries are Gaussian integers. QQ_I returns
+        M unchanged.
+    
+    Returns
+    -------
+    DomainMatrix or None
+        None if some entry is not a Gaussian rational.
+    
+    Examples
+    --------
+    >>> gaussian_matrix(Matrix([[sp.I / 2, 1]])).to_Matrix()
+    Matrix([[I, 2]])
+    """
+    try:
+        entries = [[QQ_I.from_sympy(M[r, c]) for c in range(M.cols)]
+                   for r in range(M.rows)]
+    except (CoercionFailed, TypeError):
+        return None
+    
+    if domain == QQ_I:
+        return DomainMatrix(entries, M.shape, QQ_I)
+    
+    den = 1
+    for row in entries:
+        for e in row:
+            den = lcm(den, int(e.x.denominator), int(e.y.denominator))
+    scaled = [[ZZ_I(int(e.x.numerator) * (den // int(e.x.denominator)),
+                    int(e.y.numerator) * (den // int(e.y.denominator)))
+               for e in row] for row in entries]
+    return DomainMatrix(scaled, M.shape, ZZ_I)
+
+
+def gaussian_vec(D: DomainMatrix) -> list:
+    """Column-stacked entries of a DomainMatrix (same order as vec)."""
+    return D.transpose().to_list_flat()
+
+
+class FractionFreeEchelon:
+    """
+    Incremental row-echelon form over the Gaussian integers.
+    
+    Vectors are reduced against the stored rows with fraction-free
+    elimination v ← p·v − v[c]·r (p the pivot of row r at column c), and
+    each stored row is divided by the gcd of its entries, so coefficients
+    stay small and no rational arithmetic is needed. Each row has zeros in
+    the pivot columns of all earlier rows, hence reducing in insertion
+    order is sufficient.
+    
+    Examples
+    --------
+    >>> ech = FractionFreeEchelon()
+    >>> ech.add([ZZ_I(1), ZZ_I(0)]), ech.add([ZZ_I(2), ZZ_I(0)])
+    (True, False)
+    >>> ech.rank
+    1
+    """
+    
+    def __init__(self):
+        self.rows = []      # list of (pivot_column, row)
+    
+    @property
+    def rank(self) -> int:
+        return len(self.rows)
+    
+    @property
+    def pivots(self) -> List[int]:
+        return [c for c, _ in self.rows]
+    
+    def reduce(self, v: list) -> list:
+        """Reduce v against the echelon rows; zero iff v is in their span."""
+        v = list(v)
+        for c, r in self.rows:
+            a = v[c]
+            if a:
+                p = r[c]
+                v = [p * x - a * y for x, y in zip(v, r)]
+        return v
+    
+    def add(self, v: list) -> bool:
+        """Insert v if it is independent of the rows; return whether it was."""
+        v = self.reduce(v)
+        pivot = next((k for k, x in enumerate(v) if x), None)
+        if pivot is None:
+            return False
+        g = ZZ_I.zero
+        for x in v:
+            if x:
+                g = ZZ_I.gcd(g, x)
+        if g != ZZ_I.one:
+            v = [ZZ_I.exquo(x, g) for x in v]
+        self.rows.append((pivot, v))
+        return True
+
+
+class IncrementalClosure:
+    """
+    Commutator closure engine for Gaussian-rational matrix Lie algebras.
+    
+    Holds the current basis (the original sympy matrices), their scaled
+    Gaussian-integer forms and a FractionFreeEchelon of their vectorizations.
+    Each step() only commutes the elements added by the previous step
+    against the whole basis; commutators of older pairs are already in the
+    span and need not be recomputed.
+    
+    Parameters
+    ----------
+    gens : list of sympy.Matrix
+        Generators with Gaussian-rational entries. The first linearly
+        independent subset (the rref pivot columns, as in basis_reduce)
+        becomes the initial basis.
+    
+    Raises
+    ------
+    ValueError
+        If a generator is not a Gaussian-rational matrix or shapes differ.
+    """
+    
+    def __init__(self, gens: List[Matrix]):
+        self.basis = []
+        self._exact = []
+        self._echelon = FractionFreeEchelon()
+        self._shape = gens[0].shape if gens else None
+        self._n_old = 0
+        for M in gens:
+            if M.shape != self._shape:
+                raise ValueError("All matrices must have same shape")
+            D = gaussian_matrix(M)
+            if D is None:
+                raise ValueError("Generators must have Gaussian-rational entries")
+            self._try_add(M, D)
+    
+    def _try_add(self, M: Matrix, D: DomainMatrix) -> bool:
+        if not self._echelon.add(gaussian_vec(D)):
+            return False
+        self.basis.append(M)
+        self._exact.append(D)
+        return True
+    
+    def step(self) -> int:
+        """
+        Add the independent commutators [T_i, T_j], i < j, that involve an
+        element added since the previous step.
+        
+        Candidates are visited in the same (i, j) order as a full
+        recomputation, so the resulting basis is identical. Returns the
+        number of elements added.
+        """
+        n = len(self.basis)
+        n_old = self._n_old
+        self._n_old = n
+        added = 0
+        for i in range(n):
+            for j in range(max(i + 1, n_old), n):
+                A, B = self._exact[i], self._exact[j]
+                if self._echelon.add(gaussian_vec(A * B - B * A)):
+                    # Store the exact commutator of the stored matrices
+                    C = comm(self.basis[i], self.basis[j])
+                    self.basis.append(C)
+                    self._exact.append(gaussian_matrix(C))
+                    added += 1
+        return added
+
+
 def closure_under_commutator(
     gens: List[Matrix],
     max_iters: int = 6
@@ -189,6 +388,37 @@ def closure_under_commutator(
     >>> info['converged']
     True
     """
+    if gens and all(gaussian_matrix(M) is not None for M in gens):
+        return _closure_exact(gens, max_iters)
+    return _closure_sympy(gens, max_iters)
+
+
+def _closure_exact(gens: List[Matrix], max_iters: int) -> Tuple[List[Matrix], Dict]:
+    """Closure via IncrementalClosure (Gaussian-rational generators)."""
+    engine = IncrementalClosure(gens)
+    dims_per_iter = [len(engine.basis)]
+    
+    for iteration in range(max_iters):
+        added = engine.step()
+        dims_per_iter.append(len(engine.basis))
+        if added == 0:
+            metadata = {
+                'iterations': iteration + 1,
+                'dims_per_iter': dims_per_iter,
+                'converged': True
+            }
+            return list(engine.basis), metadata
+    
+    metadata = {
+        'iterations': max_iters,
+        'dims_per_iter': dims_per_iter,
+        'converged': False
+    }
+    return list(engine.basis), metadata
+
+
+def _closure_sympy(gens: List[Matrix], max_iters: int) -> Tuple[List[Matrix], Dict]:
+    """Closure by full recomputation and rref (generic sympy entries)."""
     # Start with initial basis
     current_basis, _ = basis_reduce(gens)
     dims_per_iter = [len(current_basis)]
@@ -267,6 +497,85 @@ def structure_constants(basis: List[Matrix]) -> Dict[Tuple[int, int, int], sp.Ex
     >>> struct[(0, 1, 2)]  # c_{01}^2
     2*I
     """
+    if not basis:
+        return {}
+    cache = get_cache()
+    key = basis_key(basis)
+    stored = cache.get(key, 'structure_constants')
+    if stored is not None:
+        return {(i, j, k): decode_value(c) for i, j, k, c in stored}
+    
+    struct = _structure_constants_exact(basis)
+    if struct is None:
+        struct = _structure_constants_sympy(basis)
+    cache.put(key, 'structure_constants',
+              [[i, j, k, encode_value(c)] for (i, j, k), c in sorted(struct.items())])
+    return struct
+
+
+def _structure_constants_exact(
+    basis: List[Matrix]
+) -> Optional[Dict[Tuple[int, int, int], sp.Expr]]:
+    """
+    Structure constants over QQ_I with one factorisation for all commutators.
+    
+    The basis is vectorized into the columns of M; n rows of M on which it
+    is invertible are taken from the echelon pivots, M_P is inverted once
+    and applied to the stacked right-hand sides of all n(n-1) commutators.
+    Returns None if an entry is not a Gaussian rational or the basis is
+    dependent.
+    """
+    n = len(basis)
+    exact = [gaussian_matrix(T, QQ_I) for T in basis]
+    if any(D is None for D in exact):
+        return None
+    exact = [D.to_sparse() for D in exact]
+    
+    echelon = FractionFreeEchelon()
+    for T in basis:
+        if not echelon.add(gaussian_vec(gaussian_matrix(T))):
+            return None
+    rows = sorted(echelon.pivots)
+    
+    vecs = [gaussian_vec(D) for D in exact]
+    vec_dim = len(vecs[0])
+    pairs = [(i, j) for i in range(n) for j in range(n) if i != j]
+    rhs = [gaussian_vec(exact[i] * exact[j] - exact[j] * exact[i])
+           for i, j in pairs]
+    
+    M = DomainMatrix([[v[r] for v in vecs] for r in range(vec_dim)],
+                     (vec_dim, n), QQ_I)
+    M_P = DomainMatrix([[v[r] for v in vecs] for r in rows], (n, n), QQ_I)
+    B_P = DomainMatrix([[b[r] for b in rhs] for r in rows],
+                       (n, len(pairs)), QQ_I)
+    X = M_P.inv().to_sparse() * B_P.to_sparse()
+    
+    # Pivot rows determine the coefficients; check them on all rows
+    fitted = (M.to_sparse() * X).transpose().to_list()
+    X = X.to_list()
+    
+    struct_const = {}
+    for col, (i, j) in enumerate(pairs):
+        coeffs = [X[k][col] for k in range(n)]
+        if fitted[col] != rhs[col]:
+            # Commutator not in the span (basis not closed): least squares
+            try:
+                ls = M.to_Matrix().solve_least_squares(
+                    vec(comm(basis[i], basis[j])))
+            except Exception:
+                continue
+            coeffs = [simplify(ls[k]) for k in range(n)]
+        else:
+            coeffs = [QQ_I.to_sympy(c) for c in coeffs]
+        
+        for k in range(n):
+            if coeffs[k] != 0:
+                struct_const[(i, j, k)] = coeffs[k]
+    return struct_const
+
+
+def _structure_constants_sympy(basis: List[Matrix]) -> Dict[Tuple[int, int, int], sp.Expr]:
+    """Structure constants with one least-squares solve per pair (generic)."""
     n = len(basis)
     struct_const = {}
     
@@ -348,8 +657,13 @@ def killing_form(basis: List[Matrix], struct: Dict[Tuple[int, int, int], sp.Expr
     -64
     """
     n = len(basis)
-    K = zeros(n, n)
+    cache = get_cache()
+    key = struct_key(n, struct)
+    stored = cache.get(key, 'killing')
+    if stored is not None:
+        return decode_matrix(stored) if n else zeros(0, 0)
     
+    K = zeros(n, n)
     for i in range(n):
         for j in range(n):
             # K_ij = sum_{m,n} c_{im}^n * c_{jn}^m
@@ -366,6 +680,7 @@ def killing_form(basis: List[Matrix], struct: Dict[Tuple[int, int, int], sp.Expr
             
             K[i, j] = simplify(sum_val)
     
+    cache.put(key, 'killing', encode_matrix(K))
     return K
 
 
@@ -399,6 +714,12 @@ def signature_of_symmetric_form(K: Matrix) -> Tuple[int, int, int]:
     >>> signature_of_symmetric_form(K)
     (1, 1, 0)
     """
+    cache = get_cache()
+    key = basis_key([K])
+    stored = cache.get(key, 'signature')
+    if stored is not None:
+        return tuple(stored)
+    
     # Symmetrize just in case
     K_sym = (K + K.T) / 2
     
@@ -435,6 +756,7 @@ def signature_of_symmetric_form(K: Matrix) -> Tuple[int, int, int]:
                 else:
                     n_neg += multiplicity
     
+    cache.put(key, 'signature', [n_pos, n_neg, n_zero])
     return (n_pos, n_neg, n_zero)
 
 
@@ -465,6 +787,18 @@ def trace_invariants(basis: List[Matrix]) -> Dict:
     [0]
     """
     n = len(basis)
+    cache = get_cache()
+    key = basis_key(basis)
+    stored = cache.get(key, 'trace_invariants') if n else None
+    if stored is not None:
+        trace_products = {}
+        for i, j, v in stored['trace_products']:
+            trace_products[(i, j)] = decode_value(v)
+            trace_products[(j, i)] = decode_value(v)
+        return {
+            'traces': [decode_value(v) for v in stored['traces']],
+            'trace_products': trace_products
+        }
     
     traces = []
     for i in range(n):
@@ -478,6 +812,12 @@ def trace_invariants(basis: List[Matrix]) -> Dict:
             if i != j:
                 trace_products[(j, i)] = prod  # Symmetric
     
+    if n:
+        cache.put(key, 'trace_invariants', {
+            'traces': [encode_value(t) for t in traces],
+            'trace_products': [[i, j, encode_value(v)]
+                               for (i, j), v in trace_products.items() if i <= j]
+        })
     return {
         'traces': traces,
         'trace_products': trace_products
@@ -0,0 +1,211 @@
+"""
+lie_cache.py - Content-addressed on-disk cache for Lie algebra audits
+
+Structure constants, Killing matrices, signatures and trace invariants are
+pure functions of the basis matrices, so they are stored under a canonical
+hash of those matrices (the Killing matrix under a hash of the structure
+constants it is built from) and reused by later calls and later processes
+(test runs, re-runs of e08).
+
+Layout
+------
+One JSON file per key in the cache directory (default
+~/.cache/ubt/lie_audit, override with the environment variable
+UBT_LIE_AUDIT_CACHE; set it to "off" to disable the disk cache). Each file
+maps field names ('structure_constants', 'killing', 'signature',
+'trace_invariants') to exactly encoded values:
+
+- a Gaussian rational a + b*I is stored as ["a", "b"] with a, b written as
+  "p" or "p/q";
+- any other sympy expression is stored as {"srepr": ...}.
+
+The key is the SHA-256 of the shapes and srepr of all entries, prefixed with
+CACHE_FORMAT_VERSION. A missing, stale or unreadable file is treated as a
+miss. Values are additionally kept in memory for the lifetime of the
+process.
+
+Author: UBT Research Team
+License: See repository LICENSE.md
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import sympy as sp
+from sympy import Matrix
+from sympy.polys.domains import QQ_I
+from sympy.polys.polyerrors import CoercionFailed
+
+
+#: Bump when the key derivation or the on-disk encoding changes.
+CACHE_FORMAT_VERSION = 1
+
+CACHE_ENV_VAR = "UBT_LIE_AUDIT_CACHE"
+
+_DISABLED = ("off", "0", "none", "false")
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Return the cache directory, or None if the disk cache is disabled."""
+    override = os.environ.get(CACHE_ENV_VAR)
+    if override:
+        if override.strip().lower() in _DISABLED:
+            return None
+        return Path(override)
+    return Path.home() / ".cache" / "ubt" / "lie_audit"
+
+
+def basis_key(mats: List[Matrix]) -> str:
+    """
+    Canonical hash of an ordered list of sympy matrices.
+
+    Parameters
+    ----------
+    mats : list of sympy.Matrix
+        Matrices (e.g. a Lie algebra basis, or a single Killing matrix)
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest; equal for matrices with identical entries.
+
+    Examples
+    --------
+    >>> basis_key([Matrix([[1, 0], [0, -1]])]) == basis_key([Matrix([[1, 0], [0, -1]])])
+    True
+    """
+    h = hashlib.sha256(f"lie_audit/v{CACHE_FORMAT_VERSION}".encode())
+    for M in mats:
+        h.update(f"|{M.rows}x{M.cols}:".encode())
+        h.update(";".join(sp.srepr(e) for e in M).encode())
+    return h.hexdigest()
+
+
+def struct_key(n: int, struct: Dict) -> str:
+    """Canonical hash of a structure-constant dict for an n-dim algebra."""
+    h = hashlib.sha256(f"lie_audit/v{CACHE_FORMAT_VERSION}/struct:{n}".encode())
+    for (i, j, k), c in sorted(struct.items()):
+        h.update(f"|{i},{j},{k}:{sp.srepr(sp.sympify(c))}".encode())
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Exact encoding
+# ---------------------------------------------------------------------------
+
+def encode_value(expr):
+    """Encode a sympy number/expression as JSON-serialisable exact data."""
+    expr = sp.sympify(expr)
+    try:
+        z = QQ_I.from_sympy(expr)
+    except (CoercionFailed, TypeError):
+        return {"srepr": sp.srepr(expr)}
+    return [str(sp.Rational(z.x.numerator, z.x.denominator)),
+            str(sp.Rational(z.y.numerator, z.y.denominator))]
+
+
+def decode_value(data) -> sp.Expr:
+    """Inverse of encode_value."""
+    if isinstance(data, dict):
+        return sp.sympify(data["srepr"])
+    re, im = data
+    return sp.Rational(re) + sp.I * sp.Rational(im)
+
+
+def encode_matrix(M: Matrix) -> list:
+    return [[encode_value(M[i, j]) for j in range(M.cols)] for i in range(M.rows)]
+
+
+def decode_matrix(rows: list) -> Matrix:
+    return Matrix([[decode_value(v) for v in row] for row in rows])
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+class LieAuditCache:
+    """
+    Content-addressed store of exact Lie audit results.
+
+    Parameters
+    ----------
+    cache_dir : str or Path, optional
+        Directory for the JSON files. None keeps results in memory only.
+
+    Examples
+    --------
+    >>> cache = LieAuditCache(None)
+    >>> key = basis_key([Matrix([[0, 1], [0, 0]])])
+    >>> cache.put(key, 'signature', [0, 0, 1])
+    >>> cache.get(key, 'signature')
+    [0, 0, 1]
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._memory: Dict[str, Dict] = {}
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _entry(self, key: str) -> Dict:
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+        entry = {}
+        if self.cache_dir is not None:
+            try:
+                with open(self._path(key), encoding="utf-8") as fh:
+                    data = json.load(fh)
+                if data.get("version") == CACHE_FORMAT_VERSION:
+                    entry = data.get("fields", {})
+            except (OSError, ValueError, AttributeError):
+                entry = {}
+        self._memory[key] = entry
+        return entry
+
+    def get(self, key: str, field: str):
+        """Encoded value of field under key, or None on a miss."""
+        return self._entry(key).get(field)
+
+    def put(self, key: str, field: str, value) -> None:
+        """Store an encoded value; write-through to disk if enabled."""
+        entry = self._entry(key)
+        entry[field] = value
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self._path(key).with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump({"version": CACHE_FORMAT_VERSION, "fields": entry},
+                          fh, separators=(",", ":"))
+            os.replace(tmp, self._path(key))
+        except OSError:
+            # Read-only or full disk: keep the in-memory copy only
+            pass
+
+    def clear_memory(self) -> None:
+        """Forget in-memory entries (the disk files are kept)."""
+        self._memory.clear()
+
+
+_DEFAULT_CACHE: Optional[LieAuditCache] = None
+
+
+def get_cache() -> LieAuditCache:
+    """Process-wide cache used by lie_audit (created on first use)."""
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = LieAuditCache(default_cache_dir())
+    return _DEFAULT_CACHE
+
+
+def set_cache(cache: Optional[LieAuditCache]) -> None:
+    """Replace the process-wide cache (None: re-read the environment)."""
+    global _DEFAULT_CACHE
+    _DEFAULT_CACHE = cache
@@ -24,6 +24,7 @@ from THEORY_COMPARISONS.penrose_twistor.twistor_core.twistor import Twistor
 from THEORY_COMPARISONS.penrose_twistor.twistor_core.numeric import (
     norm_fro, max_abs, close_matrix, seeded_rng, random_complex
 )
+from THEORY_COMPARISONS.penrose_twistor.twistor_core import batch
 
 
 def get_su22_hermitian_form():
@@ -494,31 +495,16 @@ def exponentiate_su22_algebra(A, numeric=True):
     
     Notes
     -----
-    Numeric exponentiation uses series expansion or sympy's exp method.
-    For small parameters, first-order U ≈ I + A is often sufficient.
+    Numeric exponentiation uses batch.expm (Padé scaling and squaring),
+    accurate to machine precision for any size of A.
     """
     if numeric:
-        # Use sympy's matrix exponential
-        # For small A, we can use Taylor series
-        I4 = eye(4)
-        
-        # First check if A is small enough for first-order approximation
         try:
-            A_numeric = A.evalf()
-            max_entry = max(abs(complex(A_numeric[i, j])) 
-                          for i in range(4) for j in range(4))
-            
-            if max_entry < 0.2:
-                # Use first-order: exp(A) ≈ I + A
-                U = I4 + A
-            else:
-                # Use higher order Taylor series: exp(A) ≈ I + A + A²/2
-                U = I4 + A + (A*A)/2
-            
-            return U.evalf()
-        except:
-            # Fall back to symbolic
+            A_numeric = batch.from_sympy(A)
+        except (TypeError, ValueError):
+            # Free symbols: fall back to symbolic
             return sp.exp(A)
+        return batch.to_sympy(batch.expm(A_numeric))
     else:
         # Symbolic exponential (not evaluated)
         return sp.exp(A)
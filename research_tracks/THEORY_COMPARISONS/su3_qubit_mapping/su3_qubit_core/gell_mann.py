@@ -17,6 +17,11 @@ import numpy as np
 from itertools import product as iproduct
 
 
+# f_{abc} and d_{abc} of the standard matrices, computed once per process.
+# λ₈ carries 1/√3, so these stay float tensors rather than exact rationals.
+_DEFAULT_TENSORS = {}
+
+
 # ---------------------------------------------------------------------------
 # Gell-Mann matrices
 # ---------------------------------------------------------------------------
@@ -91,7 +96,9 @@ def structure_constants(lam=None):
         f[a, b, c] = f_{(a+1)(b+1)(c+1)}.
     """
     if lam is None:
-        lam = gell_mann_matrices()
+        if 'f' not in _DEFAULT_TENSORS:
+            _DEFAULT_TENSORS['f'] = structure_constants(gell_mann_matrices())
+        return _DEFAULT_TENSORS['f'].copy()
     n = 8
     f = np.zeros((n, n, n), dtype=float)
     for a, b in iproduct(range(n), range(n)):
@@ -121,7 +128,9 @@ def symmetric_d_tensor(lam=None):
         d[a, b, c] = d_{(a+1)(b+1)(c+1)}.
     """
     if lam is None:
-        lam = gell_mann_matrices()
+        if 'd' not in _DEFAULT_TENSORS:
+            _DEFAULT_TENSORS['d'] = symmetric_d_tensor(gell_mann_matrices())
+        return _DEFAULT_TENSORS['d'].copy()
     n = 8
     d = np.zeros((n, n, n), dtype=float)
     for a, b in iproduct(range(n), range(n)):
@@ -55,7 +55,9 @@ import numpy as np
 from itertools import product as iproduct
 
 from .gell_mann import gell_mann_matrices, structure_constants
-from .qubit_ops import pauli_decompose, tensor3, pauli_matrices
+from .qubit_ops import (
+    pauli_decompose, pauli_decompose_batch, tensor3, pauli_matrices,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -157,7 +159,7 @@ def all_gell_mann_qubit_decompositions(threshold=1e-10):
         decomps[a] maps (i,j,k) → coefficient for generator λ_{a+1}.
     """
     L = lift_gell_mann()
-    return [pauli_decompose(La, threshold=threshold) for La in L]
+    return pauli_decompose_batch(np.stack(L), threshold=threshold)
 
 
 # ---------------------------------------------------------------------------
@@ -14,6 +14,13 @@ Basis operators: σ_a ⊗ σ_b ⊗ σ_c,  a,b,c ∈ {0,1,2,3}  (64 total)
 Decomposition: M = Σ_{abc} coeff(a,b,c) · σ_a⊗σ_b⊗σ_c
                coeff(a,b,c) = Tr[M · (σ_a⊗σ_b⊗σ_c)] / 8
 
+The same conventions extend to n qubits (4ⁿ operators on ℂ^(2ⁿ)); the flat
+coefficient index is a·4^(n-1) + b·4^(n-2) + ..., i.e. the order of
+itertools.product(range(4), repeat=n). Stacks of matrices are decomposed
+either against the precomputed basis tensor with one einsum (16ⁿ work per
+matrix) or by a Walsh–Hadamard-style transform that acts on one qubit at a
+time (n·4ⁿ work, no basis tensor), which is the one to use beyond ~4 qubits.
+
 Author: UBT Research Team
 License: See repository LICENSE.md
 """
@@ -24,6 +31,9 @@ from itertools import product as iproduct
 # Labels for Pauli indices
 _PAULI_LABELS = ['I', 'X', 'Y', 'Z']
 
+# Read-only (4ⁿ, 2ⁿ, 2ⁿ) basis tensors by qubit count
+_BASIS_TENSORS = {}
+
 
 # ---------------------------------------------------------------------------
 # Pauli matrices
@@ -67,6 +77,52 @@ def tensor3(A, B, C):
 # Pauli basis and decomposition
 # ---------------------------------------------------------------------------
 
+def pauli_indices(n_qubits=3):
+    """Return the Pauli index tuples in flat-coefficient order.
+
+    Parameters
+    ----------
+    n_qubits : int
+        Number of qubits.
+
+    Returns
+    -------
+    list of tuple of int
+        Entry k is the tuple (a, b, ...) of the k-th basis operator.
+    """
+    return list(iproduct(range(4), repeat=n_qubits))
+
+
+def pauli_basis_tensor(n_qubits=3):
+    """Return all 4ⁿ Pauli tensor-product operators as one stacked array.
+
+    The array is built once per qubit count and cached; it is read-only.
+    Memory grows as 16ⁿ (n = 6 already needs ~270 MB), so for larger
+    registers use :func:`pauli_coefficients_fast` instead.
+
+    Parameters
+    ----------
+    n_qubits : int
+        Number of qubits (default 3 → shape (64, 8, 8)).
+
+    Returns
+    -------
+    numpy.ndarray, shape (4ⁿ, 2ⁿ, 2ⁿ), dtype complex
+        basis[k] = σ_a ⊗ σ_b ⊗ ... for the k-th tuple of pauli_indices(n).
+    """
+    basis = _BASIS_TENSORS.get(n_qubits)
+    if basis is None:
+        paulis = np.array(pauli_matrices())
+        basis = np.ones((1, 1, 1), dtype=complex)
+        for _ in range(n_qubits):
+            k, d = basis.shape[0], basis.shape[1]
+            basis = np.einsum('aij,bkl->abikjl', basis, paulis).reshape(
+                4 * k, 2 * d, 2 * d)
+        basis.setflags(write=False)
+        _BASIS_TENSORS[n_qubits] = basis
+    return basis
+
+
 def pauli_basis_3qubit():
     """Return all 64 Pauli tensor-product basis operators for 3 qubits.
 
@@ -75,9 +131,97 @@ def pauli_basis_3qubit():
     list of ((int, int, int), numpy.ndarray)
         Each entry is ((a, b, c), matrix) where matrix = σ_a ⊗ σ_b ⊗ σ_c.
     """
-    paulis = pauli_matrices()
-    return [((a, b, c), tensor3(paulis[a], paulis[b], paulis[c]))
-            for a, b, c in iproduct(range(4), range(4), range(4))]
+    basis = pauli_basis_tensor(3)
+    return [(idx, basis[k].copy()) for k, idx in enumerate(pauli_indices(3))]
+
+
+def _n_qubits(M):
+    d = M.shape[-1]
+    n = d.bit_length() - 1
+    if M.shape[-2] != d or d != 1 << n or n < 1:
+        raise ValueError(f"expected (..., 2ⁿ, 2ⁿ) matrices, got shape {M.shape}")
+    return n
+
+
+def pauli_coefficients(M):
+    """Pauli coefficients of one matrix or a stack, via one einsum.
+
+    coeff[..., k] = Tr[M · P_k] / 2ⁿ  with P_k = pauli_basis_tensor(n)[k].
+
+    Parameters
+    ----------
+    M : array_like, shape (..., 2ⁿ, 2ⁿ)
+        Matrix or stack of matrices.
+
+    Returns
+    -------
+    numpy.ndarray, shape (..., 4ⁿ), dtype complex
+    """
+    M = np.asarray(M, dtype=complex)
+    n = _n_qubits(M)
+    return np.einsum('...ij,kji->...k', M, pauli_basis_tensor(n)) / (1 << n)
+
+
+def pauli_coefficients_fast(M):
+    """Pauli coefficients by a Walsh–Hadamard-style per-qubit transform.
+
+    Same result as :func:`pauli_coefficients`, but the trace against each
+    σ_a ⊗ σ_b ⊗ ... factorises over qubits, so the 2×2 map
+    (row bit, column bit) → a is applied to one qubit at a time:
+    O(n·4ⁿ) work per matrix and no 4ⁿ×2ⁿ×2ⁿ basis tensor.
+
+    Parameters
+    ----------
+    M : array_like, shape (..., 2ⁿ, 2ⁿ)
+        Matrix or stack of matrices.
+
+    Returns
+    -------
+    numpy.ndarray, shape (..., 4ⁿ), dtype complex
+    """
+    M = np.asarray(M, dtype=complex)
+    n = _n_qubits(M)
+    lead = M.shape[:-2]
+    # T[a, r, c] = σ_a[c, r] / 2, so Σ_rc M[r, c] T[a, r, c] = Tr[M σ_a] / 2
+    T = np.array(pauli_matrices()).transpose(0, 2, 1) / 2.0
+    X = M.reshape((-1, 1) + M.shape[-2:])
+    for q in range(n):
+        B, K, d = X.shape[0], X.shape[1], X.shape[2] // 2
+        X = X.reshape(B, K, 2, d, 2, d)
+        X = np.einsum('arc,BKrxcy->BKaxy', T, X).reshape(B, 4 * K, d, d)
+    return X.reshape(lead + (4 ** n,))
+
+
+def pauli_reconstruct(coeffs):
+    """Inverse of :func:`pauli_coefficients_fast`: M = Σ_k coeff_k P_k.
+
+    Parameters
+    ----------
+    coeffs : array_like, shape (..., 4ⁿ)
+        Flat Pauli coefficients.
+
+    Returns
+    -------
+    numpy.ndarray, shape (..., 2ⁿ, 2ⁿ), dtype complex
+    """
+    coeffs = np.asarray(coeffs, dtype=complex)
+    n = (coeffs.shape[-1].bit_length() - 1) // 2
+    if coeffs.shape[-1] != 4 ** n or n < 1:
+        raise ValueError(f"expected (..., 4ⁿ) coefficients, got shape {coeffs.shape}")
+    lead = coeffs.shape[:-1]
+    S = np.array(pauli_matrices())
+    X = coeffs.reshape(-1, 4 ** n, 1, 1)
+    for q in range(n):
+        B, K, d = X.shape[0], X.shape[1] // 4, X.shape[2]
+        X = X.reshape(B, K, 4, d, d)
+        X = np.einsum('arc,BKaxy->BKrxcy', S, X).reshape(B, K, 2 * d, 2 * d)
+    return X.reshape(lead + X.shape[-2:])
+
+
+def _coeffs_to_dict(coeffs, n_qubits, threshold):
+    indices = pauli_indices(n_qubits)
+    return {indices[k]: coeffs[k]
+            for k in np.flatnonzero(np.abs(coeffs) > threshold)}
 
 
 def pauli_decompose(M, threshold=1e-12):
@@ -87,12 +231,14 @@ def pauli_decompose(M, threshold=1e-12):
 
     where  coeff(a,b,c) = Tr[M · (σ_a ⊗ σ_b ⊗ σ_c)] / 8.
 
+    A 2ⁿ×2ⁿ matrix is decomposed in the n-qubit basis in the same way.
+
     Parameters
     ----------
     M : numpy.ndarray, shape (8, 8)
         Matrix to decompose.
     threshold : float, optional
-        Coefficients with |coeff| < threshold are omitted (default 1e-12).
+        Coefficients with |coeff| ≤ threshold are omitted (default 1e-12).
 
     Returns
     -------
@@ -100,14 +246,28 @@ def pauli_decompose(M, threshold=1e-12):
         Keys (a, b, c) with a, b, c ∈ {0, 1, 2, 3}; values are the
         (possibly complex) expansion coefficients.
     """
-    paulis = pauli_matrices()
-    result = {}
-    for a, b, c in iproduct(range(4), range(4), range(4)):
-        basis_op = tensor3(paulis[a], paulis[b], paulis[c])
-        coeff = np.trace(M @ basis_op) / 8.0
-        if abs(coeff) > threshold:
-            result[(a, b, c)] = coeff
-    return result
+    M = np.asarray(M, dtype=complex)
+    return _coeffs_to_dict(pauli_coefficients(M), _n_qubits(M), threshold)
+
+
+def pauli_decompose_batch(Ms, threshold=1e-12):
+    """Decompose a stack of matrices; one dict per matrix as in pauli_decompose.
+
+    Parameters
+    ----------
+    Ms : array_like, shape (m, 2ⁿ, 2ⁿ)
+        Matrices to decompose.
+    threshold : float, optional
+        Coefficients with |coeff| ≤ threshold are omitted (default 1e-12).
+
+    Returns
+    -------
+    list of dict mapping tuple → complex
+    """
+    Ms = np.asarray(Ms, dtype=complex)
+    n = _n_qubits(Ms)
+    coeffs = pauli_coefficients(Ms) if n <= 4 else pauli_coefficients_fast(Ms)
+    return [_coeffs_to_dict(c, n, threshold) for c in coeffs]
 
 
 # ---------------------------------------------------------------------------
@@ -24,7 +24,13 @@ from THEORY_COMPARISONS.su3_qubit_mapping.su3_qubit_core.qubit_ops import (
     pauli_matrices,
     tensor3,
     pauli_decompose,
+    pauli_decompose_batch,
     format_pauli_decomp,
+    pauli_indices,
+    pauli_basis_tensor,
+    pauli_coefficients,
+    pauli_coefficients_fast,
+    pauli_reconstruct,
 )
 from THEORY_COMPARISONS.su3_qubit_mapping.su3_qubit_core.gell_mann import (
     gell_mann_matrices,
@@ -191,6 +197,43 @@ def test_pauli_decomposition_reconstruction():
             f"Reconstruction of L_{a+1} failed"
 
 
+def test_batched_pauli_coefficients_match_trace():
+    """einsum and per-qubit transforms agree with Tr[M·σ_a⊗σ_b⊗σ_c]/8."""
+    rng = np.random.default_rng(3)
+    M = rng.normal(size=(5, 8, 8)) + 1j * rng.normal(size=(5, 8, 8))
+    paulis = pauli_matrices()
+    reference = np.array([
+        [np.trace(m @ tensor3(paulis[a], paulis[b], paulis[c])) / 8.0
+         for a, b, c in pauli_indices(3)]
+        for m in M
+    ])
+    assert pauli_basis_tensor(3).shape == (64, 8, 8)
+    assert np.allclose(pauli_coefficients(M), reference, atol=1e-13)
+    assert np.allclose(pauli_coefficients_fast(M), reference, atol=1e-13)
+    assert np.allclose(pauli_coefficients(M[0]), reference[0], atol=1e-13)
+
+
+def test_pauli_decompose_threshold_is_exclusive():
+    """A coefficient equal to the threshold is dropped (|coeff| ≤ threshold)."""
+    paulis = pauli_matrices()
+    M = 0.25 * tensor3(paulis[1], paulis[0], paulis[0])
+    assert pauli_decompose(M, threshold=0.25) == {}
+    assert len(pauli_decompose(M, threshold=0.2)) == 1
+    assert pauli_decompose_batch(np.stack([M, 2 * M]), threshold=0.25)[0] == {}
+    assert len(pauli_decompose_batch(np.stack([M, 2 * M]), threshold=0.25)[1]) == 1
+
+
+def test_fast_pauli_transform_round_trip_6_qubits():
+    """The per-qubit transform inverts exactly on a 6-qubit register."""
+    rng = np.random.default_rng(4)
+    M = rng.normal(size=(2, 64, 64)) + 1j * rng.normal(size=(2, 64, 64))
+    coeffs = pauli_coefficients_fast(M)
+    assert coeffs.shape == (2, 4 ** 6)
+    assert np.allclose(pauli_reconstruct(coeffs), M, atol=1e-12)
+    assert np.allclose(pauli_coefficients_fast(M[:, :16, :16]),
+                       pauli_coefficients(M[:, :16, :16]), atol=1e-13)
+
+
 def test_L1_analytical_pauli_form():
     """L₁ = ¼(σ_x⊗σ_x⊗I + σ_x⊗σ_x⊗σ_z + σ_y⊗σ_y⊗I + σ_y⊗σ_y⊗σ_z)."""
     paulis = pauli_matrices()
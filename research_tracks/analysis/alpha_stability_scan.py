@@ -29,12 +29,94 @@ from typing import List, Dict, Tuple, Optional
 import numpy as np
 
 from analysis.stability_metrics import (
-    compute_all_metrics,
-    is_prime,
-    is_twin_prime
+    compute_all_metrics_batch,
+    prime_flags
 )
 
 
+METRIC_KEYS = ('n', 'is_prime', 'is_twin_prime', 'spectral_gap', 'robustness', 'combined')
+
+
+def scan_arrays(n_min: int, n_max: int,
+                filter_primes: bool = False,
+                filter_twin_primes: bool = False,
+                seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Scan stability metrics over a range of winding numbers as arrays.
+
+    Same candidates and values as scan_range, but returned column-wise
+    (one array per metric key) so ranges up to ~10⁷ stay cheap.
+
+    Args:
+        n_min: Minimum winding number (>= 1)
+        n_max: Maximum winding number (inclusive)
+        filter_primes: If True, only scan prime numbers
+        filter_twin_primes: If True, only scan twin primes
+        seed: Random seed for reproducibility
+
+    Returns:
+        Dictionary mapping each metric key to an array over the candidates
+    """
+    n = np.arange(n_min, n_max + 1, dtype=np.int64)
+    if filter_primes or filter_twin_primes:
+        primes, twins = prime_flags(n)
+        n = n[twins if filter_twin_primes else primes]
+    return compute_all_metrics_batch(n, seed=seed)
+
+
+def rank_order(columns: Dict[str, np.ndarray],
+               metric_key: str = 'combined') -> np.ndarray:
+    """
+    Indices sorting scan_arrays output by a metric (descending).
+
+    Ties keep scan order, as in rank_candidates.
+    """
+    return np.argsort(-columns[metric_key], kind='stable')
+
+
+def top_order(columns: Dict[str, np.ndarray],
+              k: int,
+              metric_key: str = 'combined') -> np.ndarray:
+    """
+    The first k indices of rank_order, without sorting every row.
+
+    np.argpartition finds the k-th largest value; rows above it and the
+    earliest rows equal to it (scan order, as in rank_order) are sorted.
+    """
+    values = columns[metric_key]
+    k = min(k, values.size)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    kth = values[np.argpartition(-values, k - 1)[k - 1]]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - above.size]
+    rows = np.sort(np.concatenate([above, ties]))
+    return rows[np.argsort(-values[rows], kind='stable')]
+
+
+def columns_to_candidates(columns: Dict[str, np.ndarray],
+                          order: Optional[np.ndarray] = None) -> List[Dict]:
+    """
+    Convert scan_arrays output to the list-of-dicts form of scan_range.
+
+    Args:
+        columns: Output of scan_arrays
+        order: Optional row order (e.g. from rank_order); ranks are then
+            added as in rank_candidates
+
+    Returns:
+        List of candidate dictionaries
+    """
+    rows = np.arange(columns['n'].size) if order is None else order
+    lists = {key: columns[key][rows].tolist() for key in METRIC_KEYS}
+    candidates = [dict(zip(METRIC_KEYS, values))
+                  for values in zip(*(lists[key] for key in METRIC_KEYS))]
+    if order is not None:
+        for rank, candidate in enumerate(candidates, start=1):
+            candidate['rank'] = rank
+    return candidates
+
+
 def scan_range(n_min: int, n_max: int, 
                filter_primes: bool = False,
                filter_twin_primes: bool = False,
@@ -52,20 +134,9 @@ def scan_range(n_min: int, n_max: int,
     Returns:
         List of dictionaries with metrics for each candidate
     """
-    candidates = []
-    
-    for n in range(n_min, n_max + 1):
-        # Apply filters
-        if filter_twin_primes and not is_twin_prime(n):
-            continue
-        elif filter_primes and not is_prime(n):
-            continue
-            
-        # Compute all metrics
-        metrics = compute_all_metrics(n, seed=seed)
-        candidates.append(metrics)
-    
-    return candidates
+    columns = scan_arrays(n_min, n_max, filter_primes=filter_primes,
+                          filter_twin_primes=filter_twin_primes, seed=seed)
+    return columns_to_candidates(columns)
 
 
 def rank_candidates(candidates: List[Dict], 
@@ -160,6 +231,63 @@ def find_local_maximum(candidates: List[Dict],
     }
 
 
+def find_local_maximum_arrays(columns: Dict[str, np.ndarray],
+                              target_n: int = 137,
+                              window: int = 5,
+                              metric_key: str = 'combined') -> Dict:
+    """
+    find_local_maximum on scan_arrays output, without building candidates.
+
+    The rank is that of target_n in rank_order; higher neighbors are
+    listed in rank order.
+
+    Args:
+        columns: Output of scan_arrays
+        target_n: Target winding number to check (default 137)
+        window: Size of neighborhood to check (±window)
+        metric_key: Metric to use for comparison
+
+    Returns:
+        Dictionary with analysis results (same keys as find_local_maximum)
+    """
+    n = columns['n']
+    values = columns[metric_key]
+    hits = np.flatnonzero(n == target_n)
+    if hits.size == 0:
+        return {
+            'target_n': target_n,
+            'found': False,
+            'is_local_max': False,
+            'message': f'n={target_n} not found in scan range'
+        }
+
+    i = hits[0]
+    target_value = values[i]
+    rank = int(np.count_nonzero(values > target_value)
+               + np.count_nonzero(values[:i] == target_value)) + 1
+
+    near = (np.abs(n - target_n) <= window) & (n != target_n)
+    higher = np.flatnonzero(near & (values > target_value))
+    n_same = int(np.count_nonzero(near & (values == target_value)))
+    n_lower = int(np.count_nonzero(near & (values < target_value)))
+    higher = higher[np.argsort(-values[higher], kind='stable')]
+
+    return {
+        'target_n': target_n,
+        'found': True,
+        'target_value': target_value.item(),
+        'rank': rank,
+        'is_local_max': higher.size == 0,
+        'is_strict_local_max': higher.size == 0 and n_same == 0,
+        'neighbors_higher': int(higher.size),
+        'neighbors_same': n_same,
+        'neighbors_lower': n_lower,
+        'higher_neighbors': list(zip(n[higher[:3]].tolist(),
+                                     values[higher[:3]].tolist())),
+        'window': window
+    }
+
+
 def save_results(candidates: List[Dict], 
                  output_path: Path,
                  format: str = 'csv') -> None:
@@ -191,22 +319,58 @@ def save_results(candidates: List[Dict],
         print(f"✓ Saved JSON results to: {output_path}")
 
 
+def save_columns(columns: Dict[str, np.ndarray],
+                 output_path: Path,
+                 format: str = 'csv',
+                 metric_key: str = 'combined') -> None:
+    """
+    Save scan_arrays output ranked by a metric, as save_results would.
+
+    CSV rows are written straight from the columns; JSON needs one
+    dictionary per row and goes through columns_to_candidates.
+
+    Args:
+        columns: Output of scan_arrays
+        output_path: Output file path
+        format: Output format ('csv' or 'json')
+        metric_key: Metric to rank by
+    """
+    order = rank_order(columns, metric_key)
+    if format == 'json':
+        save_results(columns_to_candidates(columns, order), output_path, format='json')
+        return
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    lists = [columns[key][order].tolist() for key in METRIC_KEYS]
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(list(METRIC_KEYS) + ['rank'])
+        writer.writerows(zip(*lists, range(1, order.size + 1)))
+
+    print(f"✓ Saved CSV results to: {output_path}")
+
+
 def print_summary(candidates: List[Dict], 
                   local_max_analysis: Dict,
-                  top_k: int = 10) -> None:
+                  top_k: int = 10,
+                  total: Optional[int] = None) -> None:
     """
     Print summary of scan results to console.
     
     Args:
-        candidates: Ranked list of candidates
+        candidates: Ranked list of candidates (at least the top_k)
         local_max_analysis: Results from find_local_maximum
         top_k: Number of top candidates to show
+        total: Number of candidates scanned (default: len(candidates))
     """
+    if total is None:
+        total = len(candidates)
+
     print("\n" + "="*80)
     print("ALPHA STABILITY SCAN RESULTS")
     print("="*80)
     
-    print(f"\nTotal candidates scanned: {len(candidates)}")
+    print(f"\nTotal candidates scanned: {total}")
     
     # Top K candidates
     print(f"\nTop {top_k} candidates by combined stability metric:")
@@ -237,7 +401,7 @@ def print_summary(candidates: List[Dict],
         print(f"✗ {local_max_analysis['message']}")
     else:
         print(f"Target value: {local_max_analysis['target_value']:.4f}")
-        print(f"Rank: {local_max_analysis['rank']}/{len(candidates)}")
+        print(f"Rank: {local_max_analysis['rank']}/{total}")
         print(f"Window: ±{local_max_analysis['window']}")
         print(f"Neighbors with higher value: {local_max_analysis['neighbors_higher']}")
         print(f"Neighbors with same value: {local_max_analysis['neighbors_same']}")
@@ -299,33 +463,35 @@ def main():
     print(f"Random seed: {args.seed}")
     print()
     
-    candidates = scan_range(
+    columns = scan_arrays(
         args.range[0], args.range[1],
         filter_primes=args.primes_only,
         filter_twin_primes=args.twin_primes_only,
         seed=args.seed
     )
     
-    if not candidates:
+    if columns['n'].size == 0:
         print("✗ No candidates found in range with specified filters")
         return 1
     
-    # Rank candidates
-    ranked_candidates = rank_candidates(candidates, metric_key='combined')
+    # Rank candidates: only the rows that are printed or summarised
+    total = int(columns['n'].size)
+    top_candidates = columns_to_candidates(
+        columns, top_order(columns, max(args.top_k, 10), 'combined'))
     
     # Check local maximum
-    local_max_analysis = find_local_maximum(
-        ranked_candidates,
+    local_max_analysis = find_local_maximum_arrays(
+        columns,
         target_n=args.target,
         window=args.window,
         metric_key='combined'
     )
     
     # Save results
-    save_results(ranked_candidates, Path(args.out), format='csv')
+    save_columns(columns, Path(args.out), format='csv')
     
     if args.json:
-        save_results(ranked_candidates, Path(args.json), format='json')
+        save_columns(columns, Path(args.json), format='json')
     
     # Save summary JSON
     summary_path = Path(args.out).parent / 'alpha_stability_summary.json'
@@ -333,10 +499,10 @@ def main():
         'scan_range': args.range,
         'filter': 'twin_primes' if args.twin_primes_only else 'primes' if args.primes_only else 'all',
         'seed': args.seed,
-        'total_candidates': len(candidates),
+        'total_candidates': total,
         'target_n': args.target,
         'local_max_analysis': local_max_analysis,
-        'top_10': ranked_candidates[:10]
+        'top_10': top_candidates[:10]
     }
     
     with open(summary_path, 'w') as f:
@@ -344,7 +510,7 @@ def main():
     print(f"✓ Saved summary to: {summary_path}")
     
     # Print summary
-    print_summary(ranked_candidates, local_max_analysis, top_k=args.top_k)
+    print_summary(top_candidates, local_max_analysis, top_k=args.top_k, total=total)
     
     return 0
 
@@ -24,6 +24,7 @@ from __future__ import annotations
 
 import sys
 import random as _random
+from functools import lru_cache
 from typing import List, Tuple
 
 import numpy as np
@@ -115,13 +116,36 @@ def compute_symbolic_jacobian(
     return sp.Matrix([[sp.diff(g, x) for x in flat] for g in g_vec])
 
 
+@lru_cache(maxsize=1)
+def symbolic_jacobian() -> Tuple[List[sp.Symbol], List[str], sp.Matrix]:
+    """
+    Build the symbolic 10 × 32 Jacobian once per process.
+
+    Returns
+    -------
+    flat   : list of 32 sp.Symbol
+    labels : list of 10 metric labels
+    J      : sympy Matrix of shape (10, 32)
+    """
+    flat, by_mu = _symbolic_variables()
+    g_vec, labels = build_metric_vector(by_mu)
+    return flat, labels, compute_symbolic_jacobian(g_vec, flat)
+
+
 # ---------------------------------------------------------------------------
 # 2. Numerical rank verification
 # ---------------------------------------------------------------------------
 
-def _numeric_jacobian(E: np.ndarray) -> np.ndarray:
+# (μ, ν) for the 10 rows g_{μν}, μ ≤ ν, in build_metric_vector order
+_ROW_MU, _ROW_NU = np.triu_indices(4)
+
+#: Samples per stacked SVD call in numeric_rank_samples (~2.5 kB each).
+RANK_CHUNK_SIZE = 16384
+
+
+def batched_jacobian(E: np.ndarray) -> np.ndarray:
     """
-    Evaluate the Jacobian numerically for a given configuration E ∈ ℝ^{4×8}.
+    Evaluate the Jacobian for a stack of configurations E ∈ ℝ^{...×4×8}.
 
     Because g_{μν} = 2 * E_μ · E_ν (dot product of 8-vectors), the
     derivatives are simply:
@@ -131,33 +155,40 @@ def _numeric_jacobian(E: np.ndarray) -> np.ndarray:
                           = 4 * e_μ^k  if ρ == μ == ν
                           = 0           otherwise
 
+    which is written into the (row, ρ, k) blocks of J with index arrays.
+
     Parameters
     ----------
-    E : ndarray of shape (4, 8)
+    E : ndarray of shape (..., 4, 8)
 
     Returns
     -------
-    J : ndarray of shape (10, 32)
+    J : ndarray of shape (..., 10, 32)
     """
-    J = np.zeros((10, 32))
-    row = 0
-    for mu in range(4):
-        for nu in range(mu, 4):
-            col_offset_mu = mu * 8
-            col_offset_nu = nu * 8
-            if mu == nu:
-                J[row, col_offset_mu : col_offset_mu + 8] = 4 * E[mu]
-            else:
-                J[row, col_offset_mu : col_offset_mu + 8] = 2 * E[nu]
-                J[row, col_offset_nu : col_offset_nu + 8] = 2 * E[mu]
-            row += 1
-    return J
+    E = np.asarray(E, dtype=float)
+    batch = E.shape[:-2]
+    J = np.zeros(batch + (10, 4, 8))
+    rows = np.arange(10)
+    J[..., rows, _ROW_MU, :] = 2 * E[..., _ROW_NU, :]
+    J[..., rows, _ROW_NU, :] += 2 * E[..., _ROW_MU, :]
+    return J.reshape(batch + (10, 32))
+
+
+def batched_ranks(E: np.ndarray, tol: float = 1e-10) -> np.ndarray:
+    """
+    Rank of J for every configuration in a stack E of shape (n, 4, 8).
+
+    Uses one stacked np.linalg.svd(..., compute_uv=False) call.
+    """
+    sv = np.linalg.svd(batched_jacobian(E), compute_uv=False)
+    return np.sum(sv > tol, axis=-1)
 
 
 def numeric_rank_samples(
     n_samples: int = 1000,
     seed: int = 42,
     tol: float = 1e-10,
+    chunk_size: int = RANK_CHUNK_SIZE,
 ) -> dict:
     """
     Estimate the rank of J by averaging over random tetrad configurations.
@@ -167,29 +198,25 @@ def numeric_rank_samples(
     n_samples : number of random E configurations to sample
     seed      : random seed for reproducibility
     tol       : singular-value threshold for rank computation
+    chunk_size: configurations per stacked SVD call
 
     Returns
     -------
     dict with keys: 'min_rank', 'max_rank', 'mean_rank', 'rank_counts'
     """
     rng = np.random.default_rng(seed)
-    ranks: List[int] = []
-    for _ in range(n_samples):
-        E = rng.standard_normal((4, 8))
-        J = _numeric_jacobian(E)
-        sv = np.linalg.svd(J, compute_uv=False)
-        rank = int(np.sum(sv > tol))
-        ranks.append(rank)
-
-    rank_counts: dict = {}
-    for r in ranks:
-        rank_counts[r] = rank_counts.get(r, 0) + 1
+    counts = np.zeros(11, dtype=np.int64)
+    for start in range(0, n_samples, chunk_size):
+        # Same stream as drawing one (4, 8) configuration per sample
+        E = rng.standard_normal((min(chunk_size, n_samples - start), 4, 8))
+        counts += np.bincount(batched_ranks(E, tol), minlength=11)
 
+    present = np.flatnonzero(counts)
     return {
-        "min_rank": min(ranks),
-        "max_rank": max(ranks),
-        "mean_rank": float(np.mean(ranks)),
-        "rank_counts": rank_counts,
+        "min_rank": int(present[0]),
+        "max_rank": int(present[-1]),
+        "mean_rank": float(np.dot(np.arange(11), counts) / n_samples),
+        "rank_counts": {int(r): int(counts[r]) for r in present},
     }
 
 
@@ -202,17 +229,22 @@ def compute_kernel_directions(
 
     Parameters
     ----------
-    E   : ndarray of shape (4, 8)
+    E   : ndarray of shape (4, 8), or a stack (n, 4, 8) of configurations
+          with equal rank
     tol : singular-value threshold
 
     Returns
     -------
-    kernel_basis : ndarray of shape (kernel_dim, 32)
+    kernel_basis : ndarray of shape (kernel_dim, 32), or (n, kernel_dim, 32)
     """
-    J = _numeric_jacobian(E)
+    J = batched_jacobian(E)
     _, s, Vt = np.linalg.svd(J, full_matrices=True)
-    # rows of Vt corresponding to singular values below tol
-    kernel_basis = Vt[small]
+    ranks = np.sum(s > tol, axis=-1)
+    rank = int(np.max(ranks))
+    if np.any(ranks != rank):
+        raise ValueError(f"configurations have different ranks: {sorted(set(ranks.tolist()))}")
+    # rows of Vt beyond the rank span the null space
+    kernel_basis = Vt[..., rank:, :]
     return kernel_basis
 
 
@@ -242,28 +274,26 @@ def verify_lorentz_kernel(
 
     Parameters
     ----------
-    E   : ndarray of shape (4, 8)
+    E   : ndarray of shape (4, 8), or a stack (n, 4, 8) checked at once
     tol : tolerance for checking g invariance
 
     Returns
     -------
     dict with 'n_so8_generators', 'max_delta_g', 'all_in_kernel'
     """
-    J = _numeric_jacobian(E)
-    max_delta_g = 0.0
-    n_gen = 0
-    for a in range(8):
-        for b in range(a + 1, 8):
-            # Internal-frame generator G_{ab}: M_{ab}=+1, M_{ba}=-1
-            M = np.zeros((8, 8))
-            M[a, b] = 1.0
-            M[b, a] = -1.0
-            # δE_μ = E_μ @ M  (each of the 4 tetrad 8-vectors rotated by M)
-            delta_E = E @ M          # shape (4, 8)
-            delta_X = delta_E.ravel()  # shape (32,)
-            delta_g = J @ delta_X    # shape (10,)
-            max_delta_g = max(max_delta_g, np.max(np.abs(delta_g)))
-            n_gen += 1
+    J = batched_jacobian(E)
+    # All 28 generators G_{ab} (a < b): M_{ab} = +1, M_{ba} = -1
+    a, b = np.triu_indices(8, k=1)
+    M = np.zeros((a.size, 8, 8))
+    gens = np.arange(a.size)
+    M[gens, a, b] = 1.0
+    M[gens, b, a] = -1.0
+    # δE_μ = E_μ @ M  (each of the 4 tetrad 8-vectors rotated by M)
+    E = np.asarray(E, dtype=float)
+    delta_X = (E[..., None, :, :] @ M).reshape(E.shape[:-2] + (a.size, 32))
+    delta_g = delta_X @ np.swapaxes(J, -1, -2)    # (..., 28, 10)
+    max_delta_g = float(np.max(np.abs(delta_g)))
+    n_gen = a.size
 
     return {
         "n_so8_generators": n_gen,
@@ -289,18 +319,13 @@ def run_full_analysis(verbose: bool = True) -> dict:
         print("=" * 60)
         print("\n[1] Building symbolic variables (32 real components) ...")
 
-    flat, by_mu = _symbolic_variables()
+    flat, labels, J_sym = symbolic_jacobian()
 
     if verbose:
         print(f"    Domain dimension: {len(flat)}")
-
-    g_vec, labels = build_metric_vector(by_mu)
-
-    if verbose:
-        print(f"    Codomain dimension: {len(g_vec)} (metric components: {labels})")
+        print(f"    Codomain dimension: {len(labels)} (metric components: {labels})")
         print("\n[2] Computing symbolic Jacobian (10 × 32) ...")
 
-    J_sym = compute_symbolic_jacobian(g_vec, flat)
     results["J_sym_shape"] = J_sym.shape
 
     # Symbolic rank (uses fraction-free algorithm; may be slow for full 10×32)
@@ -12,3 +12,17 @@ def test_dirichlet_partial_sum():
     th = build_theta_constant_combo(N_terms=200)
     val = L_dirichlet(th, s=1.1+0j, N_cut=200)
     assert val.real > 0.0
+
+def test_theta_array_matches_dict_version():
+    from automorphic.hecke_l_route import build_theta_array
+    th = build_theta_constant_combo(N_terms=400)
+    ta = build_theta_array(N_terms=400)
+    assert all(ta.a[n] == an for n, an in th.coeffs.items())
+    for p in (2, 3, 5, 7):
+        tp2 = hecke_T_p2(th, p)
+        arr = ta.hecke_T_p2(p)
+        assert all(arr[n] == v for n, v in tp2.items())
+        assert ta.estimate_eigenvalue(p) == estimate_eigenvalue_lambda_p(th, p)
+    vals = ta.L_dirichlet([1.1 + 0j, 2.0 + 1j], N_cut=200)
+    for s, v in zip((1.1 + 0j, 2.0 + 1j), vals):
+        assert abs(v - L_dirichlet(th, s=s, N_cut=200)) < 1e-9 * abs(v)
@@ -5,10 +5,54 @@
 Laplacian Spectrum on Torus
 
 Computes eigenvalues and eigenmodes of the Laplacian operator on a d-dimensional torus.
+
+Eigenvalues are (2π/L)² n with n = |k|², k ∈ Z^d, so the spectrum is fully
+described by the sums-of-squares counts r_d(n) = #{k : |k|² = n}.  These
+are built as the d-fold convolution of the one-dimensional counts r_1
+(optionally restricted to |k_i| ≤ k_max), which needs O(d·n_max) memory
+instead of the (2k_max+1)^d mode grid; N(Λ) queries are answered from a
+cached cumulative table.
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Iterator, Tuple, Optional
+
+
+def sum_of_squares_counts(d: int, n_max: int, k_max: Optional[int] = None) -> np.ndarray:
+    """
+    Count lattice vectors by squared length.
+
+    Args:
+        d: Dimension of the lattice Z^d
+        n_max: Largest |k|² to count
+        k_max: Restrict every component to |k_i| ≤ k_max (None: no restriction,
+            i.e. the exact r_d(n))
+
+    Returns:
+        Array r with r[n] = #{k ∈ Z^d : |k|² = n, |k_i| ≤ k_max} for n = 0..n_max
+        (int64, or Python ints if the counts could overflow)
+    """
+    j_max = math.isqrt(n_max) if k_max is None else min(k_max, math.isqrt(n_max))
+    dtype = np.int64 if d * math.log2(2 * j_max + 1) < 62 else object
+    counts = np.zeros(n_max + 1, dtype=dtype)
+    counts[0] = 1
+    for _ in range(d):
+        # Convolve with r_1 restricted to |j| ≤ j_max: weight 1 at 0, 2 at j²
+        previous = counts.copy()
+        for j in range(1, j_max + 1):
+            s = j * j
+            counts[s:] += 2 * previous[:n_max + 1 - s]
+    return counts
+
+
+@lru_cache(maxsize=32)
+def _cumulative_counts(d: int, n_cap: int) -> np.ndarray:
+    table = np.cumsum(sum_of_squares_counts(d, n_cap))
+    table.setflags(write=False)
+    return table
 
 
 def torus_eigenvalues(d: int, k_max: int, L: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
@@ -29,53 +73,48 @@ def torus_eigenvalues(d: int, k_max: int, L: float = 1.0) -> Tuple[np.ndarray, n
         eigenvalues: Array of eigenvalues λ_k
         degeneracies: Array of degeneracy for each unique eigenvalue
     """
-    # Generate all mode vectors k in [-k_max, k_max]^d
-    if d == 1:
-        k_vectors = np.arange(-k_max, k_max + 1).reshape(-1, 1)
-    elif d == 2:
-        k1, k2 = np.meshgrid(range(-k_max, k_max + 1), range(-k_max, k_max + 1))
-        k_vectors = np.column_stack([k1.ravel(), k2.ravel()])
-    elif d == 3:
-        k1 = np.arange(-k_max, k_max + 1)
-        k_grid = np.array(np.meshgrid(k1, k1, k1)).T.reshape(-1, 3)
-        k_vectors = k_grid
-    else:
-        # General d dimensions
-        ranges = [range(-k_max, k_max + 1) for _ in range(d)]
-        grid = np.array(np.meshgrid(*ranges, indexing='ij'))
-        k_vectors = grid.reshape(d, -1).T
-    
+    # Degeneracy of n = |k|² over the cube [-k_max, k_max]^d
+    counts = sum_of_squares_counts(d, d * k_max * k_max, k_max)
+    k_squared = np.flatnonzero(counts)
+
     # Compute eigenvalues: λ_k = (2π/L)² |k|²
-    k_squared = np.sum(k_vectors**2, axis=1)
     eigenvalues = (2 * np.pi / L)**2 * k_squared
-    
-    # Count degeneracies (number of k vectors giving same eigenvalue)
-    unique_vals, inverse, counts = np.unique(
-        eigenvalues, return_inverse=True, return_counts=True
-    )
-    
-    return unique_vals, counts
+    degeneracies = counts[k_squared]
+    if degeneracies.dtype != object:
+        degeneracies = degeneracies.astype(np.int64)
 
+    return eigenvalues, degeneracies
 
-def torus_spectrum_generator(d: int, k_max: int, L: float = 1.0):
+
+def torus_spectrum_generator(d: int, k_max: Optional[int], L: float = 1.0) -> Iterator:
     """
     Generator yielding (eigenvalue, degeneracy) pairs sorted by eigenvalue.
-    
+
+    Pairs are produced lazily from the sums-of-squares table; with
+    k_max=None the whole lattice Z^d is enumerated (an infinite stream,
+    the table grows by doubling as it is consumed).
+
     Args:
         d: Dimension of torus
-        k_max: Maximum mode number
+        k_max: Maximum mode number (None: unrestricted)
         L: Torus period
-        
+
     Yields:
         (lambda_k, degeneracy): Eigenvalue and its degeneracy
     """
-    eigenvalues, degeneracies = torus_eigenvalues(d, k_max, L)
-    
-    # Sort by eigenvalue
-    sorted_indices = np.argsort(eigenvalues)
-    
-    for idx in sorted_indices:
-        yield eigenvalues[idx], degeneracies[idx]
+    unit = (2 * np.pi / L)**2
+    if k_max is not None:
+        counts = sum_of_squares_counts(d, d * k_max * k_max, k_max)
+        for n in np.flatnonzero(counts):
+            yield unit * n, counts[n]
+        return
+
+    start, n_cap = 0, 64
+    while True:
+        counts = sum_of_squares_counts(d, n_cap)
+        for n in np.flatnonzero(counts[start:]) + start:
+            yield unit * n, counts[n]
+        start, n_cap = n_cap + 1, 2 * n_cap
 
 
 def mode_count_below_energy(d: int, Lambda: float, L: float = 1.0) -> int:
@@ -95,13 +134,21 @@ def mode_count_below_energy(d: int, Lambda: float, L: float = 1.0) -> int:
     Returns:
         Number of modes below Lambda
     """
-    # Maximum |k| such that (2π/L)² |k|² ≤ Λ
-    k_max_cutoff = int(np.sqrt(Lambda) * L / (2 * np.pi)) + 1
-    
-    eigenvalues, degeneracies = torus_eigenvalues(d, k_max_cutoff, L)
-    
-    mask = eigenvalues <= Lambda
-    return int(np.sum(degeneracies[mask]))
+    # Largest n = |k|² with (2π/L)² n ≤ Λ (compared in floating point like λ_k ≤ Λ)
+    unit = (2 * np.pi / L)**2
+    if not Lambda >= 0:
+        return 0
+    n_max = int(Lambda / unit)
+    while unit * (n_max + 1) <= Lambda:
+        n_max += 1
+    while n_max >= 0 and unit * n_max > Lambda:
+        n_max -= 1
+    if n_max < 0:
+        return 0
+
+    # Cumulative table on a power-of-two cap, shared between queries
+    n_cap = max(64, 1 << n_max.bit_length())
+    return int(_cumulative_counts(d, n_cap)[n_max])
 
 
 def get_lowest_nonzero_eigenvalue(d: int, L: float = 1.0) -> float:
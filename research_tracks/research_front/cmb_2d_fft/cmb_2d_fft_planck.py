@@ -6,43 +6,32 @@ For a standalone version that works without external data, use cmb_2d_fft_poc.py
 
 - Load Planck CMB map (HEALPix FITS, e.g. SMICA/NILC/SEVEM/Commander)
 - Extract a clean small patch via gnomonic projection
+  (optionally: tile the sky with thousands of patches via precomputed lookup tables)
 - Apodize (taper) to suppress edge ringing
 - Compute 2D FFT power
 - Detect oriented "comb"/grid-like anisotropy and estimate tilt angle
 
 Dependencies: healpy, astropy, scipy, matplotlib, numpy
+
+The helpers can be imported without healpy / astropy / matplotlib; healpy is
+imported on first use by the HEALPix helpers and the analysis runs only as a
+script (python research_front/cmb_2d_fft/cmb_2d_fft_planck.py).
 """
 
+import csv
+import os
 import sys
 import numpy as np
-import matplotlib.pyplot as plt
-
-# --- deps ---
-# Try to import healpy and astropy with helpful error message
-try:
-    import healpy as hp
-    from astropy.io import fits
-except ImportError as e:
-    print("=" * 80)
-    print("ERROR: Required dependencies not found for Planck map analysis.")
-    print("=" * 80)
-    print("\nThis script requires:")
-    print("  - healpy (for HEALPix map handling)")
-    print("  - astropy (for FITS file reading)")
-    print("\nTo install:")
-    print("  pip install healpy astropy")
-    print("\nAlternatively, use the standalone proof-of-concept:")
-    print("  python research_front/cmb_2d_fft/cmb_2d_fft_poc.py")
-    print("\nThe PoC version works with synthetic data and requires only:")
-    print("  - numpy")
-    print("  - scipy")
-    print("  - matplotlib")
-    print("=" * 80)
-    sys.exit(1)
 
 from scipy.ndimage import gaussian_filter
 from scipy.signal import windows
 
+# Shared tilt-scan engine (sibling module)
+try:
+    from .cmb_2d_fft_poc import oriented_energy_scan, tilt_scan_geometry
+except ImportError:  # run as a script: this directory is sys.path[0]
+    from cmb_2d_fft_poc import oriented_energy_scan, tilt_scan_geometry
+
 # =========================
 # CONFIG
 # =========================
@@ -66,17 +55,51 @@ PIX_ARCMIN = 5.0        # flat-sky pixel size (arcmin). 5 arcmin is OK for PoC.
 # Target tilt angle (degrees)
 TARGET_TILT_DEG = np.degrees(np.arctan(1/256))  # ~0.224°
 # but we will estimate from data; target only for reporting.
-print("Target tilt (deg):", TARGET_TILT_DEG)
 
 # FFT analysis parameters
 SMOOTH_SIGMA_PIX = 1.5   # smooth FFT power a bit to make ridge detection easier
 RADIAL_BINS = 60         # for angular power vs angle
 ANGLE_RES_DEG = 0.05     # resolution for scanning oriented energy
 
+# Full-sky tiling (optional): tilt-scan a patch at every centre of a HEALPix grid.
+# TILE_NSIDE = 16 gives 3072 centres (before the latitude cut); 0 disables tiling.
+TILE_NSIDE = 0
+TILE_MIN_ABS_LAT = 30.0  # skip centres closer than this to the Galactic plane (deg)
+TILE_CHUNK = 64          # patch centres per lookup table / batched FFT
+TILE_CSV = "research_front/cmb_2d_fft/out/tilt_tiles.csv"
+
 # =========================
 # HELPERS
 # =========================
 
+def _healpy():
+    """Import healpy on first use; only the HEALPix helpers need it."""
+    import healpy
+    return healpy
+
+def _check_planck_deps():
+    """Exit with installation hints if healpy / astropy are missing (script use)."""
+    try:
+        import healpy  # noqa: F401
+        from astropy.io import fits  # noqa: F401
+    except ImportError:
+        print("=" * 80)
+        print("ERROR: Required dependencies not found for Planck map analysis.")
+        print("=" * 80)
+        print("\nThis script requires:")
+        print("  - healpy (for HEALPix map handling)")
+        print("  - astropy (for FITS file reading)")
+        print("\nTo install:")
+        print("  pip install healpy astropy")
+        print("\nAlternatively, use the standalone proof-of-concept:")
+        print("  python research_front/cmb_2d_fft/cmb_2d_fft_poc.py")
+        print("\nThe PoC version works with synthetic data and requires only:")
+        print("  - numpy")
+        print("  - scipy")
+        print("  - matplotlib")
+        print("=" * 80)
+        sys.exit(1)
+
 def read_planck_cmb_map(path_fits):
     """
     Reads a HEALPix map.
@@ -85,10 +108,12 @@ def read_planck_cmb_map(path_fits):
     """
     # healpy can read directly
     # field=0 for temperature
+    hp = _healpy()
     m = hp.read_map(path_fits, field=0, verbose=False)
     return m
 
 def read_mask(path_fits, nside_target):
+    hp = _healpy()
     mask = hp.read_map(path_fits, field=0, verbose=False)
     # Ensure same nside
     if hp.get_nside(mask) != nside_target:
@@ -96,34 +121,64 @@ def read_mask(path_fits, nside_target):
     # binarize softly
     return (mask > 0.5).astype(np.float32)
 
+def patch_npix(patch_deg, pix_arcmin):
+    """Number of pixels per side of a patch_deg patch at pix_arcmin resolution."""
+    pix_deg = pix_arcmin / 60.0
+    npix = int(np.round(patch_deg / pix_deg))
+    return max(npix, 64)  # floor
+
+def gnomonic_plane(npix, pix_arcmin):
+    """
+    Tangent-plane offsets (radians) of the patch pixel centres.
+    Returns (x, y) broadcasting to (npix, npix): x along columns, y along rows,
+    laid out as hp.gnomview does (pixel centres at (i - (npix-1)/2) * reso).
+    """
+    dx = np.deg2rad(pix_arcmin / 60.0)
+    offsets = (np.arange(npix) - 0.5 * (npix - 1)) * dx
+    return offsets[None, :], offsets[:, None]
+
+def gnomonic_index_table(nside, lon_deg, lat_deg, npix, pix_arcmin, plane=None):
+    """
+    HEALPix (RING) pixel index of every patch pixel for many patch centres.
+
+    The tangent-plane geometry is fixed per (npix, pix_arcmin); each centre only
+    rotates it, so the table is built without any projection calls and can be
+    applied to every map of the same nside (I, Q, U, masks) by plain indexing.
+    Matches hp.gnomview(rot=(lon, lat, 0), flip='astro') pixel for pixel.
+
+    Returns int array of shape (n_centres, npix, npix).
+    """
+    x, y = plane if plane is not None else gnomonic_plane(npix, pix_arcmin)
+    lon = np.deg2rad(np.atleast_1d(np.asarray(lon_deg, dtype=np.float64)))[:, None, None]
+    lat = np.deg2rad(np.atleast_1d(np.asarray(lat_deg, dtype=np.float64)))[:, None, None]
+    cos_lon, sin_lon = np.cos(lon), np.sin(lon)
+    cos_lat, sin_lat = np.cos(lat), np.sin(lat)
+    # centre + x * (-east) + y * north; east points to the left on the sky ('astro')
+    vx = cos_lat * cos_lon + x * sin_lon - y * sin_lat * cos_lon
+    vy = cos_lat * sin_lon - x * cos_lon - y * sin_lat * sin_lon
+    vz = sin_lat + y * cos_lat
+    return _healpy().vec2pix(nside, *np.broadcast_arrays(vx, vy, vz))
+
+def tile_centers(nside_tiles, min_abs_lat=0.0):
+    """Patch centres (lon, lat in degrees) at HEALPix pixel centres, |lat| >= min_abs_lat."""
+    hp = _healpy()
+    lon, lat = hp.pix2ang(nside_tiles, np.arange(hp.nside2npix(nside_tiles)), lonlat=True)
+    keep = np.abs(lat) >= min_abs_lat
+    return lon[keep], lat[keep]
+
 def gnomonic_patch(m, lon_deg, lat_deg, patch_deg, pix_arcmin, mask=None):
     """
     Create a flat-sky (gnomonic) projection patch from HEALPix map.
     Returns patch (2D), and optional patch mask (2D).
     """
-    # number of pixels
-    pix_deg = pix_arcmin / 60.0
-    npix = int(np.round(patch_deg / pix_deg))
-    npix = max(npix, 64)  # floor
-    reso_arcmin = pix_arcmin
-
-    # rot: (lon, lat, psi). Using lon/lat in degrees.
-    # 'coord' can be used if map is in Galactic vs Equatorial. Assume map is in Galactic.
-    patch = hp.visufunc.gnomview(
-        m, rot=(lon_deg, lat_deg, 0.0),
-        xsize=npix, ysize=npix, reso=reso_arcmin,
-        return_projected_map=True, no_plot=True
-    )
+    npix = patch_npix(patch_deg, pix_arcmin)
+    table = gnomonic_index_table(_healpy().get_nside(m), lon_deg, lat_deg, npix, pix_arcmin)[0]
+    patch = np.asarray(m)[table]
 
     patch_mask = None
     if mask is not None:
-        patch_mask = hp.visufunc.gnomview(
-            mask, rot=(lon_deg, lat_deg, 0.0),
-            xsize=npix, ysize=npix, reso=reso_arcmin,
-            return_projected_map=True, no_plot=True
-        )
         # ensure {0,1}
-        patch_mask = (patch_mask > 0.5).astype(np.float32)
+        patch_mask = (np.asarray(mask)[table] > 0.5).astype(np.float32)
 
     return patch.astype(np.float32), patch_mask
 
@@ -143,6 +198,28 @@ def apodize_2d(patch, mask=None, alpha=0.2):
     x = x * w2
     return x, w2
 
+def remove_patch_mean(patches, masks=None):
+    """
+    Subtract each patch's mean (over valid pixels if masks are given, zeroing
+    the rest) for a stack (..., ny, nx).
+    """
+    if masks is None:
+        return patches - patches.mean(axis=(-2, -1), keepdims=True)
+    valid = masks > 0.5
+    n_valid = np.maximum(valid.sum(axis=(-2, -1), keepdims=True), 1)
+    mu = np.where(valid, patches, 0.0).sum(axis=(-2, -1), keepdims=True) / n_valid
+    return np.where(valid, patches - mu, 0.0).astype(patches.dtype)
+
+def apodize_fft_batch(patches, masks=None, alpha=0.2):
+    """
+    apodize_2d + fft_power for a stack of patches (..., ny, nx) sharing one window.
+    """
+    ny, nx = patches.shape[-2:]
+    w2 = np.outer(windows.tukey(ny, alpha=alpha), windows.tukey(nx, alpha=alpha)).astype(np.float32)
+    x = patches if masks is None else patches * masks
+    f = np.fft.fftshift(np.fft.fft2(x * w2, axes=(-2, -1)), axes=(-2, -1))
+    return np.abs(f) ** 2
+
 def fft_power(patch):
     """
     Compute centered FFT power spectrum.
@@ -188,86 +265,179 @@ def scan_tilt(P, ang, r, rmin=10, rmax=None, scan_deg=(-5, 5), step_deg=0.05, we
     """
     Scan for the angle maximizing oriented energy.
     Returns best angle in degrees and energy curve.
+    P may be a stack of spectra (n_patches, ny, nx); the wedge sums for all
+    angles come from one sort of the band (see cmb_2d_fft_poc.oriented_energy_scan).
     """
     angles = np.arange(scan_deg[0], scan_deg[1] + 1e-9, step_deg)
-    energies = np.array([oriented_energy(P, ang, r, rmin=rmin, rmax=rmax, theta_deg=a, dtheta_deg=wedge_deg)
-                         for a in angles], dtype=np.float64)
-    best_idx = int(np.argmax(energies))
+    energies = oriented_energy_scan(P, ang, r, angles, rmin=rmin, rmax=rmax, dtheta_deg=wedge_deg)
+    best_idx = np.argmax(energies, axis=-1)
     return angles[best_idx], angles, energies
 
-# =========================
-# MAIN
-# =========================
-
-m = read_planck_cmb_map(MAP_FITS)
-nside = hp.get_nside(m)
-
-mask = None
-if MASK_FITS:
-    mask = read_mask(MASK_FITS, nside)
+def tilt_scan_tiles(maps, lon_deg, lat_deg, patch_deg, pix_arcmin, mask=None,
+                    scan_deg=(-2, 2), step_deg=0.05, wedge_deg=0.25, chunk=64):
+    """
+    Tilt scan of a patch at every centre, for every map in `maps` (name -> HEALPix map).
 
-patch, patch_mask = gnomonic_patch(m, LON_DEG, LAT_DEG, PATCH_DEG, PIX_ARCMIN, mask=mask)
+    Per chunk of centres, one index table extracts the patches of all maps and
+    the mask; the stacks go through a batched mean removal, apodisation, FFT,
+    smoothing and a shared-geometry oriented-energy scan.
 
-# Remove mean (and optionally a plane) to suppress huge low-k power
-patch0 = patch.copy()
-if patch_mask is not None:
-    valid = patch_mask > 0.5
-    mu = patch0[valid].mean()
-    patch0[valid] -= mu
-    patch0[~valid] = 0.0
-else:
-    patch0 -= patch0.mean()
+    Returns dict name -> {"best_deg": (n,), "confidence": (n,)} (peak/median energy).
+    """
+    names = list(maps)
+    nside = _healpy().get_nside(maps[names[0]])
+    lon_deg = np.atleast_1d(lon_deg)
+    lat_deg = np.atleast_1d(lat_deg)
+    n = len(lon_deg)
+
+    npix = patch_npix(patch_deg, pix_arcmin)
+    plane = gnomonic_plane(npix, pix_arcmin)
+    ang, r = angle_map(npix, npix)
+    rmin, rmax = 20, r.max() * 0.9
+    geometry = tilt_scan_geometry(ang, r, rmin=rmin, rmax=rmax)
+    angles = np.arange(scan_deg[0], scan_deg[1] + 1e-9, step_deg)
 
-# Apodize
-patch_w, win = apodize_2d(patch0, mask=patch_mask, alpha=0.2)
+    results = {name: {"best_deg": np.empty(n), "confidence": np.empty(n)} for name in names}
+    for start in range(0, n, chunk):
+        sl = slice(start, start + chunk)
+        table = gnomonic_index_table(nside, lon_deg[sl], lat_deg[sl], npix, pix_arcmin, plane=plane)
+        patch_masks = None
+        if mask is not None:
+            patch_masks = (np.asarray(mask)[table] > 0.5).astype(np.float32)
+        for name in names:
+            patches = remove_patch_mean(np.asarray(maps[name])[table].astype(np.float32), patch_masks)
+            P = np.log1p(apodize_fft_batch(patches, patch_masks, alpha=0.2))
+            P_s = gaussian_filter(P, sigma=(0, SMOOTH_SIGMA_PIX, SMOOTH_SIGMA_PIX))
+            energies = oriented_energy_scan(P_s, ang, r, angles, rmin=rmin, rmax=rmax,
+                                            dtheta_deg=wedge_deg, geometry=geometry)
+            median = np.median(energies, axis=-1)
+            results[name]["best_deg"][sl] = angles[np.argmax(energies, axis=-1)]
+            results[name]["confidence"][sl] = np.where(
+                median > 0, energies.max(axis=-1) / np.where(median > 0, median, 1.0), 0.0)
+    return results
+
+def write_tile_csv(path, lon_deg, lat_deg, results):
+    """One row per patch centre: lon, lat and best angle / confidence per map."""
+    d = os.path.dirname(path)
+    if d:
+        os.makedirs(d, exist_ok=True)
+    names = list(results)
+    with open(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["lon_deg", "lat_deg"] + [f"{nm}_{col}" for nm in names for col in ("best_deg", "confidence")])
+        for i in range(len(lon_deg)):
+            w.writerow([lon_deg[i], lat_deg[i]] + [results[nm][col][i] for nm in names
+                                                   for col in ("best_deg", "confidence")])
+
+def tilt_scan_patch(m, lon_deg, lat_deg, patch_deg, pix_arcmin, mask=None,
+                    scan_deg=(-2, 2), step_deg=0.05, wedge_deg=0.25):
+    """
+    Single-patch pipeline: gnomonic patch, mean removal, apodisation, FFT,
+    smoothing and tilt scan.
 
-# FFT power
-P = fft_power(patch_w)
-P = np.log1p(P)  # stabilize dynamic range
+    Returns (patch0, P_s, best_deg, angles, energies); patch0 is the
+    mean-removed patch and P_s the smoothed log FFT power.
+    """
+    patch, patch_mask = gnomonic_patch(m, lon_deg, lat_deg, patch_deg, pix_arcmin, mask=mask)
+
+    # Remove mean (and optionally a plane) to suppress huge low-k power
+    patch0 = patch.copy()
+    if patch_mask is not None:
+        valid = patch_mask > 0.5
+        mu = patch0[valid].mean()
+        patch0[valid] -= mu
+        patch0[~valid] = 0.0
+    else:
+        patch0 -= patch0.mean()
+
+    # Apodize
+    patch_w, win = apodize_2d(patch0, mask=patch_mask, alpha=0.2)
+
+    # FFT power
+    P = fft_power(patch_w)
+    P = np.log1p(P)  # stabilize dynamic range
+
+    # Smooth FFT power slightly (optional)
+    P_s = gaussian_filter(P, sigma=SMOOTH_SIGMA_PIX)
+
+    ang, r = angle_map(*P_s.shape)
+
+    # Scan small angles around 0 deg to find tiny tilt. In general, a grid manifests as peaks.
+    # Here we measure oriented energy; you can also look for comb-like peaks along a line.
+    best, angles, energies = scan_tilt(
+        P_s, ang, r,
+        rmin=20, rmax=r.max()*0.9,
+        scan_deg=scan_deg,
+        step_deg=step_deg,
+        wedge_deg=wedge_deg
+    )
+    return patch0, P_s, best, angles, energies
 
-# Smooth FFT power slightly (optional)
-P_s = gaussian_filter(P, sigma=SMOOTH_SIGMA_PIX)
+# =========================
+# MAIN
+# =========================
 
-ang, r = angle_map(*P_s.shape)
+def main():
+    _check_planck_deps()
+    import matplotlib.pyplot as plt
+    hp = _healpy()
+
+    print("Target tilt (deg):", TARGET_TILT_DEG)
+
+    m = read_planck_cmb_map(MAP_FITS)
+    nside = hp.get_nside(m)
+
+    mask = None
+    if MASK_FITS:
+        mask = read_mask(MASK_FITS, nside)
+
+    if TILE_NSIDE:
+        tile_lon, tile_lat = tile_centers(TILE_NSIDE, min_abs_lat=TILE_MIN_ABS_LAT)
+        print(f"Tiling: {len(tile_lon)} patch centres (nside={TILE_NSIDE}, |b| >= {TILE_MIN_ABS_LAT} deg)")
+        tiles = tilt_scan_tiles({"I": m}, tile_lon, tile_lat, PATCH_DEG, PIX_ARCMIN, mask=mask,
+                                scan_deg=(-2, 2), step_deg=ANGLE_RES_DEG, wedge_deg=0.25, chunk=TILE_CHUNK)
+        write_tile_csv(TILE_CSV, tile_lon, tile_lat, tiles)
+        print("Tile best angles (deg): median", np.median(tiles["I"]["best_deg"]),
+              "| within 0.1 deg of target:",
+              int(np.sum(np.abs(tiles["I"]["best_deg"] - TARGET_TILT_DEG) < 0.1)), "/", len(tile_lon))
+        print("Wrote", TILE_CSV)
+
+    patch0, P_s, best, angles, energies = tilt_scan_patch(
+        m, LON_DEG, LAT_DEG, PATCH_DEG, PIX_ARCMIN, mask=mask,
+        scan_deg=(-2, 2), step_deg=ANGLE_RES_DEG, wedge_deg=0.25,
+    )
 
-# Scan small angles around 0 deg to find tiny tilt. In general, a grid manifests as peaks.
-# Here we measure oriented energy; you can also look for comb-like peaks along a line.
-best, angles, energies = scan_tilt(
-    P_s, ang, r,
-    rmin=20, rmax=r.max()*0.9,
-    scan_deg=(-2, 2),
-    step_deg=ANGLE_RES_DEG,
-    wedge_deg=0.25
-)
+    print("Best tilt angle (deg):", best)
+    print("Target tilt angle (deg):", TARGET_TILT_DEG)
 
-print("Best tilt angle (deg):", best)
-print("Target tilt angle (deg):", TARGET_TILT_DEG)
+    # =========================
+    # PLOTS
+    # =========================
 
-# =========================
-# PLOTS
-# =========================
+    fig = plt.figure(figsize=(14, 4))
 
-fig = plt.figure(figsize=(14, 4))
+    ax1 = fig.add_subplot(1, 3, 1)
+    ax1.set_title("CMB patch (gnomonic)")
+    im1 = ax1.imshow(patch0, origin="lower")
+    plt.colorbar(im1, ax=ax1, fraction=0.046)
 
-ax1 = fig.add_subplot(1, 3, 1)
-ax1.set_title("CMB patch (gnomonic)")
-im1 = ax1.imshow(patch0, origin="lower")
-plt.colorbar(im1, ax=ax1, fraction=0.046)
+    ax2 = fig.add_subplot(1, 3, 2)
+    ax2.set_title("FFT power (log, smoothed)")
+    im2 = ax2.imshow(P_s, origin="lower")
+    plt.colorbar(im2, ax=ax2, fraction=0.046)
 
-ax2 = fig.add_subplot(1, 3, 2)
-ax2.set_title("FFT power (log, smoothed)")
-im2 = ax2.imshow(P_s, origin="lower")
-plt.colorbar(im2, ax=ax2, fraction=0.046)
+    ax3 = fig.add_subplot(1, 3, 3)
+    ax3.set_title("Oriented energy vs angle")
+    ax3.plot(angles, energies)
+    ax3.axvline(TARGET_TILT_DEG, linestyle="--", label=f"target {TARGET_TILT_DEG:.3f}°")
+    ax3.axvline(best, linestyle="-", label=f"best {best:.3f}°")
+    ax3.set_xlabel("angle (deg)")
+    ax3.set_ylabel("energy (a.u.)")
+    ax3.legend()
 
-ax3 = fig.add_subplot(1, 3, 3)
-ax3.set_title("Oriented energy vs angle")
-ax3.plot(angles, energies)
-ax3.axvline(TARGET_TILT_DEG, linestyle="--", label=f"target {TARGET_TILT_DEG:.3f}°")
-ax3.axvline(best, linestyle="-", label=f"best {best:.3f}°")
-ax3.set_xlabel("angle (deg)")
-ax3.set_ylabel("energy (a.u.)")
-ax3.legend()
+    plt.tight_layout()
+    plt.show()
 
-plt.tight_layout()
-plt.show()
 
+if __name__ == "__main__":
+    main()
@@ -214,12 +214,81 @@ def oriented_energy(P, ang, r, rmin=10, rmax=None, theta_deg=0.0, dtheta_deg=0.2
     return float(P[sel1].sum() + P[sel2].sum())
 
 
+# Pixels within this distance (radians) of a wedge edge count as inside; lattice
+# orientations on the axes fall exactly on the edges of wedges centred at ±dtheta
+WEDGE_EDGE_TOL_RAD = 1e-12
+
+
+def tilt_scan_geometry(ang, r, rmin=10, rmax=None):
+    """
+    Precompute the radial band and pixel orientations for oriented_energy_scan.
+    
+    A wedge around theta together with its mirror around theta+pi selects the
+    pixels whose orientation (angle mod pi) lies within the wedge, so band
+    pixels are sorted once by orientation; every wedge is then a contiguous run.
+    
+    Args:
+        ang: angle map
+        r: radius map
+        rmin, rmax: radial band limits
+    
+    Returns:
+        pix: flat indices of band pixels, sorted by orientation
+        orient: their orientations in [0, pi), ascending
+    """
+    if rmax is None:
+        rmax = r.max()
+    band = np.flatnonzero((r >= rmin) & (r <= rmax))
+    orient = np.mod(ang.ravel()[band], np.pi)
+    order = np.argsort(orient, kind="stable")
+    return band[order], orient[order]
+
+
+def oriented_energy_scan(P, ang, r, theta_deg, rmin=10, rmax=None, dtheta_deg=0.25,
+                         geometry=None):
+    """
+    oriented_energy for many wedge centres (and patches) at once.
+    
+    Prefix sums of the orientation-sorted power give each wedge energy as a
+    difference of two entries, so the cost per angle is two binary searches.
+    Matches oriented_energy (for dtheta_deg < 90), except that pixels lying
+    exactly on a wedge edge are always included; oriented_energy keeps or
+    drops them depending on rounding.
+    
+    Args:
+        P: 2D FFT power spectrum, or a stack (..., ny, nx) sharing ang and r
+        ang: angle map
+        r: radius map
+        theta_deg: array of central angles in degrees
+        rmin, rmax: radial band limits
+        dtheta_deg: wedge half-width in degrees
+        geometry: result of tilt_scan_geometry(ang, r, rmin, rmax) to reuse
+    
+    Returns:
+        energies: array of shape P.shape[:-2] + np.shape(theta_deg)
+    """
+    pix, orient = geometry if geometry is not None else tilt_scan_geometry(ang, r, rmin, rmax)
+    P = np.asarray(P, dtype=np.float64)
+    power = P.reshape(P.shape[:-2] + (-1,))[..., pix]
+    
+    # Three periods of prefix sums: wedges crossing 0 or pi need no wrap logic
+    ext_orient = np.concatenate([orient - np.pi, orient, orient + np.pi])
+    csum = np.cumsum(np.concatenate([power, power, power], axis=-1), axis=-1)
+    csum = np.concatenate([np.zeros(power.shape[:-1] + (1,)), csum], axis=-1)
+    
+    theta = np.mod(np.deg2rad(np.asarray(theta_deg, dtype=np.float64)), np.pi)
+    dtheta = np.deg2rad(dtheta_deg) + WEDGE_EDGE_TOL_RAD
+    lo = np.searchsorted(ext_orient, theta - dtheta, side="left")
+    hi = np.searchsorted(ext_orient, theta + dtheta, side="right")
+    return csum[..., hi] - csum[..., lo]
+
+
 def scan_tilt(P, ang, r, rmin=10, rmax=None, scan_deg=(-5, 5), step_deg=0.05, wedge_deg=0.25):
     """
     Scan for the angle maximizing oriented energy.
     
     Args:
-        P: 2D FFT power spectrum
+        P: 2D FFT power spectrum, or a stack (n_patches, ny, nx)
         ang: angle map
         r: radius map
         rmin, rmax: radial band limits
@@ -228,17 +297,14 @@ def scan_tilt(P, ang, r, rmin=10, rmax=None, scan_deg=(-5, 5), step_deg=0.05, we
         wedge_deg: wedge half-width
     
     Returns:
-        best_angle: angle in degrees with maximum energy
+        best_angle: angle in degrees with maximum energy (array for a stack)
         angles: array of scanned angles
-        energies: array of energies at each angle
+        energies: array of energies at each angle (n_patches, n_angles for a stack)
     """
     angles = np.arange(scan_deg[0], scan_deg[1] + 1e-9, step_deg)
-    energies = np.array([
-        oriented_energy(P, ang, r, rmin=rmin, rmax=rmax, 
-                       theta_deg=a, dtheta_deg=wedge_deg)
-        for a in angles
-    ], dtype=np.float64)
-    best_idx = int(np.argmax(energies))
+    energies = oriented_energy_scan(P, ang, r, angles, rmin=rmin, rmax=rmax,
+                                    dtheta_deg=wedge_deg)
+    best_idx = np.argmax(energies, axis=-1)
     return angles[best_idx], angles, energies
 
 
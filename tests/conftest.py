@@ -18,6 +18,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 # Repository root (this file lives in tests/, so parent is root)
 _repo_root = Path(__file__).resolve().parent.parent
 
@@ -52,3 +54,14 @@ _add(_repo_root / "ARCHIVE" / "archive_legacy" / "ARCHIVE" / "legacy_variants")
 
 # research_tracks/legacy_theory_variants/ → enables `import ubt`, `import ubt_core`
 _add(_repo_root / "research_tracks" / "legacy_theory_variants")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prime_switching_cache(tmp_path_factory):
+    """Keep the tools/prime_switching.py table out of ~/.cache during tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(
+            "UBT_PRIME_SWITCHING_CACHE",
+            str(tmp_path_factory.mktemp("prime_switching") / "prime_switching.npz"),
+        )
+        yield
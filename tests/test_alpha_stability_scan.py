@@ -28,14 +28,22 @@ from analysis.stability_metrics import (
     combined_stability,
     is_prime,
     is_twin_prime,
-    compute_all_metrics
+    compute_all_metrics,
+    compute_all_metrics_batch,
+    prime_flags
 )
 
 from analysis.alpha_stability_scan import (
     scan_range,
+    scan_arrays,
+    rank_order,
+    top_order,
+    columns_to_candidates,
     rank_candidates,
     find_local_maximum,
-    save_results
+    find_local_maximum_arrays,
+    save_results,
+    save_columns
 )
 
 
@@ -220,6 +228,73 @@ class TestStabilityScan:
             assert c1['combined'] == c2['combined']
 
 
+class TestBatchedScan:
+    """Test the array scanner against the per-n functions."""
+    
+    def test_sieve_flags_match_trial_division(self):
+        """Sieve-based flags must agree with is_prime / is_twin_prime."""
+        n = np.arange(0, 2000)
+        primes, twins = prime_flags(n)
+        assert primes.tolist() == [is_prime(int(k)) for k in n]
+        assert twins.tolist() == [is_twin_prime(int(k)) for k in n]
+    
+    @pytest.mark.parametrize("seed", [0, 42, None])
+    def test_batch_matches_scalar_metrics(self, seed):
+        """Batched metrics reproduce compute_all_metrics, also without a seed."""
+        n = np.arange(1, 400)
+        np.random.seed(7)
+        batch = compute_all_metrics_batch(n, seed=seed)
+        np.random.seed(7)
+        scalar = [compute_all_metrics(int(k), seed=seed) for k in n]
+        for key in ['is_prime', 'is_twin_prime']:
+            assert batch[key].tolist() == [m[key] for m in scalar]
+        for key in ['spectral_gap', 'robustness', 'combined']:
+            np.testing.assert_allclose(batch[key], [m[key] for m in scalar], rtol=1e-14)
+    
+    def test_array_ranking_matches_dict_ranking(self):
+        """rank_order on columns gives the same ranking as rank_candidates."""
+        columns = scan_arrays(100, 300, filter_primes=True, seed=0)
+        ranked = columns_to_candidates(columns, rank_order(columns))
+        expected = rank_candidates(scan_range(100, 300, filter_primes=True, seed=0))
+        assert [c['n'] for c in ranked] == [c['n'] for c in expected]
+        assert [c['rank'] for c in ranked] == list(range(1, len(ranked) + 1))
+        assert set(ranked[0]) == set(expected[0])
+    
+    @pytest.mark.parametrize("k", [0, 1, 7, 40, 500])
+    def test_top_order_matches_rank_order(self, k):
+        """argpartition top-k equals the head of the full stable sort, ties included."""
+        columns = scan_arrays(1, 400, seed=0)
+        columns['combined'] = np.round(columns['combined'], 1)   # many ties
+        assert top_order(columns, k).tolist() == rank_order(columns)[:k].tolist()
+    
+    @pytest.mark.parametrize("target,window", [(137, 5), (139, 40), (150, 3), (401, 5)])
+    def test_array_local_maximum_matches_dict_version(self, target, window):
+        """find_local_maximum_arrays reproduces find_local_maximum on ranked dicts."""
+        for filter_primes, decimals in [(False, None), (True, None), (False, 1)]:
+            columns = scan_arrays(100, 300, filter_primes=filter_primes, seed=0)
+            if decimals is not None:
+                columns['combined'] = np.round(columns['combined'], decimals)
+            ranked = columns_to_candidates(columns, rank_order(columns))
+            assert find_local_maximum_arrays(columns, target, window) == \
+                find_local_maximum(ranked, target_n=target, window=window)
+    
+    def test_save_columns_matches_save_results(self):
+        """CSV/JSON written from the columns equal save_results on ranked dicts."""
+        columns = scan_arrays(100, 200, seed=0)
+        ranked = columns_to_candidates(columns, rank_order(columns))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for fmt in ('csv', 'json'):
+                a, b = Path(tmpdir) / f'a.{fmt}', Path(tmpdir) / f'b.{fmt}'
+                save_columns(columns, a, format=fmt)
+                save_results(ranked, b, format=fmt)
+                assert a.read_bytes() == b.read_bytes()
+    
+    def test_invalid_winding_number(self):
+        """n < 1 has no metric (the spectral gap divides by n)."""
+        with pytest.raises(ValueError):
+            compute_all_metrics_batch([0, 1, 2])
+
+
 class TestNonCircularity:
     """Test that tests are non-circular (don't hardcode that 137 must win)."""
     
@@ -0,0 +1,124 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_biquaternion_array.py — Array biquaternion/octonion algebra vs scalar forms.
+
+BiquaternionArray must reproduce the tuple helpers of
+tools/compute_h_munu_vacuum.py element by element, satisfy the quaternion
+relations, and broadcast over batch shapes.  OctonionArray must reproduce
+the Cayley table it is built from.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from tools.biquaternion_array import (
+    BiquaternionArray,
+    OctonionArray,
+    OCTONION_SIGN_TABLE,
+    associator,
+)
+from tools.compute_h_munu_vacuum import (
+    bq_norm_sq,
+    bq_sc_hermitian,
+    compute_gauge_potential_components,
+    compute_gauge_potential_grid,
+)
+
+
+def _random(shape, seed):
+    rng = np.random.default_rng(seed)
+    return BiquaternionArray(rng.normal(size=shape + (4,))
+                             + 1j * rng.normal(size=shape + (4,)))
+
+
+def test_quaternion_relations():
+    one, i, j, k = (BiquaternionArray.unit(n) for n in range(4))
+    for u in (i, j, k):
+        assert (u * u).allclose(-one)
+    assert (i * j).allclose(k) and (j * k).allclose(i) and (k * i).allclose(j)
+    assert (i * j * k).allclose(-one)
+
+
+def test_matches_scalar_helpers():
+    p, q = _random((50,), 1), _random((50,), 2)
+    sc = p.sc_hermitian(q)
+    norms = q.norm_sq()
+    for n in range(50):
+        assert sc[n] == pytest.approx(bq_sc_hermitian(p[n].to_tuple(), q[n].to_tuple()))
+        assert norms[n] == pytest.approx(bq_norm_sq(q[n].to_tuple()))
+
+
+def test_product_structure():
+    """Associative, norm-multiplicative, and M(pq) = M(p) M(q)."""
+    p, q, r = _random((200,), 3), _random((200,), 4), _random((200,), 5)
+    assert np.abs(associator(p, q, r).data).max() < 1e-12
+    assert np.allclose((p * q).quaternion_norm(),
+                       p.quaternion_norm() * q.quaternion_norm())
+    assert np.allclose((p * q).to_matrix(), p.to_matrix() @ q.to_matrix())
+    assert (p * q).dagger().allclose(q.dagger() * p.dagger())
+    assert (p * p.inverse()).allclose(BiquaternionArray.unit(0, (200,)))
+    assert np.allclose((p * p.dagger()).scalar, p.norm_sq())
+
+
+def test_broadcasting():
+    modes = _random((3, 1), 6)
+    field = _random((7,), 7)
+    prod = modes * field
+    assert prod.shape == (3, 7)
+    assert prod[2, 4].allclose(modes[2, 0] * field[4])
+    assert (2.0 * field).allclose(field * 2.0)
+
+
+def _reference_gauge_potential(theta0, theta1, R_psi, psi):
+    """Original per-ψ scalar formula 𝒜_ψ = Sc(Θ†·∂_ψΘ)/|Θ|², written out."""
+    phase0 = np.exp(1j * psi / R_psi)
+    phase1 = np.exp(2j * psi / R_psi)
+    theta = [x0 * phase0 + x1 * phase1 for x0, x1 in zip(theta0, theta1)]
+    dtheta = [(1j / R_psi) * x0 * phase0 + (2j / R_psi) * x1 * phase1
+              for x0, x1 in zip(theta0, theta1)]
+    norm_sq = sum(abs(x) ** 2 for x in theta)
+    if norm_sq < 1e-30:
+        return 0.0, 0.0
+    A_psi = sum(x * np.conj(y) for x, y in zip(theta, dtheta)) / norm_sq
+    return A_psi.real, A_psi.imag
+
+
+def test_gauge_potential_grid_matches_scalar():
+    theta0 = (1 + 2j, 0.3, -1j, 0.5)
+    theta1 = (0.2, 1j, 0.1, -0.7 + 0.2j)
+    psi = np.linspace(0.0, 6.0, 13)
+    A_R, A_I = compute_gauge_potential_grid(theta0, theta1, 1.7, psi)
+    for n, ps in enumerate(psi):
+        expected = _reference_gauge_potential(theta0, theta1, 1.7, ps)
+        assert (A_R[n], A_I[n]) == pytest.approx(expected, rel=1e-12, abs=1e-15)
+        assert compute_gauge_potential_components(theta0, theta1, 1.7, ps) == \
+            pytest.approx(expected, rel=1e-12, abs=1e-15)
+    zero = (0j, 0j, 0j, 0j)
+    assert compute_gauge_potential_components(zero, zero, 1.0, 0.3) == (0.0, 0.0)
+
+
+def test_gauge_potential_grid_batches_modes():
+    modes0, modes1 = _random((4, 1), 10), _random((4, 1), 11)
+    psi = np.linspace(-3.0, 3.0, 9)
+    A_R, A_I = compute_gauge_potential_grid(modes0, modes1, 0.8, psi)
+    assert A_R.shape == A_I.shape == (4, 9)
+    for m in range(4):
+        t0, t1 = modes0[m, 0].to_tuple(), modes1[m, 0].to_tuple()
+        for n, ps in enumerate(psi):
+            assert (A_R[m, n], A_I[m, n]) == pytest.approx(
+                _reference_gauge_potential(t0, t1, 0.8, ps), rel=1e-12, abs=1e-15)
+
+
+def test_octonion_table():
+    for i in range(8):
+        for j in range(8):
+            sign, k = OCTONION_SIGN_TABLE[i][j]
+            prod = OctonionArray.unit(i) * OctonionArray.unit(j)
+            assert prod.allclose(sign * OctonionArray.unit(k))
+    x = OctonionArray(np.random.default_rng(8).normal(size=(100, 8)))
+    y = OctonionArray(np.random.default_rng(9).normal(size=(100, 8)))
+    # Composition algebra: |xy|² = |x|²|y|²
+    assert np.allclose((x * y).norm_sq(), x.norm_sq() * y.norm_sq())
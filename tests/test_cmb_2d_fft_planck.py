@@ -0,0 +1,105 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_cmb_2d_fft_planck.py — Batched gnomonic tiling vs the single-patch pipeline.
+
+apodize_fft_batch and remove_patch_mean must reproduce apodize_2d + fft_power
+and the per-patch mean removal patch by patch; tilt_scan_tiles must give the
+angles of the single-patch pipeline at every centre; gnomonic_index_table must
+match hp.gnomview(flip='astro') pixel for pixel.  The HEALPix checks need
+healpy and are skipped without it.
+"""
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+from research_front.cmb_2d_fft.cmb_2d_fft_planck import (
+    apodize_2d,
+    apodize_fft_batch,
+    fft_power,
+    gnomonic_index_table,
+    remove_patch_mean,
+    tilt_scan_patch,
+    tilt_scan_tiles,
+)
+
+
+CENTRES = [(0.0, 60.0), (123.4, -45.2), (300.0, 10.0), (45.0, 89.0)]
+
+
+def _stack(n=4, size=48, seed=0):
+    rng = np.random.default_rng(seed)
+    patches = rng.normal(size=(n, size, size)).astype(np.float32)
+    masks = (rng.random((n, size, size)) > 0.2).astype(np.float32)
+    return patches, masks
+
+
+def _single_mean_removed(patch, mask):
+    patch0 = patch.copy()
+    if mask is None:
+        return patch0 - patch0.mean()
+    valid = mask > 0.5
+    patch0[valid] -= patch0[valid].mean()
+    patch0[~valid] = 0.0
+    return patch0
+
+
+@pytest.mark.parametrize("use_mask", [False, True])
+def test_apodize_fft_batch_matches_single(use_mask):
+    patches, masks = _stack()
+    masks = masks if use_mask else None
+    batch = apodize_fft_batch(patches, masks, alpha=0.2)
+    assert batch.shape == patches.shape
+    for i, patch in enumerate(patches):
+        x, _ = apodize_2d(patch, mask=None if masks is None else masks[i], alpha=0.2)
+        np.testing.assert_allclose(batch[i], fft_power(x), rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("use_mask", [False, True])
+def test_remove_patch_mean_matches_single(use_mask):
+    patches, masks = _stack(seed=1)
+    masks = masks if use_mask else None
+    batch = remove_patch_mean(patches, masks)
+    for i, patch in enumerate(patches):
+        expected = _single_mean_removed(patch, None if masks is None else masks[i])
+        np.testing.assert_allclose(batch[i], expected, atol=1e-6)
+
+
+def test_gnomonic_index_table_matches_gnomview():
+    hp = pytest.importorskip("healpy")
+    nside, npix, reso = 64, 64, 20.0
+    pixel_ids = np.arange(hp.nside2npix(nside), dtype=float)
+    lon, lat = np.array(CENTRES).T
+    tables = gnomonic_index_table(nside, lon, lat, npix, reso)
+    assert tables.shape == (len(CENTRES), npix, npix)
+    for (lo, la), table in zip(CENTRES, tables):
+        with warnings.catch_warnings():
+            # healpy's projector touches matplotlib colormap APIs it deprecates
+            warnings.simplefilter("ignore")
+            view = hp.gnomview(pixel_ids, rot=(lo, la, 0), xsize=npix, reso=reso,
+                               flip="astro", return_projected_map=True, no_plot=True)
+        np.testing.assert_array_equal(table, np.asarray(view).astype(np.int64))
+
+
+@pytest.mark.parametrize("use_mask", [False, True])
+def test_tilt_scan_tiles_matches_single_patch(use_mask):
+    hp = pytest.importorskip("healpy")
+    nside = 128
+    rng = np.random.default_rng(2)
+    sky = rng.normal(size=hp.nside2npix(nside))
+    mask = (rng.random(hp.nside2npix(nside)) > 0.1).astype(np.float32) if use_mask else None
+    lon, lat = np.array(CENTRES).T
+    kwargs = dict(scan_deg=(-2, 2), step_deg=0.05, wedge_deg=0.25)
+
+    tiles = tilt_scan_tiles({"I": sky, "neg": -sky}, lon, lat, 10.0, 8.0,
+                            mask=mask, chunk=3, **kwargs)
+    for i, (lo, la) in enumerate(CENTRES):
+        _, _, best, _, energies = tilt_scan_patch(sky, lo, la, 10.0, 8.0, mask=mask, **kwargs)
+        confidence = energies.max() / np.median(energies)
+        for name in ("I", "neg"):
+            assert tiles[name]["best_deg"][i] == pytest.approx(best)
+            assert tiles[name]["confidence"][i] == pytest.approx(confidence, rel=1e-4)
@@ -0,0 +1,61 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_cmb_2d_fft_tilt_scan.py — Sorted-orientation tilt scan vs per-angle wedges.
+
+oriented_energy_scan must reproduce oriented_energy for every wedge centre
+(edge pixels counted as inside), handle wedges crossing 0°/180°, and scan a
+stack of patches with one shared geometry.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy.ndimage import gaussian_filter
+
+from research_front.cmb_2d_fft.cmb_2d_fft_poc import (
+    angle_map,
+    apodize_2d,
+    fft_power,
+    generate_gaussian_field,
+    generate_injected,
+    oriented_energy,
+    oriented_energy_scan,
+    scan_tilt,
+    tilt_scan_geometry,
+)
+
+
+def _spectrum(patch):
+    P = fft_power(apodize_2d(patch - patch.mean())[0])
+    return gaussian_filter(np.log1p(P), 1.5).astype(np.float64)
+
+
+@pytest.mark.parametrize("wedge_deg", [0.25, 3.0])
+def test_scan_matches_oriented_energy(wedge_deg):
+    P = _spectrum(generate_injected(128, 0.224, seed=3))
+    ang, r = angle_map(*P.shape)
+    angles = np.concatenate([np.arange(-2, 2.001, 0.05), [-90.0, 89.9, 135.0, 180.0]])
+    energies = oriented_energy_scan(P, ang, r, angles, rmin=20, rmax=r.max() * 0.9,
+                                    dtheta_deg=wedge_deg)
+    # Widen the reference wedge past rounding so pixels on an edge are inside
+    expected = [oriented_energy(P, ang, r, rmin=20, rmax=r.max() * 0.9, theta_deg=a,
+                                dtheta_deg=wedge_deg + 1e-9) for a in angles]
+    total = P[(r >= 20) & (r <= r.max() * 0.9)].sum()
+    np.testing.assert_allclose(energies, expected, rtol=1e-12, atol=1e-12 * total)
+
+
+def test_scan_tilt_stack_of_patches():
+    patches = [generate_gaussian_field(96, seed=s) for s in range(3)]
+    P = np.stack([_spectrum(p) for p in patches])
+    ang, r = angle_map(96, 96)
+    geometry = tilt_scan_geometry(ang, r, rmin=10)
+    best, angles, energies = scan_tilt(P, ang, r, rmin=10, scan_deg=(-5, 5), step_deg=0.001)
+    assert energies.shape == (3, angles.size) and best.shape == (3,)
+    for i in range(3):
+        single_best, _, single = scan_tilt(P[i], ang, r, rmin=10, scan_deg=(-5, 5), step_deg=0.001)
+        np.testing.assert_array_equal(energies[i], single)
+        assert best[i] == single_best
+    reused = oriented_energy_scan(P, ang, r, angles, rmin=10, geometry=geometry)
+    np.testing.assert_array_equal(reused, energies)
@@ -0,0 +1,58 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_compute_B_KK_sum.py — Quadrature-free KK sum vs adaptive quadrature.
+
+S_KK_fast must agree with the per-mode scipy.quad sum S_KK for truncated
+towers, converge to the full tower as K_max grows, report a small error
+estimate, and broadcast over arrays of N_eff.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from tools.compute_B_KK_sum import (
+    S_KK,
+    S_KK_fast,
+    _S_single_mode,
+    _S_modes_gl,
+    _hurwitz_zeta,
+    kk_mode_sum,
+)
+
+
+def test_modes_match_quad():
+    k = np.array([-7, -1, 0, 1, 2, 30])
+    expected = [_S_single_mode(int(kk)) for kk in k]
+    np.testing.assert_allclose(_S_modes_gl(k), expected, rtol=1e-12, atol=0.0)
+
+
+@pytest.mark.parametrize("K_max", [1, 5, 16, 17, 40])
+def test_fast_matches_quadrature(K_max):
+    S, err = S_KK_fast(12, K_max=K_max, return_error=True)
+    assert S == pytest.approx(S_KK(12, K_max=K_max), rel=1e-13)
+    assert err < 1e-14
+
+
+def test_infinite_tower():
+    S_inf, err = S_KK_fast(12, K_max=None, return_error=True)
+    # Tail beyond K_max is ≈ (N_eff/3π)·2·(1/30)/K_max at leading order
+    S_big = S_KK_fast(12, K_max=10**6)
+    assert S_inf - S_big == pytest.approx(12 / (3 * math.pi) * 2 / 30 / 10**6, rel=1e-5)
+    assert S_KK_fast(12, K_max=math.inf) == S_inf
+    assert err < 1e-14
+    # Leading coefficient c₁ = 1/30: Σ_k S_k ≈ 2ζ(2)/30 − ...
+    total, _ = kk_mode_sum(None)
+    assert 0 < 2 * (math.pi**2 / 6) / 30 - total < 0.01
+
+
+def test_hurwitz_zeta_and_array_N_eff():
+    value, err = _hurwitz_zeta(2, 1.0)
+    assert value == pytest.approx(math.pi**2 / 6, rel=1e-15)
+    assert err < 1e-13
+    N = np.array([4, 8, 12, 24])
+    np.testing.assert_allclose(S_KK_fast(N), [S_KK_fast(int(n)) for n in N], rtol=1e-15)
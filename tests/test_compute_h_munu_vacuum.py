@@ -0,0 +1,77 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_compute_h_munu_vacuum.py — Grid vacuum scan vs per-configuration calls.
+
+scan_vacuum_grid must reproduce compute_vacuum for every grid point
+(including the degenerate r = 0 branches), keep the broadcast grid shape,
+and stream the same table to CSV in-process and through a process pool.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from tools.biquaternion_array import BiquaternionArray
+from tools.compute_h_munu_vacuum import (
+    SCAN_DTYPE,
+    canonical_example,
+    compute_vacuum,
+    phase_scan_modes,
+    scan_vacuum_grid,
+    write_vacuum_scan,
+)
+
+FIELDS = ("h_max", "g_max", "r", "rho", "dalpha_dphi")
+
+
+def _assert_row_matches(row, res):
+    assert complex(row["sc_re"], row["sc_im"]) == pytest.approx(res.sc_inner)
+    for name in FIELDS:
+        assert row[name] == pytest.approx(getattr(res, name), rel=1e-9, abs=1e-14)
+    assert bool(row["phi_is_physical"]) == res.phi_is_physical
+
+
+def test_scan_matches_compute_vacuum():
+    rng = np.random.default_rng(37)
+    theta0 = BiquaternionArray(rng.normal(size=(6, 1, 4)) + 1j * rng.normal(size=(6, 1, 4)))
+    theta1 = BiquaternionArray(rng.normal(size=(6, 1, 4)) + 1j * rng.normal(size=(6, 1, 4)))
+    R_grid = np.array([0.5, 1.0, 2.5])
+    table = scan_vacuum_grid(theta0, theta1, R_grid, n_psi=200, chunk_size=5)
+    assert table.shape == (6, 3)
+    assert table.dtype == SCAN_DTYPE
+    assert (table["index"].ravel() == np.arange(18)).all()
+    for i in range(6):
+        for j in range(3):
+            res = compute_vacuum(theta0[i, 0].to_tuple(), theta1[i, 0].to_tuple(),
+                                 R_psi=R_grid[j], n_psi=200)
+            _assert_row_matches(table[i, j], res)
+
+
+def test_scan_degenerate_and_canonical():
+    zero = (0j, 0j, 0j, 0j)
+    one = (1 + 0j, 0j, 0j, 0j)
+    table = scan_vacuum_grid([zero, one], [zero, zero], 1.0)
+    for row, (t0, t1) in zip(table, [(zero, zero), (one, zero)]):
+        _assert_row_matches(row, compute_vacuum(t0, t1))
+
+    theta0, theta1 = phase_scan_modes(4)          # φ = π/2 is the canonical case
+    row = scan_vacuum_grid(theta0, theta1, [1.0])[1, 0]
+    _assert_row_matches(row, canonical_example())
+
+
+def test_streamed_table_and_process_pool(tmp_path):
+    theta0, theta1 = phase_scan_modes(12)
+    R_grid = np.linspace(0.5, 2.0, 5)
+    serial = scan_vacuum_grid(theta0, theta1, R_grid, chunk_size=7)
+    pooled = scan_vacuum_grid(theta0, theta1, R_grid, chunk_size=7, workers=2)
+    for name in SCAN_DTYPE.names:
+        np.testing.assert_array_equal(serial[name], pooled[name])
+
+    out = tmp_path / "scan.csv"
+    assert write_vacuum_scan(str(out), theta0, theta1, R_grid, chunk_size=16) == 60
+    data = np.genfromtxt(out, delimiter=",", names=True)
+    assert data.dtype.names == SCAN_DTYPE.names
+    np.testing.assert_array_equal(data["index"], np.arange(60))
+    np.testing.assert_allclose(data["r"], serial["r"].ravel(), rtol=1e-15)
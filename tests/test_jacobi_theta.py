@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_jacobi_theta.py — Shared Jacobi θ₃ library vs mpmath and the fit models.
+
+The adaptive/modular evaluation must match mpmath up to the cusp q → 1,
+explicit truncations must reproduce the legacy partial sums, and the analytic
+derivatives (and theta_fit_tau's Jacobian built from them) must agree with
+finite differences.
+"""
+from __future__ import annotations
+
+import mpmath
+import numpy as np
+import pytest
+
+from forensic_fingerprint.tools.jacobi_theta import (
+    adaptive_n_terms,
+    nome_powers,
+    theta3,
+    theta3_derivatives,
+)
+from forensic_fingerprint.tools.theta_fit_tau import (
+    theta3_envelope,
+    theta3_envelope_jacobian,
+)
+
+Z = np.linspace(-0.75, 1.25, 17)          # includes the peaks at z ∈ ℤ
+
+
+def _mp_theta3(z, q):
+    with mpmath.workdps(40):
+        return float(mpmath.jtheta(3, mpmath.pi * z, q))
+
+
+@pytest.mark.parametrize("q", [0.0, 0.01, 0.3, 0.7, 0.95, 0.999, 0.99999])
+def test_matches_mpmath(q):
+    expected = np.array([_mp_theta3(z, q) for z in Z])
+    # Near the cusp θ₃ is exponentially small between integers: compare on its peak scale
+    np.testing.assert_allclose(theta3(Z, q), expected, rtol=1e-13,
+                               atol=1e-14 * np.abs(expected).max())
+
+
+def test_explicit_truncation_is_partial_sum():
+    q = 0.93
+    for N in (1, 6, 100):
+        n = np.arange(1, N + 1)
+        ref = 1 + 2 * np.sum(q ** (n * n) * np.cos(2 * np.pi * np.outer(Z, n)), axis=1)
+        np.testing.assert_allclose(theta3(Z, q, n_terms=N), ref, rtol=1e-14, atol=1e-14)
+    assert q ** (adaptive_n_terms(q) + 1) ** 2 < 1e-16
+    assert not nome_powers(q, 10).flags.writeable
+
+
+@pytest.mark.parametrize("q", [0.2, 0.9, 0.9995])
+def test_derivatives_match_finite_differences(q):
+    h = 1e-6
+    theta, theta_z, theta_q = theta3_derivatives(Z, q)
+    np.testing.assert_allclose(theta, theta3(Z, q), rtol=1e-15)
+    fd_z = (theta3(Z + h, q) - theta3(Z - h, q)) / (2 * h)
+    fd_q = (theta3(Z, q + h * (1 - q)) - theta3(Z, q - h * (1 - q))) / (2 * h * (1 - q))
+    scale = np.abs(theta).max()
+    np.testing.assert_allclose(theta_z, fd_z, rtol=1e-6, atol=1e-6 * scale)
+    np.testing.assert_allclose(theta_q, fd_q, rtol=1e-5, atol=1e-5 * scale / (1 - q))
+
+
+def test_mixed_nomes_broadcast():
+    q = np.array([0.0, 0.02, 0.5, 0.98])[:, None]
+    values = theta3(Z[None, :], q)
+    assert values.shape == (4, Z.size)
+    for i, qi in enumerate(q[:, 0]):
+        np.testing.assert_allclose(values[i], theta3(Z, qi), rtol=1e-14)
+    # Complex nome stays on the direct series
+    qc = 0.3 + 0.4j
+    with mpmath.workdps(30):
+        ref = complex(mpmath.jtheta(3, mpmath.pi * 0.25, qc))
+    assert complex(theta3(0.25, qc)) == pytest.approx(ref, rel=1e-14)
+
+
+@pytest.mark.parametrize("K", [1.0, 7.0])
+def test_envelope_jacobian(K):
+    k = np.arange(100, 150)
+    p = np.array([1.0, 0.5, 125.3, 0.2])
+    J = theta3_envelope_jacobian(k, *p, M=6, K=K)
+    assert J.shape == (k.size, 4)
+    h = 1e-6
+    for i in range(4):
+        dp = h * np.eye(4)[i]
+        fd = (theta3_envelope(k, *(p + dp), M=6, K=K)
+              - theta3_envelope(k, *(p - dp), M=6, K=K)) / (2 * h)
+        np.testing.assert_allclose(J[:, i], fd, atol=1e-7)
@@ -0,0 +1,101 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_prime_switching.py — Switching-threshold table vs brute-force V_eff scans.
+
+The table in tools/prime_switching.py must reproduce, for every (A, B, range),
+the prime returned by min(V_eff) over an ascending candidate list.  No target
+prime is hard-coded: all checks compare against the brute-force minimum.
+"""
+from __future__ import annotations
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from tools.prime_switching import (
+    PrimeSwitchingIndex,
+    sieve_primes_array,
+    switching_thresholds,
+)
+
+
+LIMIT = 5000
+
+
+def _brute_force(A: float, B: float, primes, p_min: int, p_max: int) -> int:
+    candidates = [p for p in primes if p_min <= p <= p_max]
+    return min(candidates, key=lambda p: A * p * p - B * p * math.log(p))
+
+
+@pytest.fixture(scope="module")
+def index() -> PrimeSwitchingIndex:
+    return PrimeSwitchingIndex.build(LIMIT)
+
+
+class TestTable:
+    def test_sieve_matches_trial_division(self):
+        primes = sieve_primes_array(200)
+        expected = [n for n in range(2, 201) if all(n % d for d in range(2, math.isqrt(n) + 1))]
+        assert primes.tolist() == expected
+
+    def test_thresholds_strictly_increasing(self, index):
+        assert len(index.thresholds) == len(index.primes) - 1
+        assert np.all(np.diff(index.thresholds) > 0.0)
+
+    def test_threshold_is_tie_point(self):
+        primes = np.array([127, 131], dtype=np.int64)
+        beta = switching_thresholds(primes)[0]
+        v = [p * p - beta * p * math.log(p) for p in (127, 131)]
+        assert v[0] == pytest.approx(v[1], rel=1e-12)
+
+
+class TestQueries:
+    def test_matches_brute_force(self, index):
+        primes = index.primes.tolist()
+        rng = random.Random(2025)
+        for _ in range(500):
+            A = rng.choice([1.0, rng.uniform(0.05, 5.0), 0.0, -rng.uniform(0.1, 2.0)])
+            B = rng.uniform(-20.0, 400.0)
+            p_min = rng.randint(2, 600)
+            p_max = rng.randint(p_min + 20, LIMIT)
+            expected = _brute_force(A, B, primes, p_min, p_max)
+            assert index.optimal_prime(A, B, p_min, p_max) == expected
+
+    def test_vectorised_matches_scalar(self, index):
+        B_values = np.linspace(1.0, 300.0, 257)
+        vec = index.optimal_primes(1.0, B_values, 50, 3000)
+        assert vec.tolist() == [index.optimal_prime(1.0, B, 50, 3000) for B in B_values]
+
+    def test_beta_interval_contains_query(self, index):
+        p = index.optimal_prime(1.0, 46.3)
+        beta_lo, beta_hi = index.beta_interval(p)
+        assert beta_lo < 46.3 <= beta_hi
+
+    def test_empty_range_raises(self, index):
+        with pytest.raises(ValueError):
+            index.optimal_prime(1.0, 46.3, 114, 126)
+
+    def test_range_beyond_table_raises(self, index):
+        with pytest.raises(ValueError):
+            index.optimal_prime(1.0, 46.3, 2, LIMIT + 1)
+
+
+class TestCache:
+    def test_roundtrip(self, tmp_path):
+        path = tmp_path / "switching.npz"
+        built = PrimeSwitchingIndex.load(LIMIT, cache_path=path)
+        assert path.is_file()
+        loaded = PrimeSwitchingIndex.load(LIMIT, cache_path=path)
+        np.testing.assert_array_equal(built.primes, loaded.primes)
+        np.testing.assert_array_equal(built.thresholds, loaded.thresholds)
+
+    def test_stale_limit_is_rebuilt(self, tmp_path):
+        path = tmp_path / "switching.npz"
+        PrimeSwitchingIndex.load(1000, cache_path=path)
+        index = PrimeSwitchingIndex.load(LIMIT, cache_path=path)
+        assert index.limit == LIMIT
+        assert index.primes[-1] <= LIMIT < index.primes[-1] + 100
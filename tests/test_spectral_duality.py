@@ -9,6 +9,7 @@ Verifies Poisson summation duality numerically.
 
 import pytest
 import numpy as np
+import itertools
 import sys
 from pathlib import Path
 
@@ -19,7 +20,8 @@ from ubt.spectral.laplacian_torus import (
     torus_eigenvalues,
     torus_spectrum_generator,
     mode_count_below_energy,
-    get_lowest_nonzero_eigenvalue
+    get_lowest_nonzero_eigenvalue,
+    sum_of_squares_counts
 )
 
 from scripts.spectral.heat_kernel_trace import (
@@ -32,6 +34,8 @@ from scripts.spectral.poisson_duality_demo import (
     spectral_sum
 )
 
+from simulations.theta_eigenmodes.theta_spectrum_scan import poisson_duality_check
+
 
 class TestLaplacianTorus:
     """Test Laplacian spectrum calculations."""
@@ -60,6 +64,31 @@ class TestLaplacianTorus:
         if len(idx_1) > 0:
             assert degeneracies[idx_1[0]] == 4
     
+    def test_degeneracies_match_mode_grid(self):
+        """Sums-of-squares counts reproduce the cube [-k_max, k_max]^d."""
+        for d, k_max in [(1, 4), (2, 3), (3, 2), (4, 2), (5, 1)]:
+            axis = np.arange(-k_max, k_max + 1)
+            k_sq = np.sum(np.array(list(itertools.product(axis, repeat=d)))**2, axis=1)
+            n, counts = np.unique(k_sq, return_counts=True)
+            eigenvalues, degeneracies = torus_eigenvalues(d, k_max, L=2.0)
+            np.testing.assert_array_equal(eigenvalues, np.pi**2 * n)
+            np.testing.assert_array_equal(degeneracies, counts)
+            assert list(torus_spectrum_generator(d, k_max, L=2.0)) == list(
+                zip(eigenvalues, degeneracies))
+
+    def test_unrestricted_counts_and_stream(self):
+        """r_d(n) for the full lattice, streamed lazily in sorted order."""
+        # Jacobi: r_4(n) = 8 σ(n) for odd n
+        r4 = sum_of_squares_counts(4, 99)
+        for n in range(1, 100, 2):
+            assert r4[n] == 8 * sum(k for k in range(1, n + 1) if n % k == 0)
+        pairs = list(itertools.islice(torus_spectrum_generator(3, None, L=1.0), 300))
+        eigenvalues = [lam for lam, _ in pairs]
+        assert eigenvalues == sorted(eigenvalues) and pairs[1][1] == 6
+        n = np.rint(np.array(eigenvalues) / (2 * np.pi)**2).astype(int)
+        np.testing.assert_array_equal([deg for _, deg in pairs],
+                                      sum_of_squares_counts(3, n[-1])[n])
+
     def test_lowest_eigenvalue(self):
         """Test lowest non-zero eigenvalue."""
         lambda_min = get_lowest_nonzero_eigenvalue(d=2, L=1.0)
@@ -154,6 +183,15 @@ class TestPoissonDuality:
         # If all errors are already at machine precision (== 0.0), the test passes
         assert errors[-1] < max(errors[0] * 2, 1e-10), "Error should improve with larger cutoff"
 
+    @pytest.mark.parametrize("d", [1, 2, 3])
+    def test_theta_scan_duality_on_torus(self, d):
+        """Winding/spectral ratio of the lattice-count sums is R^d on T^d."""
+        R = 1.3
+        check = poisson_duality_check(R, N=20, d=d)
+        assert check['expected_ratio'] == pytest.approx(R ** d)
+        assert check['ratio'] == pytest.approx(R ** d, rel=1e-9)
+        assert check['passes']
+
 
 class TestSpectralInvariants:
     """Test spectral invariants and asymptotics."""
@@ -174,6 +212,20 @@ class TestSpectralInvariants:
         rel_error = abs(count - weyl_estimate) / weyl_estimate
         assert rel_error < 0.5, f"Mode count {count} vs Weyl {weyl_estimate:.1f}"
 
+    def test_mode_counting_cumulative_table(self):
+        """N(Λ) from the cumulative table, including λ = Λ exactly and d = 6."""
+        unit = (2 * np.pi)**2
+        assert mode_count_below_energy(2, unit, 1.0) == 5
+        assert mode_count_below_energy(2, np.nextafter(unit, 0), 1.0) == 1
+        assert mode_count_below_energy(3, -1.0, 1.0) == 0
+        eigenvalues, degeneracies = torus_eigenvalues(3, 6, 1.0)
+        for Lambda in [10.0, 500.0, 36 * unit]:
+            assert mode_count_below_energy(3, Lambda, 1.0) == degeneracies[eigenvalues <= Lambda].sum()
+        # d = 6 up to |k|² = 400 (a (41)^6 grid would need 4.75e9 points)
+        count = mode_count_below_energy(6, 400 * unit, 1.0)
+        weyl = np.pi**3 / 6 * 400**3
+        assert abs(count - weyl) / weyl < 0.05
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
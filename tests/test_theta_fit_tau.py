@@ -13,11 +13,15 @@ import numpy as np
 import pytest
 
 from forensic_fingerprint.tools.theta_fit_tau import (
+    bootstrap_samples,
+    bootstrap_uncertainty,
     compute_derived_params,
     compute_goodness_of_fit,
     fit_gauss_envelope,
     fit_theta3_envelope,
     gauss_envelope,
+    gauss_envelope_jacobian,
+    laplace_uncertainty,
     load_csv,
     theta3_envelope,
 )
@@ -135,6 +139,53 @@ def test_fit_theta3_envelope_synthetic():
     assert popt[3] > 0  # a
 
 
+def test_bootstrap_deterministic_across_workers():
+    """Per-resample seeds make the bootstrap independent of the worker count."""
+    k = np.arange(100, 150)
+    rng = np.random.default_rng(7)
+    psd_obs = gauss_envelope(k, 1.0, 2.0, 125.0, 5.0) + rng.normal(0, 0.1, size=len(k))
+
+    serial = bootstrap_samples(k, psd_obs, 110, 140, "gauss_envelope", n_bootstrap=40,
+                               seed=3, chunk_size=7)
+    pooled = bootstrap_samples(k, psd_obs, 110, 140, "gauss_envelope", n_bootstrap=40,
+                               seed=3, chunk_size=7, workers=2)
+    assert serial.shape == (40, 4)
+    np.testing.assert_array_equal(serial, pooled)
+
+    # Warm start from the point estimate gives the same fits as the full-window default
+    popt, _ = fit_gauss_envelope(k, psd_obs, kmin=110, kmax=140)
+    means, stds = bootstrap_uncertainty(k, psd_obs, 110, 140, "gauss_envelope",
+                                        n_bootstrap=40, seed=3, p0=popt)
+    np.testing.assert_allclose(means, serial.mean(axis=0), rtol=1e-6)
+    np.testing.assert_allclose(stds, serial.std(axis=0), rtol=1e-4)
+
+
+def test_laplace_matches_curve_fit_covariance():
+    """Laplace errors reuse the analytic Jacobian and match curve_fit's pcov."""
+    k = np.arange(100, 150)
+    rng = np.random.default_rng(11)
+
+    psd_obs = gauss_envelope(k, 1.0, 2.0, 125.0, 5.0) + rng.normal(0, 0.1, size=len(k))
+    popt, pcov = fit_gauss_envelope(k, psd_obs, kmin=110, kmax=140)
+    center, perr = laplace_uncertainty(k, psd_obs, 110, 140, "gauss_envelope", popt)
+    np.testing.assert_array_equal(center, popt)
+    np.testing.assert_allclose(perr, np.sqrt(np.diag(pcov)), rtol=1e-3)
+
+    psd_obs = theta3_envelope(k, 1.0, 0.5, 125.3, 0.2, M=6, K=7.0)
+    psd_obs = psd_obs + rng.normal(0, 0.05, size=len(k))
+    popt, pcov = fit_theta3_envelope(k, psd_obs, kmin=110, kmax=140, M=6, K=7.0)
+    _, perr = laplace_uncertainty(k, psd_obs, 110, 140, "theta3_envelope", popt, M=6, K=7.0)
+    np.testing.assert_allclose(perr, np.sqrt(np.diag(pcov)), rtol=1e-3)
+
+    # Analytic Gaussian Jacobian vs central differences
+    p = np.array([1.0, 2.0, 125.3, 5.0])
+    J = gauss_envelope_jacobian(k, *p)
+    for i in range(4):
+        dp = 1e-6 * np.eye(4)[i]
+        fd = (gauss_envelope(k, *(p + dp)) - gauss_envelope(k, *(p - dp))) / 2e-6
+        np.testing.assert_allclose(J[:, i], fd, atol=1e-7)
+
+
 def test_compute_derived_params_gauss():
     """Test derived parameter computation for Gaussian model."""
     popt = np.array([1.0, 2.0, 125.0, 5.0])  # baseline, A, k0, sigma
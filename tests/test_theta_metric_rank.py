@@ -0,0 +1,69 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_theta_metric_rank.py — Batched Jacobian / stacked-SVD rank of the Θ → metric map.
+
+The index-arithmetic Jacobian must match the lambdified symbolic one,
+the chunked rank histogram must not depend on the chunk size, and the
+batched kernel / so(8) checks must agree with their single-sample results.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from analysis.theta_metric_rank import (
+    batched_jacobian,
+    batched_ranks,
+    compute_kernel_directions,
+    numeric_rank_samples,
+    symbolic_jacobian,
+    verify_lorentz_kernel,
+)
+
+
+def _symbolic_jacobian_at(E):
+    """Evaluate the sympy Jacobian at every configuration of a stack (n, 4, 8)."""
+    flat, _, J_sym = symbolic_jacobian()
+    entries = sp.lambdify([flat], list(J_sym), modules="numpy")
+    X = E.reshape(len(E), 32).T
+    values = [np.broadcast_to(v, len(E)) for v in entries(X)]
+    return np.stack(values, axis=-1).reshape(len(E), 10, 32)
+
+
+def test_batched_jacobian_matches_symbolic():
+    E = np.random.default_rng(3).standard_normal((6, 4, 8))
+    J = batched_jacobian(E)
+    assert J.shape == (6, 10, 32)
+    np.testing.assert_allclose(_symbolic_jacobian_at(E), J, rtol=0, atol=0)
+    np.testing.assert_array_equal(batched_jacobian(E[2]), J[2])
+
+
+def test_rank_histogram_chunking():
+    a = numeric_rank_samples(n_samples=700, chunk_size=64)
+    assert a == numeric_rank_samples(n_samples=700)
+    assert a["rank_counts"] == {10: 700} and a["mean_rank"] == 10.0
+    # Degenerate tetrads: g01 = (g00 + g11)/2 for equal rows; g33 row vanishes for E_3 = 0
+    E = np.random.default_rng(0).standard_normal((2, 4, 8))
+    E[0, 1] = E[0, 0]
+    E[1, 3] = 0.0
+    assert batched_ranks(E).tolist() == [9, 9]
+
+
+def test_kernel_and_lorentz_check_on_stacks():
+    E = np.random.default_rng(5).standard_normal((4, 4, 8))
+    K = compute_kernel_directions(E)
+    assert K.shape == (4, 22, 32)
+    np.testing.assert_allclose(batched_jacobian(E) @ np.swapaxes(K, -1, -2), 0, atol=1e-12)
+    single = compute_kernel_directions(E[1])
+    np.testing.assert_allclose(K[1].T @ K[1], single.T @ single, atol=1e-12)
+
+    stacked = verify_lorentz_kernel(E)
+    assert stacked["n_so8_generators"] == 28 and stacked["all_in_kernel"]
+    assert stacked["max_delta_g"] == max(verify_lorentz_kernel(e)["max_delta_g"] for e in E)
+
+    E[0, 1] = 0.0
+    with pytest.raises(ValueError):
+        compute_kernel_directions(E)
@@ -0,0 +1,70 @@
+# Copyright (c) 2026 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_ubt_cmb_cl.py — Bessel table and one-pass Sachs-Wolfe C_l engine.
+
+spherical_bessel_table must match scipy in both recurrence regimes (including
+l ≫ x, where the upward recurrence overflows), and compute_cl_sw_table must
+reproduce the per-multipole integral for both spectra.
+"""
+from __future__ import annotations
+
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scipy.special import spherical_jn
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]
+                       / "experiments" / "simulations" / "prediction_models"))
+
+from ubt_cmb_cl import (  # noqa: E402
+    ETA_0_MPC,
+    K_EQ_MPC,
+    compute_cl_sw,
+    compute_cl_sw_table,
+    matter_transfer,
+    spherical_bessel,
+    spherical_bessel_table,
+)
+from ubt_primordial_spectrum import standard_spectrum, ubt_spectrum  # noqa: E402
+
+
+def test_matter_transfer_limits():
+    k = np.array([0.0, 1e-3 * K_EQ_MPC, K_EQ_MPC, 1e3 * K_EQ_MPC])
+    t = matter_transfer(k)
+    np.testing.assert_allclose(t, [1.0, 1.0, 2 ** -0.5, 1e-6], rtol=1e-9)
+    assert matter_transfer(K_EQ_MPC) == pytest.approx(t[2])
+
+
+@pytest.mark.parametrize("l_max", [0, 1, 12, 600])
+def test_bessel_table_matches_scipy(l_max):
+    x = np.concatenate([[0.0, 1e-3, 0.14, l_max + 0.5, 1.5 * l_max + 3],
+                        np.geomspace(1e-2, 4e3, 200)])
+    table = spherical_bessel_table(l_max, x)
+    ref = spherical_jn(np.arange(l_max + 1)[None, :], x[:, None])
+    assert table.shape == (x.size, l_max + 1)
+    np.testing.assert_allclose(table, ref, rtol=1e-10, atol=1e-15)
+    assert spherical_bessel(40, 0.5) == pytest.approx(spherical_jn(40, 0.5), rel=1e-12)
+
+
+def test_cl_table_matches_direct_integral():
+    r_psi, n_points = 3000.0, 120
+    l_max = 150                     # beyond l ≈ 68 the upward recurrence overflowed
+    cl_ubt, cl_lcdm = compute_cl_sw_table(l_max, r_psi, n_points=n_points)
+    assert cl_ubt.shape == cl_lcdm.shape == (l_max + 1,)
+
+    log_k = np.linspace(math.log(1e-5), math.log(0.1), n_points)
+    k = np.exp(log_k)
+    for l in (2, 10, 150):
+        w = (2 / math.pi) * k**3 * (log_k[1] - log_k[0]) * (
+            spherical_jn(l, k * ETA_0_MPC) * matter_transfer(k) / 3) ** 2
+        assert cl_ubt[l] == pytest.approx(np.dot(w, [ubt_spectrum(kk, r_psi) for kk in k]),
+                                          rel=1e-10)
+        assert cl_lcdm[l] == pytest.approx(np.dot(w, [standard_spectrum(kk) for kk in k]),
+                                           rel=1e-10)
+    assert compute_cl_sw(10, r_psi, n_points=n_points) == pytest.approx(
+        (cl_ubt[10], cl_lcdm[10]), rel=1e-12)
@@ -0,0 +1,78 @@
+# Copyright (c) 2026 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_ubt_primordial_spectrum.py — Vectorised (R_ψ × k) spectrum tables and their cache.
+
+The tables must agree with the scalar f_psi / ubt_spectrum for every
+scenario (including R_ψ <= 0), rows must be reused from memory and from the
+.npz disk cache, and a different k grid must not hit a stale row.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]
+                       / "experiments" / "simulations" / "prediction_models"))
+
+import ubt_primordial_spectrum as ups  # noqa: E402
+from ubt_cmb_cl import compute_cl_sw_sweep, compute_cl_sw_table  # noqa: E402
+
+RADII = [0.0, ups.L_PLANCK_MPC, 3000.0, ups.HUBBLE_LENGTH_MPC]
+K = np.geomspace(1e-6, 1.0, 257)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.delenv(ups.CACHE_ENV_VAR, raising=False)
+    ups.clear_spectrum_cache()
+    yield
+    ups.clear_spectrum_cache()
+
+
+@pytest.mark.parametrize("n_winding", [1, 5])
+def test_table_matches_scalar(n_winding):
+    f = ups.f_psi_table(K, RADII, n_winding=n_winding)
+    assert f.shape == (len(RADII), K.size)
+    ref = np.array([[ups.f_psi(k, r, n_winding) for k in K] for r in RADII])
+    np.testing.assert_allclose(f, ref, rtol=1e-15, atol=1e-15)
+    p = ups.ubt_spectrum_table(K, RADII)
+    ref = np.array([[ups.ubt_spectrum(k, r) for k in K] for r in RADII])
+    # 1 - exp(-(kR)²) cancels at small k: compare on the scale of A_s
+    np.testing.assert_allclose(p, ref, rtol=1e-14, atol=1e-15 * ups.A_S)
+    assert ups.standard_spectrum_array([0.0, -1.0]).tolist() == [0.0, 0.0]
+
+
+def test_memory_and_disk_cache(tmp_path, monkeypatch):
+    first = ups.f_psi_table(K, RADII, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("f_psi_*.npz"))) == len(RADII)
+
+    computed = []
+    rows = ups._f_psi_rows
+    monkeypatch.setattr(ups, "_f_psi_rows",
+                        lambda k, r, n: computed.append(len(r)) or rows(k, r, n))
+    np.testing.assert_array_equal(ups.f_psi_table(K, RADII[::-1], cache_dir=tmp_path),
+                                  first[::-1])
+    ups.clear_spectrum_cache()
+    monkeypatch.setenv(ups.CACHE_ENV_VAR, str(tmp_path))
+    np.testing.assert_array_equal(ups.f_psi_table(K, RADII), first)
+    assert computed == []
+
+    # Returned tables are private copies; a new grid is a miss
+    first[:] = 0.0
+    assert ups.f_psi_table(K, RADII).any()
+    ups.f_psi_table(K[:-1], RADII + [5000.0])
+    assert computed == [len(RADII) + 1]
+
+
+def test_cl_sweep_matches_single_scenarios():
+    cl_ubt, cl_lcdm = compute_cl_sw_sweep(30, RADII[2:], n_points=80)
+    assert cl_ubt.shape == (2, 31)
+    for row, r in zip(cl_ubt, RADII[2:]):
+        single_ubt, single_lcdm = compute_cl_sw_table(30, r, n_points=80)
+        np.testing.assert_allclose(row, single_ubt, rtol=1e-12)
+        np.testing.assert_allclose(cl_lcdm, single_lcdm, rtol=1e-12)
@@ -0,0 +1,75 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+test_verify_fpe.py — Batched Theta/FPE verifier vs the spot-check functions.
+
+The (n_T × N_terms × N) log-sum-exp tensor must reproduce build_theta, the
+complex-step residuals must agree with run_verification up to its
+finite-difference error, and the sweep must keep the Test 1 / Test 2
+verdicts across the parameter grid.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from tools.verify_fpe import (
+    batched_fpe_residuals,
+    build_theta,
+    complex_step,
+    gaussian_hamiltonian,
+    grad_hamiltonian,
+    grad_linear_hamiltonian,
+    linear_hamiltonian,
+    log_theta_batch,
+    run_verification,
+    sweep_fpe_residuals,
+)
+
+Q = np.linspace(-0.5, 0.5, 200)
+
+
+def test_log_theta_matches_build_theta():
+    rng = np.random.default_rng(39)
+    B = rng.uniform(0.5, 1.5, size=11)               # n = -5..5
+    T = np.array([0.2, 0.5, 1.3])
+    log_theta = log_theta_batch(Q, T, B, gaussian_hamiltonian, n_terms=[0, 2, 5], sigma=0.2)
+    assert log_theta.shape == (3, 3, 200)
+    for i, t in enumerate(T):
+        for j, k in enumerate([0, 2, 5]):
+            ref = build_theta(Q, t, B[5 - k:5 + k + 1], gaussian_hamiltonian, sigma=0.2)
+            np.testing.assert_allclose(np.exp(log_theta[i, j]), ref, rtol=1e-13)
+
+
+def test_log_theta_no_overflow():
+    log_theta = log_theta_batch(Q, [0.5], np.full(3, 400.0), linear_hamiltonian, D=0.1)
+    assert np.isfinite(log_theta).all()
+    H = linear_hamiltonian(Q, 0.5, D=0.1)
+    np.testing.assert_allclose(log_theta[0, 0], np.pi * 400.0 * H + np.log(3.0))
+
+
+def test_complex_step_derivative():
+    dH_dT = complex_step(lambda t: gaussian_hamiltonian(Q, t, sigma=0.2), 0.5)
+    np.testing.assert_allclose(dH_dT, -gaussian_hamiltonian(Q, 0.5, sigma=0.2), rtol=1e-15)
+
+
+def test_residuals_match_run_verification():
+    spot = run_verification(N=200, N_terms=5, D=0.1, T0=0.5)
+    B = np.ones(11)
+    res_lin = batched_fpe_residuals(Q, [0.5], B, 0.1, linear_hamiltonian,
+                                    grad_linear_hamiltonian, edge=5, D=0.1)
+    res_gau = batched_fpe_residuals(Q, [0.5], B, 0.1, gaussian_hamiltonian,
+                                    grad_hamiltonian, edge=5, sigma=0.2)
+    assert res_lin.shape == (1, 1, 1)
+    # Exact derivatives: no finite-difference floor for the consistent H
+    assert res_lin[0, 0, 0] < 1e-12 < spot["linear_residual"]
+    assert res_gau[0, 0, 0] == pytest.approx(spot["gaussian_residual"], rel=1e-3)
+
+
+def test_sweep_keeps_verdicts():
+    sweep = sweep_fpe_residuals(N_values=(100, 200), N_terms_values=(1, 3, 5),
+                                D_values=(0.05, 0.1, 0.2), T_values=np.linspace(0.1, 2.0, 7))
+    assert sweep["linear_residual"].shape == (2, 3, 7, 3)
+    assert sweep["linear_residual"].max() < 1e-12
+    assert sweep["gaussian_residual"].min() > 0.5
@@ -0,0 +1,362 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+biquaternion_array.py — Array-backed biquaternions and octonions.
+
+PURPOSE
+-------
+Scripts that scan fields of biquaternions Θ = a·1 + b·i + c·j + d·k
+(a, b, c, d ∈ ℂ) used tuples of four complex numbers and scalar helpers,
+so every grid point cost a Python call.  BiquaternionArray stores a whole
+batch as one (..., 4) complex128 buffer and implements the algebra as
+NumPy expressions over arbitrary batch shapes:
+
+    product          Hamilton product, ℂ-bilinear (i² = j² = k² = ijk = −1)
+    conjugations     quaternionic  q̃ = (a, −b, −c, −d)
+                     complex       q̄ = (ā, b̄, c̄, d̄)
+                     Hermitian     q† = (ā, −b̄, −c̄, −d̄)   (both at once)
+    inner products   Sc(p q†) = a_p ā_q + b_p b̄_q + c_p c̄_q + d_p d̄_q
+    norms            |q|² = Sc(q q†)  (real ≥ 0),  N(q) = Sc(q q̃) = a²+b²+c²+d²
+
+Batch shapes broadcast like NumPy arrays, so a (n,) array of field values
+times a (m, 1) array of modes gives an (m, n) result.
+
+OctonionArray is the same idea for (complexified) octonions: a (..., 8)
+buffer multiplied through the Cayley table as an (8, 8, 8) einsum tensor.
+
+CONVENTIONS
+-----------
+The 2×2 matrix image follows dimensional_economy/dim_economy_core/
+biquaternion_algebra.quaternion_basis:
+
+    1 ↦ I₂,  i ↦ iσ₂,  j ↦ iσ₁,  k ↦ iσ₃
+
+The octonion table is the Fano-plane table of dim_economy_core/associativity
+(eᵢ·eⱼ = sign·eₖ).
+
+USAGE
+-----
+    from tools.biquaternion_array import BiquaternionArray
+    q = BiquaternionArray.from_components(a, b, c, d)   # arrays of any shape
+    (q * q.dagger()).scalar                               # = |q|² + 0j
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Biquaternions
+# ─────────────────────────────────────────────────────────────────────────────
+
+_SIGMA = np.array([
+    [[1, 0], [0, 1]],
+    [[0, 1], [1, 0]],
+    [[0, -1j], [1j, 0]],
+    [[1, 0], [0, -1]],
+], dtype=complex)
+
+#: Matrix images of 1, i, j, k:  I₂, iσ₂, iσ₁, iσ₃  (shape (4, 2, 2)).
+QUATERNION_MATRICES = np.array(
+    [_SIGMA[0], 1j * _SIGMA[2], 1j * _SIGMA[1], 1j * _SIGMA[3]]
+)
+
+
+def _as_data(data, width: int, dtype) -> np.ndarray:
+    arr = np.asarray(data, dtype=dtype)
+    if arr.ndim == 0 or arr.shape[-1] != width:
+        raise ValueError(f"expected an array of shape (..., {width}), got {arr.shape}")
+    return arr
+
+
+class BiquaternionArray:
+    """A batch of biquaternions held as a (..., 4) complex128 array.
+
+    Component order is (a, b, c, d) for a·1 + b·i + c·j + d·k.  Products with
+    NumPy scalars/arrays scale componentwise (broadcast over the batch shape);
+    products of two BiquaternionArrays are Hamilton products.
+    """
+
+    __slots__ = ("data",)
+    __array_ufunc__ = None   # keep ndarray * BiquaternionArray on our side
+
+    def __init__(self, data) -> None:
+        self.data = _as_data(data, 4, np.complex128)
+
+    # ── construction ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def from_components(cls, a, b, c, d) -> "BiquaternionArray":
+        """Stack (broadcast) component arrays into one biquaternion array."""
+        a, b, c, d = np.broadcast_arrays(*(np.asarray(x, dtype=complex)
+                                           for x in (a, b, c, d)))
+        return cls(np.stack([a, b, c, d], axis=-1))
+
+    @classmethod
+    def zeros(cls, shape: Tuple[int, ...] = ()) -> "BiquaternionArray":
+        return cls(np.zeros(tuple(shape) + (4,), dtype=complex))
+
+    @classmethod
+    def unit(cls, k: int, shape: Tuple[int, ...] = ()) -> "BiquaternionArray":
+        """Basis element 1, i, j, k for k = 0, 1, 2, 3."""
+        out = np.zeros(tuple(shape) + (4,), dtype=complex)
+        out[..., k] = 1.0
+        return cls(out)
+
+    @classmethod
+    def from_matrix(cls, M) -> "BiquaternionArray":
+        """Inverse of to_matrix for (..., 2, 2) complex matrices."""
+        M = np.asarray(M, dtype=complex)
+        # Tr(E_k† E_l) = 2 δ_kl for the images of 1, i, j, k
+        return cls(np.einsum("kij,...ij->...k", QUATERNION_MATRICES.conj(), M) / 2.0)
+
+    # ── array protocol ───────────────────────────────────────────────────────
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Batch shape (without the trailing component axis)."""
+        return self.data.shape[:-1]
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __getitem__(self, index) -> "BiquaternionArray":
+        if not isinstance(index, tuple):
+            index = (index,)
+        return BiquaternionArray(self.data[index + (slice(None),)])
+
+    def reshape(self, *shape) -> "BiquaternionArray":
+        if len(shape) == 1 and isinstance(shape[0], tuple):
+            shape = shape[0]
+        return BiquaternionArray(self.data.reshape(tuple(shape) + (4,)))
+
+    def copy(self) -> "BiquaternionArray":
+        return BiquaternionArray(self.data.copy())
+
+    def __repr__(self) -> str:
+        return f"BiquaternionArray(shape={self.shape})"
+
+    @property
+    def a(self) -> np.ndarray:
+        return self.data[..., 0]
+
+    @property
+    def b(self) -> np.ndarray:
+        return self.data[..., 1]
+
+    @property
+    def c(self) -> np.ndarray:
+        return self.data[..., 2]
+
+    @property
+    def d(self) -> np.ndarray:
+        return self.data[..., 3]
+
+    scalar = a
+
+    @property
+    def vector(self) -> np.ndarray:
+        """(b, c, d) as a (..., 3) array."""
+        return self.data[..., 1:]
+
+    def to_tuple(self) -> Tuple[complex, complex, complex, complex]:
+        """(a, b, c, d) as Python complex numbers (single biquaternion only)."""
+        if self.shape != ():
+            raise ValueError(f"to_tuple needs a single biquaternion, got shape {self.shape}")
+        return tuple(complex(x) for x in self.data)
+
+    # ── algebra ──────────────────────────────────────────────────────────────
+
+    def __add__(self, other) -> "BiquaternionArray":
+        if isinstance(other, BiquaternionArray):
+            return BiquaternionArray(self.data + other.data)
+        return NotImplemented
+
+    def __sub__(self, other) -> "BiquaternionArray":
+        if isinstance(other, BiquaternionArray):
+            return BiquaternionArray(self.data - other.data)
+        return NotImplemented
+
+    def __neg__(self) -> "BiquaternionArray":
+        return BiquaternionArray(-self.data)
+
+    def __mul__(self, other) -> "BiquaternionArray":
+        if isinstance(other, BiquaternionArray):
+            return self.hamilton(other)
+        return BiquaternionArray(self.data * np.asarray(other)[..., None])
+
+    def __rmul__(self, other) -> "BiquaternionArray":
+        # Scalars commute with every component (ℂ is central in ℂ⊗ℍ)
+        return BiquaternionArray(self.data * np.asarray(other)[..., None])
+
+    def __truediv__(self, other) -> "BiquaternionArray":
+        return BiquaternionArray(self.data / np.asarray(other)[..., None])
+
+    def hamilton(self, other: "BiquaternionArray") -> "BiquaternionArray":
+        """Hamilton product self·other, broadcast over batch shapes.
+
+        (a₁ + v₁)(a₂ + v₂) = a₁a₂ − v₁·v₂ + a₁v₂ + a₂v₁ + v₁×v₂
+        (no complex conjugation: the product is ℂ-bilinear).
+        """
+        p, q = np.broadcast_arrays(self.data, other.data)
+        a1, v1 = p[..., 0], p[..., 1:]
+        a2, v2 = q[..., 0], q[..., 1:]
+        out = np.empty(p.shape, dtype=complex)
+        out[..., 0] = a1 * a2 - np.einsum("...i,...i->...", v1, v2)
+        out[..., 1:] = (a1[..., None] * v2 + a2[..., None] * v1
+                        + np.cross(v1, v2))
+        return BiquaternionArray(out)
+
+    def quaternion_conjugate(self) -> "BiquaternionArray":
+        """q̃ = a − b·i − c·j − d·k (coefficients not conjugated)."""
+        out = -self.data
+        out[..., 0] = self.data[..., 0]
+        return BiquaternionArray(out)
+
+    def complex_conjugate(self) -> "BiquaternionArray":
+        """Complex conjugation of every coefficient."""
+        return BiquaternionArray(self.data.conj())
+
+    def dagger(self) -> "BiquaternionArray":
+        """Hermitian conjugate q† = ā − b̄·i − c̄·j − d̄·k."""
+        out = -self.data.conj()
+        out[..., 0] = self.data[..., 0].conj()
+        return BiquaternionArray(out)
+
+    def sc_hermitian(self, other: "BiquaternionArray") -> np.ndarray:
+        """Sc(p·q†) = Σ p_k q̄_k, the sesquilinear inner product on ℂ⊗ℍ."""
+        return np.einsum("...k,...k->...", self.data, other.data.conj())
+
+    def norm_sq(self) -> np.ndarray:
+        """|q|² = Sc(q·q†) = |a|² + |b|² + |c|² + |d|² (real, ≥ 0)."""
+        return np.einsum("...k,...k->...", self.data.real, self.data.real) + \
+            np.einsum("...k,...k->...", self.data.imag, self.data.imag)
+
+    def norm(self) -> np.ndarray:
+        return np.sqrt(self.norm_sq())
+
+    def quaternion_norm(self) -> np.ndarray:
+        """N(q) = Sc(q·q̃) = a² + b² + c² + d² (complex; multiplicative)."""
+        return np.einsum("...k,...k->...", self.data, self.data)
+
+    def inverse(self) -> "BiquaternionArray":
+        """q⁻¹ = q̃ / N(q) (inf/nan where N(q) = 0, i.e. q is a zero divisor)."""
+        return self.quaternion_conjugate() / self.quaternion_norm()
+
+    def to_matrix(self) -> np.ndarray:
+        """Image in Mat(2,ℂ): a·I₂ + b·iσ₂ + c·iσ₁ + d·iσ₃, shape (..., 2, 2)."""
+        return np.einsum("...k,kij->...ij", self.data, QUATERNION_MATRICES)
+
+    def allclose(self, other: "BiquaternionArray", **kwargs) -> bool:
+        return bool(np.allclose(self.data, other.data, **kwargs))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Octonions
+# ─────────────────────────────────────────────────────────────────────────────
+
+#: Fano-plane Cayley table: entry [i][j] = (sign, k) meaning eᵢ·eⱼ = sign·eₖ.
+OCTONION_SIGN_TABLE: Sequence[Sequence[Tuple[int, int]]] = (
+    # e0      e1      e2      e3      e4      e5      e6      e7
+    ((+1, 0), (+1, 1), (+1, 2), (+1, 3), (+1, 4), (+1, 5), (+1, 6), (+1, 7)),  # e0·ej
+    ((+1, 1), (-1, 0), (+1, 3), (-1, 2), (+1, 5), (-1, 4), (-1, 7), (+1, 6)),  # e1·ej
+    ((+1, 2), (-1, 3), (-1, 0), (+1, 1), (+1, 6), (+1, 7), (-1, 4), (-1, 5)),  # e2·ej
+    ((+1, 3), (+1, 2), (-1, 1), (-1, 0), (+1, 7), (-1, 6), (+1, 5), (-1, 4)),  # e3·ej
+    ((+1, 4), (-1, 5), (-1, 6), (-1, 7), (-1, 0), (+1, 1), (+1, 2), (+1, 3)),  # e4·ej
+    ((+1, 5), (+1, 4), (-1, 7), (+1, 6), (-1, 1), (-1, 0), (-1, 3), (+1, 2)),  # e5·ej
+    ((+1, 6), (+1, 7), (+1, 4), (-1, 5), (-1, 2), (+1, 3), (-1, 0), (-1, 1)),  # e6·ej
+    ((+1, 7), (-1, 6), (+1, 5), (+1, 4), (-1, 3), (-1, 2), (+1, 1), (-1, 0)),  # e7·ej
+)
+
+
+def structure_tensor(sign_table) -> np.ndarray:
+    """(n, n, n) tensor T with T[i, j, k] = sign for eᵢ·eⱼ = sign·eₖ."""
+    n = len(sign_table)
+    T = np.zeros((n, n, n))
+    for i, row in enumerate(sign_table):
+        for j, (sign, k) in enumerate(row):
+            T[i, j, k] = sign
+    T.setflags(write=False)
+    return T
+
+
+OCTONION_TENSOR = structure_tensor(OCTONION_SIGN_TABLE)
+
+
+class OctonionArray:
+    """A batch of (possibly complexified) octonions as a (..., 8) array.
+
+    Real input stays float64; complex input (ℂ⊗𝕆) is complex128.  Products
+    of two OctonionArrays use the Cayley table; other factors scale.
+    """
+
+    __slots__ = ("data",)
+    __array_ufunc__ = None
+
+    def __init__(self, data) -> None:
+        arr = np.asarray(data)
+        dtype = np.result_type(arr.dtype, np.float64)
+        self.data = _as_data(arr, 8, dtype)
+
+    @classmethod
+    def unit(cls, k: int, shape: Tuple[int, ...] = ()) -> "OctonionArray":
+        """Basis element e_k."""
+        out = np.zeros(tuple(shape) + (8,))
+        out[..., k] = 1.0
+        return cls(out)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.data.shape[:-1]
+
+    def __getitem__(self, index) -> "OctonionArray":
+        if not isinstance(index, tuple):
+            index = (index,)
+        return OctonionArray(self.data[index + (slice(None),)])
+
+    def __repr__(self) -> str:
+        return f"OctonionArray(shape={self.shape})"
+
+    def __add__(self, other) -> "OctonionArray":
+        if isinstance(other, OctonionArray):
+            return OctonionArray(self.data + other.data)
+        return NotImplemented
+
+    def __sub__(self, other) -> "OctonionArray":
+        if isinstance(other, OctonionArray):
+            return OctonionArray(self.data - other.data)
+        return NotImplemented
+
+    def __neg__(self) -> "OctonionArray":
+        return OctonionArray(-self.data)
+
+    def __mul__(self, other) -> "OctonionArray":
+        if isinstance(other, OctonionArray):
+            return OctonionArray(np.einsum("...i,...j,ijk->...k",
+                                           self.data, other.data, OCTONION_TENSOR))
+        return OctonionArray(self.data * np.asarray(other)[..., None])
+
+    def __rmul__(self, other) -> "OctonionArray":
+        return OctonionArray(self.data * np.asarray(other)[..., None])
+
+    def conjugate(self) -> "OctonionArray":
+        """x̃ = x₀e₀ − Σ xᵢeᵢ (coefficients not conjugated)."""
+        out = -self.data
+        out[..., 0] = self.data[..., 0]
+        return OctonionArray(out)
+
+    def norm_sq(self) -> np.ndarray:
+        """Σ |xᵢ|² (real, ≥ 0)."""
+        return np.sum(np.abs(self.data) ** 2, axis=-1)
+
+    def allclose(self, other: "OctonionArray", **kwargs) -> bool:
+        return bool(np.allclose(self.data, other.data, **kwargs))
+
+
+def associator(x, y, z):
+    """(x·y)·z − x·(y·z) for BiquaternionArray or OctonionArray batches."""
+    return (x * y) * z - x * (y * z)
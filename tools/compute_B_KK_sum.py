@@ -61,6 +61,11 @@ import sys
 import numpy as np
 from scipy import integrate
 
+try:
+    from tools.prime_switching import optimal_prime
+except ImportError:  # run as a script: tools/ is sys.path[0]
+    from prime_switching import optimal_prime
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Global parameters  [POSTULATE — R_psi = 1 in natural units]
 # ─────────────────────────────────────────────────────────────────────────────
@@ -137,15 +142,132 @@ def S_KK(N_eff: int, K_max: int = 100) -> float:
     return (N_eff * total) / (3.0 * math.pi)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Quadrature-free KK sum  [DERIVED — series of the Feynman-parameter integral]
+# ─────────────────────────────────────────────────────────────────────────────
+#
+# With u = z(1−z) ≤ 1/4 and ln(1+x) = Σ (−1)^{n+1} xⁿ/n,
+#
+#     S_k = Σ_{n≥1} c_n k^{−2n},   c_n = (−1)^{n+1} B(n+2, n+2) / n,
+#
+# since ∫₀¹ (z(1−z))^m dz = B(m+1, m+1) = (m!)²/(2m+1)!.  Summed over
+# K0 < k ≤ K_max this gives Σ_n c_n [ζ(2n, K0+1) − ζ(2n, K_max+1)], so any
+# K_max (including ∞) costs O(1).  The first K0 modes, where the series is
+# slowest (x ≤ 1/4 at k = 1), use Gauss–Legendre nodes shared across k.
+
+_KK_DIRECT_MODES = 16      # k ≤ K0 summed by Gauss–Legendre
+_KK_GL_NODES = 24          # nodes per mode (error ~ 4.2^{-48} at k = 1)
+_KK_SERIES_TERMS = 12      # c_n terms for k > K0 (ratio ≲ 1/(4·17²))
+_EM_DIRECT_TERMS = 8       # Euler–Maclaurin: explicit terms before the tail
+# Bernoulli numbers B_2 .. B_14 for the Euler–Maclaurin corrections
+_BERNOULLI_2J = (1.0 / 6.0, -1.0 / 30.0, 1.0 / 42.0, -1.0 / 30.0,
+                 5.0 / 66.0, -691.0 / 2730.0, 7.0 / 6.0)
+
+
+def _gauss_legendre_01(n_nodes: int):
+    """Gauss–Legendre nodes and weights on [0, 1]."""
+    x, w = np.polynomial.legendre.leggauss(n_nodes)
+    return 0.5 * (x + 1.0), 0.5 * w
+
+
+def _S_modes_gl(k, n_nodes: int = _KK_GL_NODES) -> np.ndarray:
+    """S_k for an array of mode numbers k (k = 0 gives 0), one matrix product."""
+    k = np.asarray(k, dtype=float)
+    z, w = _gauss_legendre_01(n_nodes)
+    u = z * (1.0 - z)
+    inv_k2 = np.divide(1.0, k * k, out=np.zeros_like(k), where=(k != 0))
+    return (u * np.log1p(inv_k2[..., None] * u)) @ w
+
+
+def _series_coefficients(n_terms: int) -> list:
+    """c_n = (−1)^{n+1} B(n+2, n+2)/n for n = 1..n_terms."""
+    coeffs = []
+    for n in range(1, n_terms + 1):
+        m = n + 1
+        beta = math.factorial(m) ** 2 / math.factorial(2 * m + 1)
+        coeffs.append((-1) ** (n + 1) * beta / n)
+    return coeffs
+
+
+def _hurwitz_zeta(s: int, a: float):
+    """ζ(s, a) = Σ_{j≥0} (a+j)^{−s} for integer s ≥ 2, a ≥ 1 (Euler–Maclaurin).
+
+    Returns (value, error estimate); the error estimate is the size of the
+    last correction term kept.
+    """
+    total = 0.0
+    for j in range(_EM_DIRECT_TERMS):
+        total += (a + j) ** (-s)
+    b = a + _EM_DIRECT_TERMS
+    total += b ** (1 - s) / (s - 1) + 0.5 * b ** (-s)
+    rising = float(s)                     # s(s+1)···(s+2j−2)
+    term = 0.0
+    for j, B2j in enumerate(_BERNOULLI_2J, start=1):
+        term = B2j / math.factorial(2 * j) * rising * b ** (-s - 2 * j + 1)
+        total += term
+        rising *= (s + 2 * j - 1) * (s + 2 * j)
+    return total, abs(term)
+
+
+def kk_mode_sum(K_max=100):
+    """Σ_{0<|k|≤K_max} S_k without adaptive quadrature.
+
+    K_max may be None (or math.inf) for the full tower k ∈ ℤ\\{0}.
+
+    Returns (value, error estimate).  The estimate adds the Gauss–Legendre
+    error (difference to a rule with twice the nodes), the first omitted
+    series term and the Euler–Maclaurin remainders.   [DERIVED — numerical]
+    """
+    infinite = K_max is None or math.isinf(K_max)
+    K0 = _KK_DIRECT_MODES if infinite else min(int(K_max), _KK_DIRECT_MODES)
+
+    k = np.arange(1, K0 + 1)
+    direct = _S_modes_gl(k)
+    value = float(direct.sum())
+    err = abs(value - float(_S_modes_gl(k, 2 * _KK_GL_NODES).sum()))
+
+    if infinite or K_max > K0:
+        coeffs = _series_coefficients(_KK_SERIES_TERMS + 1)
+        for n, c in enumerate(coeffs, start=1):
+            zeta_lo, e_lo = _hurwitz_zeta(2 * n, K0 + 1.0)
+            zeta_hi, e_hi = (0.0, 0.0) if infinite else _hurwitz_zeta(2 * n, K_max + 1.0)
+            if n > _KK_SERIES_TERMS:      # first omitted term bounds the rest
+                err += abs(c) * zeta_lo
+                break
+            value += c * (zeta_lo - zeta_hi)
+            err += abs(c) * (e_lo + e_hi)
+
+    # ±k contribute equally
+    return 2.0 * value, 2.0 * err
+
+
+def S_KK_fast(N_eff, K_max=100, return_error: bool = False):
+    """Quadrature-free S_KK(N_eff, K_max); K_max=None gives K_max → ∞.
+
+    Agrees with S_KK to ~1e-15 at O(1) cost in K_max.  N_eff may be an
+    array (S_KK is linear in N_eff), so B(N_eff) scans need one mode sum.
+    With return_error=True returns (S, error estimate).
+
+    [SKETCH — same mode sum as S_KK; numerical method DERIVED]
+    """
+    total, err = kk_mode_sum(K_max)
+    scale = np.asarray(N_eff, dtype=float) / (3.0 * math.pi)
+    S, S_err = scale * total, np.abs(scale) * err
+    if scale.ndim == 0:
+        S, S_err = float(S), float(S_err)
+    return (S, S_err) if return_error else S
+
+
 def convergence_check(N_eff: int = 12) -> None:
     """Check convergence of S_KK(N_eff, K_max) as K_max increases."""
     print("  Convergence check (N_eff=12):")
-    print(f"  {'K_max':>8}  {'S_KK':>12}  {'B_flat':>12}  {'ratio':>10}")
+    print(f"  {'K_max':>8}  {'S_KK':>12}  {'B_flat':>12}  {'ratio':>10}  {'error':>9}")
     B0 = B_flat(N_eff)
-    for K_max in [5, 10, 20, 50, 100]:
-        S = S_KK(N_eff, K_max=K_max)
+    for K_max in [5, 10, 20, 50, 100, None]:
+        S, err = S_KK_fast(N_eff, K_max=K_max, return_error=True)
         ratio = S / B0 if B0 > 0 else float("nan")
-        print(f"  {K_max:>8}  {S:>12.5f}  {B0:>12.5f}  {ratio:>10.5f}")
+        label = "∞" if K_max is None else K_max
+        print(f"  {label:>8}  {S:>12.5f}  {B0:>12.5f}  {ratio:>10.5f}  {err:>9.1e}")
     print()
 
 
@@ -176,7 +298,7 @@ def method1_KK_sum() -> None:
 
     matches = []
     for N_eff in N_EFF_VALUES:
-        S = S_KK(N_eff, K_max=100)
+        S = S_KK_fast(N_eff, K_max=100)
         B0 = B_flat(N_eff)
         ratio = S / B0 if B0 > 0 else float("nan")
         expected_ratio = N_eff ** 0.5 / (2.0 * math.pi / 3.0)
@@ -193,7 +315,7 @@ def method1_KK_sum() -> None:
         print("  → B_base = N_eff^{3/2} is derived from the compact KK mode sum.")
         verdict = "DERIVED"
     else:
-        S12 = S_KK(12, K_max=100)
+        S12 = S_KK_fast(12, K_max=100)
         B0_12 = B_flat(12)
         actual_ratio = S12 / B0_12
         required_ratio = 12 ** 0.5 / (2.0 * math.pi / 3.0)
@@ -407,7 +529,7 @@ def final_summary(v1: str, v2: str, v3: str) -> None:
         print()
 
         # Report actual values
-        S12 = S_KK(12, K_max=100)
+        S12 = S_KK_fast(12, K_max=100)
         B0_12 = B_flat(12)
         Bz12 = B_zeta(12)
         B_req = 12.0 ** 1.5
@@ -437,32 +559,8 @@ def final_summary(v1: str, v2: str, v3: str) -> None:
 
 def _n_star(B_test: float) -> int:
     """Return the prime minimizing V_eff(n) = n² - B_test·n·ln(n)."""
-    # Use the same prime sieve and V_eff computation as validate_B_coefficient.py
-    primes = _sieve(600)
-
-    def v_eff(n):
-        if n <= 1:
-            return float("inf")
-        return n * n - B_test * n * math.log(n)
-
-    best_p = primes[0]
-    best_v = v_eff(best_p)
-    for p in primes:
-        v = v_eff(p)
-        if v < best_v:
-            best_v = v
-            best_p = p
-    return best_p
-
-
-def _sieve(n: int):
-    is_prime = [True] * (n + 1)
-    is_prime[0] = is_prime[1] = False
-    for i in range(2, int(n ** 0.5) + 1):
-        if is_prime[i]:
-            for j in range(i * i, n + 1, i):
-                is_prime[j] = False
-    return [i for i in range(2, n + 1) if is_prime[i]]
+    # Same prime range (p ≤ 600) as validate_B_coefficient.py
+    return optimal_prime(1.0, B_test, 2, 600)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -57,12 +57,18 @@ from typing import Tuple
 
 import numpy as np
 
+try:
+    from tools.biquaternion_array import BiquaternionArray
+except ImportError:  # run as a script: tools/ is sys.path[0]
+    from biquaternion_array import BiquaternionArray
+
 
 ALPHA_0: float = 1.0 / 137.035999177  # CODATA 2022 fine structure constant
 
 # A biquaternion Θ = (a, b, c, d) with a,b,c,d ∈ ℂ represents:
 #   Θ = a·1 + b·i_q + c·j_q + d·k_q
 # where i_q, j_q, k_q are the quaternionic basis elements.
+# Grids of Θ values are handled as BiquaternionArray ((..., 4) complex128).
 Biquaternion = Tuple[complex, complex, complex, complex]
 
 
@@ -177,33 +183,40 @@ def compute_gauge_potential_components(
     Classification: [SKETCH — gauge connection formula is a sketch;
     full derivation from canonical/interactions/qed.tex is pending]
     """
-    phase0 = np.exp(1j * psi / R_psi)
-    phase1 = np.exp(2j * psi / R_psi)
+    A_R, A_I = compute_gauge_potential_grid(theta0, theta1, R_psi, psi)
+    return float(A_R), float(A_I)
 
-    a0, b0, c0, d0 = theta0
-    a1, b1, c1, d1 = theta1
 
-    # Θ(ψ) — field at this ψ value
-    theta_val: Biquaternion = (
-        a0 * phase0 + a1 * phase1,
-        b0 * phase0 + b1 * phase1,
-        c0 * phase0 + c1 * phase1,
-        d0 * phase0 + d1 * phase1,
-    )
+def compute_gauge_potential_grid(
+    theta0,
+    theta1,
+    R_psi: float,
+    psi: "np.ndarray",
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    (A_R, A_I) of 𝒜_ψ = Sc(Θ†·∂_ψΘ)/|Θ|² on a whole ψ grid.   [SKETCH]
 
-    # ∂_ψΘ
-    dtheta_dpsi: Biquaternion = (
-        (1j / R_psi) * a0 * phase0 + (2j / R_psi) * a1 * phase1,
-        (1j / R_psi) * b0 * phase0 + (2j / R_psi) * b1 * phase1,
-        (1j / R_psi) * c0 * phase0 + (2j / R_psi) * c1 * phase1,
-        (1j / R_psi) * d0 * phase0 + (2j / R_psi) * d1 * phase1,
-    )
+    theta0 / theta1 may be single biquaternions (tuples) or BiquaternionArrays
+    of mode pairs; their batch shape broadcasts against psi, so a (m, 1) batch
+    of modes and an (n,) ψ grid give (m, n) results.  Points with |Θ|² < 1e-30
+    give (0, 0) as in the scalar formula.
+    """
+    theta0 = BiquaternionArray(getattr(theta0, "data", theta0))
+    theta1 = BiquaternionArray(getattr(theta1, "data", theta1))
+    psi = np.asarray(psi, dtype=float)
+    phase0 = np.exp(1j * psi / R_psi)
+    phase1 = np.exp(2j * psi / R_psi)
+
+    # Θ(ψ) and ∂_ψΘ
+    theta_val = theta0 * phase0 + theta1 * phase1
+    dtheta_dpsi = theta0 * ((1j / R_psi) * phase0) + theta1 * ((2j / R_psi) * phase1)
 
     # 𝒜_ψ = Sc(Θ†·∂_ψΘ) / |Θ|²  [SKETCH]
-    norm_sq = bq_norm_sq(theta_val)
-    if norm_sq < 1e-30:
-        return 0.0, 0.0
-    A_psi = bq_sc_hermitian(theta_val, dtheta_dpsi) / norm_sq
+    norm_sq = theta_val.norm_sq()
+    regular = norm_sq >= 1e-30
+    A_psi = np.where(regular,
+                     theta_val.sc_hermitian(dtheta_dpsi) / np.where(regular, norm_sq, 1.0),
+                     0.0)
     return A_psi.real, A_psi.imag
 
 
@@ -221,14 +234,7 @@ def compute_r_rho(
     Classification: [DERIVED — numerical; gauge potential formula is SKETCH]
     """
     psi_vals = np.linspace(0.0, 2.0 * math.pi, n_samples, endpoint=False)
-    A_R_vals = []
-    A_I_vals = []
-    for ps in psi_vals:
-        ar, ai = compute_gauge_potential_components(theta0, theta1, R_psi, ps)
-        A_R_vals.append(ar)
-        A_I_vals.append(ai)
-    A_R = np.array(A_R_vals)
-    A_I = np.array(A_I_vals)
+    A_R, A_I = compute_gauge_potential_grid(theta0, theta1, R_psi, psi_vals)
 
     norm_R = math.sqrt(float(np.mean(A_R**2)))
     norm_I = math.sqrt(float(np.mean(A_I**2)))
@@ -364,6 +370,211 @@ def canonical_example() -> VacuumResult:
     return compute_vacuum(theta0, theta1, R_psi=1.0)
 
 
+# ---------------------------------------------------------------------------
+# Grid scan over vacuum parameters
+# ---------------------------------------------------------------------------
+
+#: One row of a vacuum scan: the scalar fields of VacuumResult for one grid
+#: point, keyed by its flat (C-order) index into the parameter grid.
+SCAN_DTYPE = np.dtype([
+    ("index", np.int64),
+    ("R_psi", np.float64),
+    ("sc_re", np.float64),
+    ("sc_im", np.float64),
+    ("h_max", np.float64),
+    ("g_max", np.float64),
+    ("r", np.float64),
+    ("rho", np.float64),
+    ("dalpha_dphi", np.float64),
+    ("phi_is_physical", np.bool_),
+])
+
+_SCAN_CSV_FMT = ["%d"] + ["%.17g"] * 8 + ["%d"]
+
+
+def _scan_block(
+    theta0: "np.ndarray",
+    theta1: "np.ndarray",
+    R_psi: "np.ndarray",
+    n_psi: int,
+    n_samples: int,
+) -> "np.ndarray":
+    """
+    Vacuum diagnostics for m configurations at once.
+
+    theta0 / theta1 are (m, 4) complex, R_psi is (m,).  Each row of the
+    result equals the corresponding compute_vacuum() output (index left 0).
+    """
+    theta0 = BiquaternionArray(theta0)
+    theta1 = BiquaternionArray(theta1)
+    R = R_psi[:, None]
+
+    sc01 = theta0.sc_hermitian(theta1)
+    N0 = theta0.norm_sq()
+    N1 = theta1.norm_sq()
+
+    # Metric block on the ψ grid (rows: configurations)
+    psi = np.linspace(0.0, 2.0 * math.pi, n_psi, endpoint=False)
+    h_vals = (2.0 / R**2) * np.sin(psi / R) * sc01.imag[:, None]
+    g_vals = (1.0 / R**2) * ((N0 + 4.0 * N1)[:, None]
+                             + 2.0 * np.cos(psi / R) * sc01.real[:, None])
+
+    # r and ρ, same thresholds as compute_r_rho
+    psi_r = np.linspace(0.0, 2.0 * math.pi, n_samples, endpoint=False)
+    A_R, A_I = compute_gauge_potential_grid(theta0[:, None], theta1[:, None], R, psi_r)
+    norm_R = np.sqrt(np.mean(A_R**2, axis=-1))
+    norm_I = np.sqrt(np.mean(A_I**2, axis=-1))
+    cross = np.mean(A_R * A_I, axis=-1)
+    denom = norm_R * norm_I
+    live = norm_R >= 1e-12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.where(live, norm_I / norm_R, 0.0)
+        rho = np.where(live & (denom > 1e-12), cross / denom, 0.0)
+
+    table = np.zeros(len(R_psi), dtype=SCAN_DTYPE)
+    table["R_psi"] = R_psi
+    table["sc_re"] = sc01.real
+    table["sc_im"] = sc01.imag
+    table["h_max"] = np.max(np.abs(h_vals), axis=-1)
+    table["g_max"] = np.max(np.abs(g_vals), axis=-1)
+    table["r"] = r
+    table["rho"] = rho
+    table["dalpha_dphi"] = 2.0 * rho * r * ALPHA_0
+    table["phi_is_physical"] = r > 1e-12
+    return table
+
+
+def _scan_task(args) -> "np.ndarray":
+    """Process-pool entry point: (start, theta0, theta1, R_psi, n_psi, n_samples)."""
+    start, theta0, theta1, R_psi, n_psi, n_samples = args
+    table = _scan_block(theta0, theta1, R_psi, n_psi, n_samples)
+    table["index"] = np.arange(start, start + len(table))
+    return table
+
+
+def _broadcast_scan_inputs(theta0, theta1, R_psi):
+    """Broadcast mode arrays and radii to a common grid; return flat views."""
+    t0 = np.asarray(getattr(theta0, "data", theta0), dtype=complex)
+    t1 = np.asarray(getattr(theta1, "data", theta1), dtype=complex)
+    R = np.asarray(R_psi, dtype=float)
+    if t0.shape[-1:] != (4,) or t1.shape[-1:] != (4,):
+        raise ValueError("theta0 and theta1 must have a trailing axis of length 4")
+    grid_shape = np.broadcast_shapes(t0.shape[:-1], t1.shape[:-1], R.shape)
+    t0 = np.broadcast_to(t0, grid_shape + (4,)).reshape(-1, 4)
+    t1 = np.broadcast_to(t1, grid_shape + (4,)).reshape(-1, 4)
+    R = np.broadcast_to(R, grid_shape).reshape(-1)
+    return grid_shape, t0, t1, R
+
+
+def iter_vacuum_scan(
+    theta0,
+    theta1,
+    R_psi,
+    n_psi: int = 500,
+    n_samples: int = 50,
+    chunk_size: int = 2048,
+    workers: int | None = None,
+):
+    """
+    Evaluate compute_vacuum over a parameter grid, yielding table chunks.
+
+    theta0 / theta1 are BiquaternionArrays or (..., 4) complex arrays and
+    R_psi a scalar or array; their grid shapes broadcast together.  The
+    flattened grid is processed chunk_size configurations at a time and each
+    chunk is yielded, in order, as a SCAN_DTYPE record array whose "index"
+    field is the flat index into the broadcast grid.
+
+    workers > 1 distributes the chunks over a process pool (at most
+    2·workers chunks in flight); otherwise everything runs in-process.
+
+    Classification: [DERIVED — numerical; gauge potential formula is SKETCH]
+    """
+    _, t0, t1, R = _broadcast_scan_inputs(theta0, theta1, R_psi)
+    tasks = ((start, t0[start:start + chunk_size], t1[start:start + chunk_size],
+              R[start:start + chunk_size], n_psi, n_samples)
+             for start in range(0, len(R), chunk_size))
+
+    if not workers or workers <= 1:
+        for task in tasks:
+            yield _scan_task(task)
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(_scan_task, task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def scan_vacuum_grid(
+    theta0,
+    theta1,
+    R_psi,
+    n_psi: int = 500,
+    n_samples: int = 50,
+    chunk_size: int = 2048,
+    workers: int | None = None,
+) -> "np.ndarray":
+    """
+    Vacuum diagnostics for every point of a parameter grid.   [DERIVED]
+
+    Returns a SCAN_DTYPE record array shaped like the broadcast grid, e.g.
+    theta1 of shape (n_phase, 1, 4) and R_psi of shape (n_R,) give an
+    (n_phase, n_R) table with table["r"][i, j] = compute_vacuum(...).r.
+    See iter_vacuum_scan for the arguments.
+    """
+    grid_shape = _broadcast_scan_inputs(theta0, theta1, R_psi)[0]
+    chunks = list(iter_vacuum_scan(theta0, theta1, R_psi, n_psi=n_psi,
+                                   n_samples=n_samples, chunk_size=chunk_size,
+                                   workers=workers))
+    if not chunks:
+        return np.zeros(grid_shape, dtype=SCAN_DTYPE)
+    return np.concatenate(chunks).reshape(grid_shape)
+
+
+def write_vacuum_scan(
+    fname: str,
+    theta0,
+    theta1,
+    R_psi,
+    **kwargs,
+) -> int:
+    """
+    Stream a vacuum scan to a CSV table, one chunk at a time.
+
+    Columns are the SCAN_DTYPE fields; the whole grid is never held in
+    memory.  Keyword arguments go to iter_vacuum_scan.  Returns the number
+    of rows written.
+    """
+    n_rows = 0
+    with open(fname, "w", encoding="utf-8") as fh:
+        fh.write(",".join(SCAN_DTYPE.names) + "\n")
+        for chunk in iter_vacuum_scan(theta0, theta1, R_psi, **kwargs):
+            np.savetxt(fh, chunk, fmt=_SCAN_CSV_FMT, delimiter=",")
+            n_rows += len(chunk)
+    return n_rows
+
+
+def phase_scan_modes(n_phase: int) -> Tuple[BiquaternionArray, BiquaternionArray]:
+    """
+    Canonical modes with the j-component of Θ₁ rotated through e^{iφ}.
+
+    Θ₀ = (1+i_c, 0, 0, 0),  Θ₁(φ) = (1, 0, e^{iφ}, 0),  φ ∈ [0, 2π);
+    φ = π/2 is canonical_example().  Θ₁ has batch shape (n_phase, 1) so it
+    broadcasts against a 1-D R_ψ grid.   [POSTULATE — scan family]
+    """
+    phi = np.linspace(0.0, 2.0 * math.pi, n_phase, endpoint=False)
+    theta0 = BiquaternionArray.from_components(1.0 + 1j, 0.0, 0.0, 0.0)
+    theta1 = BiquaternionArray.from_components(1.0, 0.0, np.exp(1j * phi), 0.0)
+    return theta0, theta1[:, None]
+
+
 # ---------------------------------------------------------------------------
 # Reporting
 # ---------------------------------------------------------------------------
@@ -458,7 +669,33 @@ def try_plot(res: VacuumResult, fname: str = "/tmp/h_psi_psi_vacuum.png") -> Non
 # Entry point
 # ---------------------------------------------------------------------------
 
+def run_scan_cli(argv) -> int:
+    """--scan mode: φ-phase × R_ψ scan of phase_scan_modes, streamed to CSV."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Grid scan of the two-mode vacuum")
+    parser.add_argument("--scan", action="store_true")
+    parser.add_argument("--n-phase", type=int, default=64)
+    parser.add_argument("--r-min", type=float, default=0.5)
+    parser.add_argument("--r-max", type=float, default=2.0)
+    parser.add_argument("--n-radius", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default="/tmp/h_munu_vacuum_scan.csv")
+    args = parser.parse_args(argv)
+
+    theta0, theta1 = phase_scan_modes(args.n_phase)
+    R_grid = np.linspace(args.r_min, args.r_max, args.n_radius)
+    n_rows = write_vacuum_scan(args.out, theta0, theta1, R_grid, workers=args.workers)
+    print(f"  Vacuum scan: {args.n_phase} phases × {args.n_radius} radii "
+          f"= {n_rows} configurations   [DERIVED]")
+    print(f"  Table saved: {args.out}")
+    return 0
+
+
 if __name__ == "__main__":
+    if "--scan" in sys.argv[1:]:
+        sys.exit(run_scan_cli(sys.argv[1:]))
+
     print()
     print("Step 1 — Single-mode winding: h_ψψ = 0   [DEAD END — documented]")
     print("-" * 70)
@@ -0,0 +1,303 @@
+# Copyright (c) 2025 Ing. David Jaroš
+# Licensed under the MIT License
+# See LICENSE file in the repository root for full license text
+"""
+prime_switching.py — Analytic switching-boundary table for prime selection.
+
+PURPOSE
+-------
+Several scripts answer the same question by brute force:
+
+    which prime p minimises V_eff(p) = A·p² − B·p·ln(p) ?
+
+  - experiments/layer2_stability/layer2_rigidity.optimal_prime
+  - experiments/constants_derivation/derive_fine_structure.find_optimal_prime
+  - experiments/validation/validate_B_coefficient.prime_minimum
+  - tools/compute_B_KK_sum._n_star
+  - ubt_with_chronofactor emergent_alpha_calculator.find_optimal_winding_number
+
+This module replaces the scans with a precomputed index of switching
+thresholds in β = B/A.
+
+DERIVATION
+----------
+For A > 0, minimising V_eff is equivalent to minimising
+
+    V_p(β) = p² − β·p·ln(p),
+
+a straight line in β with intercept p² and slope −p·ln(p).  The optimal
+prime is the line on the lower envelope.  The points (p·ln p, p²) lie on a
+strictly convex curve, so every prime owns exactly one β-interval and two
+consecutive primes p < q swap optimality at
+
+    β*(p, q) = (q² − p²) / (q·ln q − p·ln p).
+
+The thresholds are strictly increasing, so the optimal prime for a given β
+is found by a binary search.  On ties (β exactly on a threshold) the smaller
+prime is returned, matching min() over an ascending candidate list.
+
+Because the thresholds depend only on consecutive pairs, the optimum over a
+contiguous prime range [p_min, p_max] is the global optimum clamped to the
+range.
+
+For A ≤ 0 the problem is a maximisation of a convex function of p·ln(p), so
+the optimum is always one of the two endpoints of the range.
+
+CACHE
+-----
+The table for primes up to PRIME_LIMIT = 10⁶ (78 498 primes) is built on
+first use and stored as a small .npz file (default:
+~/.cache/ubt/prime_switching_<limit>.npz, override with the environment
+variable UBT_PRIME_SWITCHING_CACHE).  Later processes load the file instead
+of re-sieving.  A missing or stale cache is rebuilt silently.
+
+NO CIRCULARITY: the table is a pure function of the primes; no target prime
+is used anywhere.
+
+USAGE
+-----
+    from tools.prime_switching import optimal_prime
+    p = optimal_prime(A=1.0, B=46.3, p_min=50, p_max=300)
+
+    python tools/prime_switching.py --A 1.0 --B 46.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Configuration
+# ─────────────────────────────────────────────────────────────────────────────
+
+PRIME_LIMIT = 1_000_000
+
+#: Bump when the on-disk layout or the threshold formula changes.
+CACHE_FORMAT_VERSION = 1
+
+CACHE_ENV_VAR = "UBT_PRIME_SWITCHING_CACHE"
+
+
+def default_cache_path(limit: int = PRIME_LIMIT) -> Path:
+    """Return the cache file location for a table covering primes ≤ limit."""
+    override = os.environ.get(CACHE_ENV_VAR)
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "ubt" / f"prime_switching_{limit}.npz"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Table construction
+# ─────────────────────────────────────────────────────────────────────────────
+
+def sieve_primes_array(limit: int) -> np.ndarray:
+    """Return all primes ≤ limit as an int64 array (Sieve of Eratosthenes)."""
+    if limit < 2:
+        return np.zeros(0, dtype=np.int64)
+    is_prime = np.ones(limit + 1, dtype=bool)
+    is_prime[:2] = False
+    for i in range(2, math.isqrt(limit) + 1):
+        if is_prime[i]:
+            is_prime[i * i :: i] = False
+    return np.flatnonzero(is_prime).astype(np.int64)
+
+
+def switching_thresholds(primes: np.ndarray) -> np.ndarray:
+    """Return β*(p_i, p_{i+1}) for consecutive entries of a sorted prime array.
+
+    The denominator q·ln q − p·ln p is evaluated as
+    (q − p)·ln q + p·log1p((q − p)/p) to avoid cancellation for large p.
+    """
+    p = primes[:-1].astype(np.float64)
+    q = primes[1:].astype(np.float64)
+    gap = q - p
+    numerator = gap * (q + p)
+    denominator = gap * np.log(q) + p * np.log1p(gap / p)
+    return numerator / denominator
+
+
+class PrimeSwitchingIndex:
+    """Sorted primes plus the β = B/A thresholds where consecutive primes swap.
+
+    Attributes:
+        primes: Ascending int64 array of primes ≤ limit.
+        thresholds: Float64 array, thresholds[i] = β*(primes[i], primes[i+1]).
+        limit: Largest integer covered by the table.
+    """
+
+    def __init__(self, primes: np.ndarray, thresholds: np.ndarray, limit: int):
+        if len(primes) == 0:
+            raise ValueError("PrimeSwitchingIndex requires at least one prime")
+        if len(thresholds) != len(primes) - 1:
+            raise ValueError("thresholds must have exactly len(primes) - 1 entries")
+        self.primes = primes
+        self.thresholds = thresholds
+        self.limit = int(limit)
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def build(cls, limit: int = PRIME_LIMIT) -> "PrimeSwitchingIndex":
+        """Sieve primes ≤ limit and compute their switching thresholds."""
+        primes = sieve_primes_array(limit)
+        thresholds = switching_thresholds(primes)
+        if np.any(np.diff(thresholds) <= 0.0):
+            raise RuntimeError("switching thresholds are not strictly increasing")
+        return cls(primes, thresholds, limit)
+
+    @classmethod
+    def load(
+        cls,
+        limit: int = PRIME_LIMIT,
+        cache_path: Optional[Path] = None,
+    ) -> "PrimeSwitchingIndex":
+        """Load the table from the cache file, rebuilding it if absent or stale."""
+        path = Path(cache_path) if cache_path is not None else default_cache_path(limit)
+        if path.is_file():
+            try:
+                with np.load(path) as data:
+                    if (int(data["version"]) == CACHE_FORMAT_VERSION
+                            and int(data["limit"]) == limit):
+                        return cls(data["primes"], data["thresholds"], limit)
+            except (OSError, KeyError, ValueError):
+                pass
+        index = cls.build(limit)
+        index.save(path)
+        return index
+
+    def save(self, path: Path) -> bool:
+        """Write the table to path; return False if the location is not writable."""
+        path = Path(path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as fh:
+                np.savez(
+                    fh,
+                    version=np.int64(CACHE_FORMAT_VERSION),
+                    limit=np.int64(self.limit),
+                    primes=self.primes,
+                    thresholds=self.thresholds,
+                )
+            os.replace(tmp, path)
+        except OSError:
+            return False
+        return True
+
+    # -- queries ------------------------------------------------------------
+
+    def _range_indices(self, p_min: int, p_max: Optional[int]) -> Tuple[int, int]:
+        """Return [lo, hi] indices into self.primes for primes in [p_min, p_max]."""
+        if p_max is None:
+            p_max = self.limit
+        if p_max > self.limit:
+            raise ValueError(
+                f"p_max = {p_max} exceeds the table limit {self.limit}; "
+                "build a PrimeSwitchingIndex with a larger limit"
+            )
+        lo = int(np.searchsorted(self.primes, p_min, side="left"))
+        hi = int(np.searchsorted(self.primes, p_max, side="right")) - 1
+        if lo > hi:
+            raise ValueError(f"No primes found in range [{p_min}, {p_max}]")
+        return lo, hi
+
+    def optimal_index(
+        self, A: float, B: float, p_min: int = 2, p_max: Optional[int] = None
+    ) -> int:
+        """Return the index into self.primes of the optimal prime in [p_min, p_max]."""
+        lo, hi = self._range_indices(p_min, p_max)
+        if A > 0:
+            i = int(np.searchsorted(self.thresholds, B / A, side="left"))
+            return min(max(i, lo), hi)
+        # A ≤ 0: V_eff is a concave-down (or linear) function of p·ln p
+        p_lo, p_hi = float(self.primes[lo]), float(self.primes[hi])
+        v_lo = A * p_lo * p_lo - B * p_lo * math.log(p_lo)
+        v_hi = A * p_hi * p_hi - B * p_hi * math.log(p_hi)
+        return hi if v_hi < v_lo else lo
+
+    def optimal_prime(
+        self, A: float, B: float, p_min: int = 2, p_max: Optional[int] = None
+    ) -> int:
+        """Return the prime in [p_min, p_max] minimising A·p² − B·p·ln(p)."""
+        return int(self.primes[self.optimal_index(A, B, p_min, p_max)])
+
+    def optimal_primes(
+        self, A: float, B, p_min: int = 2, p_max: Optional[int] = None
+    ) -> np.ndarray:
+        """Vectorised optimal_prime over an array of B values (A > 0)."""
+        if A <= 0:
+            raise ValueError("optimal_primes requires A > 0")
+        lo, hi = self._range_indices(p_min, p_max)
+        beta = np.asarray(B, dtype=np.float64) / A
+        idx = np.searchsorted(self.thresholds, beta, side="left")
+        return self.primes[np.clip(idx, lo, hi)]
+
+    def beta_interval(self, p: int) -> Tuple[float, float]:
+        """Return the half-open β interval (β_lo, β_hi] on which p is optimal."""
+        i = int(np.searchsorted(self.primes, p, side="left"))
+        if i >= len(self.primes) or self.primes[i] != p:
+            raise ValueError(f"{p} is not a prime ≤ {self.limit}")
+        beta_lo = float(self.thresholds[i - 1]) if i > 0 else -math.inf
+        beta_hi = float(self.thresholds[i]) if i < len(self.thresholds) else math.inf
+        return beta_lo, beta_hi
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Lazily loaded shared index
+# ─────────────────────────────────────────────────────────────────────────────
+
+_INDEX: Optional[PrimeSwitchingIndex] = None
+
+
+def get_index() -> PrimeSwitchingIndex:
+    """Return the process-wide index for primes ≤ PRIME_LIMIT (loaded on first use)."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = PrimeSwitchingIndex.load(PRIME_LIMIT)
+    return _INDEX
+
+
+def optimal_prime(A: float, B: float, p_min: int = 2, p_max: Optional[int] = None) -> int:
+    """Return the prime in [p_min, p_max] minimising V_eff = A·p² − B·p·ln(p).
+
+    Raises ValueError if the range contains no prime or p_max > PRIME_LIMIT.
+    """
+    return get_index().optimal_prime(A, B, p_min, p_max)
+
+
+def optimal_primes(A: float, B, p_min: int = 2, p_max: Optional[int] = None) -> np.ndarray:
+    """Vectorised optimal_prime for an array of B values."""
+    return get_index().optimal_primes(A, B, p_min, p_max)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Entry point
+# ─────────────────────────────────────────────────────────────────────────────
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--A", type=float, default=1.0, help="kinetic coefficient")
+    parser.add_argument("--B", type=float, required=True, help="log coefficient")
+    parser.add_argument("--p-min", type=int, default=2)
+    parser.add_argument("--p-max", type=int, default=PRIME_LIMIT)
+    args = parser.parse_args()
+
+    index = get_index()
+    p = index.optimal_prime(args.A, args.B, args.p_min, args.p_max)
+    beta_lo, beta_hi = index.beta_interval(p)
+    print(f"β = B/A = {args.B / args.A:.6f}" if args.A else "A = 0")
+    print(f"optimal prime p* = {p}")
+    print(f"p* is optimal for β ∈ ({beta_lo:.6f}, {beta_hi:.6f}]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())